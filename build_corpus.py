@@ -0,0 +1,26 @@
+"""This script builds a seeded on-disk test corpus for reproducible large-N runs."""
+
+import argparse
+
+from utils.corpus import build_corpus
+from utils.test_case import DEFAULT_SEED, signal_builders
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-o", "--out", help="output directory of the corpus", default="corpus")
+parser.add_argument("--seed", help=f"base seed of the signals (default: {DEFAULT_SEED})", type=int, default=DEFAULT_SEED)
+parser.add_argument("-k", "--kinds", help="signal kinds to generate (default: all)", nargs="+", choices=list(signal_builders), default=None)
+parser.add_argument("--min-exp", help="smallest size as a power of 2 (default: 1)", type=int, default=1)
+parser.add_argument("--max-exp", help="largest size as a power of 2 (default: 27)", type=int, default=27)
+parser.add_argument("--overwrite", help="regenerate files that already exist", action="store_true")
+args = parser.parse_args()
+
+print(f"Building corpus in '{args.out}' (seed: {args.seed})...")
+manifest = build_corpus(
+    args.out,
+    [2**x for x in range(args.min_exp, args.max_exp + 1)],
+    kinds=args.kinds,
+    seed=args.seed,
+    overwrite=args.overwrite,
+    verbose=True,
+)
+print(f"Done: {len(manifest['entries'])} signals listed in the manifest.")
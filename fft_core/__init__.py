@@ -1,11 +1,15 @@
 """Core FFT implementation package."""
 
 import importlib
+import os
 from pathlib import Path
 
+from .manifest import load_manifest
+from .selection import register_lazy
+
 _pkg = __name__
 _dir = Path(__file__).parent
-skip_files = ["__init__.py", "__pycache__", "selection.py"]
+skip_files = ["__init__.py", "__pycache__", "selection.py", "plan.py", "convolution.py", "manifest.py", "workspace.py"]
 
 def import_files(dir: Path, base_pkg: str):
     for path in dir.iterdir():
@@ -17,6 +21,16 @@ def import_files(dir: Path, base_pkg: str):
             # Only treat subfolders with __init__.py as packages
             import_files(path, f"{base_pkg}.{path.name}")
 
-import_files(_dir, _pkg)
+def load_all():
+    """Import every implementation module now instead of on first call."""
+    import_files(_dir, _pkg)
+
+# Implementations are registered from a static scan (cached in the registry manifest)
+# and imported on first call; FFT_CORE_EAGER=1 restores importing them all up front
+for _entry in load_manifest(_dir, _pkg, skip_files):
+    register_lazy(_entry)
+
+if os.environ.get("FFT_CORE_EAGER", "") not in ("", "0"):
+    load_all()
 
-from .selection import fft_functions
\ No newline at end of file
+from .selection import fft, fft_functions
@@ -0,0 +1,291 @@
+"""Streaming FIR filtering (overlap-add / overlap-save) on top of the registered FFT implementations."""
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import numpy as np
+
+from .selection import fft_functions, ifft_functions, load_implementation
+
+METHODS = ("overlap_add", "overlap_save")
+DEFAULT_CHUNK_SIZE = 2**16
+MAX_FFT_SIZE = 2**22
+# Fixed cost of one block (Python dispatch, padding, bookkeeping) in units of butterflies,
+# so the block-size search does not pick tiny FFTs for short filters
+BLOCK_OVERHEAD = 2**14
+SPECTRUM_CACHE_SIZE = 32
+
+_spectrum_cache = OrderedDict()
+
+
+def choose_fft_size(filter_len: int, max_fft_size: int = MAX_FFT_SIZE) -> int:
+    """
+    Pick the power-of-2 FFT size with the lowest estimated cost per output sample,
+    (N log2 N + BLOCK_OVERHEAD) / (N - filter_len + 1), for N from 2 * filter_len up to `max_fft_size`.
+    """
+    nfft = 1 << max(2 * filter_len - 1, 1).bit_length()
+    best, best_cost = nfft, np.inf
+    while True:
+        cost = (nfft * np.log2(nfft) + BLOCK_OVERHEAD) / (nfft - filter_len + 1)
+        if cost < best_cost:
+            best, best_cost = nfft, cost
+        if nfft >= max_fft_size:
+            return best
+        nfft *= 2
+
+
+def _resolve_fft(fft: str | Callable) -> tuple[callable, callable]:
+    """
+    (forward, inverse) for a registered name or a forward callable.
+    Without a registered inverse of the same name, the inverse runs on the forward transform:
+    ifft(X) = conj(fft(conj(X))) / N.
+    """
+    if isinstance(fft, str):
+        forward = load_implementation(fft_functions[fft])
+        inverse = ifft_functions.get(fft)
+        if inverse is not None and inverse.norm == getattr(forward, "norm", "backward"):
+            return forward, load_implementation(inverse)
+    else:
+        forward = fft
+
+    def inverse(X: np.ndarray) -> np.ndarray:
+        return np.conj(forward(np.conj(X))) / X.shape[0]
+
+    return forward, inverse
+
+
+def _func_id(func: callable) -> str:
+    return f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+
+
+def get_filter_spectrum(h: np.ndarray, nfft: int, fft_func: callable) -> np.ndarray:
+    """
+    FFT of the zero-padded filter, cached by (filter contents, nfft, FFT implementation).
+    The returned array is read-only because it is shared.
+    """
+    h = np.ascontiguousarray(h)
+    digest = hashlib.blake2b(h.view(np.uint8).reshape(-1), digest_size=16).hexdigest()
+    key = (digest, h.dtype.str, nfft, _func_id(fft_func))
+
+    spectrum = _spectrum_cache.get(key)
+    if spectrum is not None:
+        _spectrum_cache.move_to_end(key)
+        return spectrum
+
+    padded = np.zeros(nfft, dtype=np.result_type(h.dtype, np.float64))
+    padded[:h.shape[0]] = h
+    spectrum = np.asarray(fft_func(padded))
+    spectrum.flags.writeable = False
+
+    _spectrum_cache[key] = spectrum
+    while len(_spectrum_cache) > SPECTRUM_CACHE_SIZE:
+        _spectrum_cache.popitem(last=False)
+    return spectrum
+
+
+def _read_npy_chunks(path: Path, chunk_size: int) -> Iterator[np.ndarray]:
+    # Plain reads at the file offset: pages land in the page cache, not in this process' RSS
+    with open(path, "rb") as f:
+        version = np.lib.format.read_magic(f)
+        read_header = np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+        shape, _, dtype = read_header(f)
+        if len(shape) != 1:
+            raise ValueError(f"Expected a 1-D array in {path}, got shape {shape}")
+        remaining = shape[0]
+        while remaining > 0:
+            count = min(chunk_size, remaining)
+            chunk = np.fromfile(f, dtype=dtype, count=count)
+            if chunk.shape[0] != count:
+                raise ValueError(f"{path} is truncated")
+            remaining -= count
+            yield chunk
+
+
+def iter_chunks(source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    Yield 1-D chunks of a signal source:
+    - str / Path: a 1-D `.npy` file, read `chunk_size` samples at a time
+    - np.ndarray (incl. np.memmap): consecutive slices of `chunk_size` samples
+    - any other iterable: its items as they come (any lengths)
+    """
+    if isinstance(source, (str, Path)):
+        yield from _read_npy_chunks(Path(source), chunk_size)
+    elif isinstance(source, np.ndarray):
+        for start in range(0, source.shape[0], chunk_size):
+            yield source[start:start + chunk_size]
+    else:
+        for chunk in source:
+            yield np.asarray(chunk)
+
+
+class StreamingConvolver:
+    """
+    Linear convolution of an unbounded stream with a fixed FIR filter, block by block.
+
+    The filter spectrum is computed once per (filter, FFT size, implementation) and cached.
+    Feed input with `process(chunk)` (any chunk lengths) and finish with `flush()`;
+    together they yield the `len(x) + len(h) - 1` samples of the full convolution,
+    the same as `scipy.signal.oaconvolve(x, h)`.
+
+    Parameters:
+        h (np.ndarray): Filter taps.
+        fft (str | Callable): Name in `fft_functions` or a forward FFT callable (power-of-2 sizes are used).
+        method (str): "overlap_add" or "overlap_save".
+        fft_size (int | None): FFT size (a power of 2 > len(h)). None picks it with `choose_fft_size`.
+
+    Example:
+        >>> conv = StreamingConvolver(h, fft="iterative_numba")
+        >>> for chunk in iter_chunks("signal.npy"):
+        ...     for block in conv.process(chunk): ...
+        >>> for block in conv.flush(): ...
+    """
+
+    def __init__(self, h: np.ndarray, fft: str | Callable = "iterative_numba", method: str = "overlap_add", fft_size: int | None = None):
+        if method not in METHODS:
+            raise ValueError(f"method must be one of {METHODS}, got '{method}'")
+        h = np.asarray(h)
+        if h.ndim != 1 or h.shape[0] == 0:
+            raise ValueError("h must be a non-empty 1-D array")
+
+        self.h = h
+        self.method = method
+        self.filter_len = h.shape[0]
+        self.fft_size = fft_size or choose_fft_size(self.filter_len)
+        if self.fft_size & (self.fft_size - 1) or self.fft_size <= self.filter_len:
+            raise ValueError(f"fft_size must be a power of 2 larger than len(h), got {self.fft_size}")
+        self.block_size = self.fft_size - self.filter_len + 1
+
+        self._fft, self._ifft = _resolve_fft(fft)
+        self._spectrum = get_filter_spectrum(h, self.fft_size, self._fft)
+        self._is_real = not np.iscomplexobj(h)
+        self._reset()
+
+    def _reset(self):
+        self._pending = []
+        self._pending_len = 0
+        self._samples_in = 0
+        self._samples_out = 0
+        self._complex_input = False
+        # Overlap-add: output tail not emitted yet; overlap-save: last len(h) - 1 input samples
+        self._carry = np.zeros(self.filter_len - 1, dtype=np.complex128)
+        self._frame = np.zeros(self.fft_size, dtype=np.complex128)
+
+    def _run_block(self, block: np.ndarray) -> np.ndarray:
+        """
+        Filter one block of at most `block_size` input samples and return the next `block_size` output samples.
+        """
+        M1 = self.filter_len - 1
+        n = block.shape[0]
+        frame = self._frame
+
+        if self.method == "overlap_add":
+            # Linear convolution of the zero-padded block, plus the tail left over by the previous blocks
+            frame[:n] = block
+            frame[n:] = 0
+            y = self._ifft(self._fft(frame) * self._spectrum)
+            y[:M1] += self._carry
+            self._carry = y[self.block_size:].copy()
+            return y[:self.block_size]
+
+        # Overlap-save: prepend the last len(h) - 1 input samples; the first len(h) - 1
+        # outputs of the circular convolution wrap around and are dropped
+        frame[:M1] = self._carry
+        frame[M1:M1 + n] = block
+        frame[M1 + n:] = 0
+        self._carry = frame[n:n + M1].copy()
+        y = self._ifft(self._fft(frame) * self._spectrum)
+        return y[M1:]
+
+    def _emit(self, out: np.ndarray, total: int | None = None) -> np.ndarray:
+        if total is not None:
+            out = out[:max(total - self._samples_out, 0)]
+        self._samples_out += out.shape[0]
+        return out.real.copy() if self._is_real and not self._complex_input else out
+
+    def process(self, chunk: np.ndarray) -> Iterator[np.ndarray]:
+        """
+        Buffer a chunk of input and yield every completed output block (`block_size` samples each).
+        """
+        chunk = np.asarray(chunk)
+        self._complex_input |= np.iscomplexobj(chunk)
+        self._samples_in += chunk.shape[0]
+        self._pending.append(chunk)
+        self._pending_len += chunk.shape[0]
+
+        if self._pending_len < self.block_size:
+            return
+        data = np.concatenate(self._pending) if len(self._pending) > 1 else self._pending[0]
+        start = 0
+        while data.shape[0] - start >= self.block_size:
+            yield self._emit(self._run_block(data[start:start + self.block_size]))
+            start += self.block_size
+        rest = data[start:]
+        self._pending = [rest] if rest.shape[0] else []
+        self._pending_len = rest.shape[0]
+
+    def flush(self) -> Iterator[np.ndarray]:
+        """
+        Yield the remaining output (the last partial block and the filter tail), then reset the stream.
+        """
+        total = self._samples_in + self.filter_len - 1
+        data = np.concatenate(self._pending) if self._pending else np.zeros(0)
+
+        if self.method == "overlap_add":
+            if data.shape[0]:
+                yield self._emit(self._run_block(data), total)
+            # What is left is the tail carried over from the last block
+            if self._samples_out < total:
+                yield self._emit(self._carry, total)
+        else:
+            # Overlap-save: push zero-padded blocks through until the tail is out
+            block = np.zeros(self.block_size, dtype=data.dtype)
+            block[:data.shape[0]] = data
+            while self._samples_out < total:
+                yield self._emit(self._run_block(block), total)
+                block[:] = 0
+
+        self._reset()
+
+
+def convolve_stream(source, h: np.ndarray, fft: str | Callable = "iterative_numba", method: str = "overlap_add", fft_size: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    Yield the full linear convolution of a signal source (see `iter_chunks`) with h, block by block.
+    Memory stays bounded by a few FFT frames, whatever the signal length.
+    """
+    convolver = StreamingConvolver(h, fft=fft, method=method, fft_size=fft_size)
+    for chunk in iter_chunks(source, chunk_size):
+        yield from convolver.process(chunk)
+    yield from convolver.flush()
+
+
+def convolve(source, h: np.ndarray, fft: str | Callable = "iterative_numba", method: str = "overlap_add", fft_size: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Full linear convolution of a signal source with h (same result as `scipy.signal.oaconvolve(x, h)`).
+
+    If `out` is given (e.g. a writable np.memmap of length len(x) + len(h) - 1), the blocks are written
+    into it as they are produced; otherwise they are collected into a new array.
+    """
+    blocks = convolve_stream(source, h, fft=fft, method=method, fft_size=fft_size, chunk_size=chunk_size)
+    if out is None:
+        blocks = list(blocks)
+        return np.concatenate(blocks) if blocks else np.zeros(0)
+
+    pos = 0
+    for block in blocks:
+        out[pos:pos + block.shape[0]] = block
+        pos += block.shape[0]
+    if pos != out.shape[0]:
+        raise ValueError(f"out has length {out.shape[0]}, but the convolution has {pos} samples")
+    return out
+
+
+if __name__ == "__main__":
+    from scipy.signal import oaconvolve
+
+    x = np.random.rand(10_000)
+    h = np.random.rand(101)
+    for method in METHODS:
+        y = convolve(x, h, fft=np.fft.fft, method=method, chunk_size=777)
+        print(method, np.abs(y - oaconvolve(x, h)).max())
@@ -2,7 +2,9 @@
 
 import numpy as np
 
+from fft_core.plan import FFTPlan, bit_reverse_indices, get_plan, norm_scale, register_plan_builder, result_dtype
 from fft_core.selection import register_fft
+from fft_core.workspace import get_workspace, prepare_out
 
 
 # @register_fft(name="iterative")
@@ -19,7 +21,7 @@ def fft_iterative(x: np.ndarray) -> np.ndarray:
     bits = int(np.log2(N))
     indices = np.arange(N)
     rev_indices = np.array([int(f"{i:0{bits}b}"[::-1], 2) for i in indices])
-    x = x[rev_indices].astype(np.complex128)  # ✅ This avoids the warning
+    x = x[rev_indices].astype(np.result_type(x.dtype, np.complex64))  # ✅ This avoids the warning (complex64 for single precision)
 
     # Iterative FFT
     size = 2
@@ -39,7 +41,98 @@ def fft_iterative(x: np.ndarray) -> np.ndarray:
     return x
 
 
+@register_plan_builder("radix2_numpy")
+def build_radix2_numpy(n: int, dtype: np.dtype, direction: str) -> dict:
+    """
+    Tables for the vectorized Radix-2 engine.
+
+    - perm: bit-reversal permutation as np.intp, which np.take uses without a converted copy
+    - twiddles: the stage twiddles back to back, exp(-+2j*pi*k/size) for k < size/2 at offset size/2 - 1,
+      so every stage reads a contiguous block (n - 1 entries in total)
+    """
+    if n < 1 or n & (n - 1) != 0:
+        raise ValueError("Input size must be a power of 2")
+
+    sign = -1 if direction == "forward" else 1
+    stages = [np.exp(sign * 2j * np.pi * np.arange(size // 2) / size) for size in 2 ** np.arange(1, n.bit_length())]
+    twiddles = np.concatenate(stages).astype(dtype) if stages else np.empty(0, dtype=dtype)
+    return {"perm": bit_reverse_indices(n).astype(np.intp), "twiddles": twiddles}
+
+
+def _run_vectorized(x: np.ndarray, plan: FFTPlan, out: np.ndarray | None) -> np.ndarray:
+    """
+    Radix-2 butterflies with whole-array NumPy operations, one stage at a time.
+
+    Every stage views the array as (blocks, 2, half): the two halves of all blocks are combined
+    at once, with the stage's twiddles broadcast over the blocks. The bit-reversal permutation
+    and the twiddles come from the cached plan; the twiddle products go to a pooled buffer.
+    """
+    N = plan.n
+    out = prepare_out(out, N, plan.dtype)
+    if x.dtype != plan.dtype or np.may_share_memory(x, out):
+        # In-place call (or a cast): gather from a pooled copy of the input
+        work = get_workspace(N, plan.dtype, tag="input")
+        np.copyto(work, x)
+        x = work
+    np.take(x, plan.perm, out=out, mode="wrap")  # "wrap" skips the bounds check, which buffers the whole output
+    if N == 1:
+        return out
+
+    # Size 2: the twiddle is 1
+    pairs = out.reshape(N // 2, 2)
+    a, b = pairs[:, 0], pairs[:, 1]
+    t = get_workspace(N // 2, plan.dtype, tag="iterative_numpy")
+    np.copyto(t, b)
+    np.subtract(a, t, out=b)
+    np.add(a, t, out=a)
+
+    size = 4
+    while size <= N:
+        half = size // 2
+        blocks = out.reshape(N // size, 2, half)
+        a, b = blocks[:, 0], blocks[:, 1]
+        w = plan.twiddles[half - 1:size - 1]
+        t_stage = t.reshape(N // size, half)
+        np.multiply(b, w, out=t_stage)
+        np.subtract(a, t_stage, out=b)
+        np.add(a, t_stage, out=a)
+        size *= 2
+
+    return out
+
+
+@register_fft(name="iterative_numpy")
+def fft_iterative_numpy(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Fast Fourier Transform (FFT) using the iterative Radix-2 Cooley-Tukey algorithm, vectorized with NumPy.
+    Same algorithm as `fft_iterative`, with every stage run as whole-array operations instead of Python loops,
+    so it needs nothing but NumPy (e.g. where Numba is not available).
+    """
+    N = x.shape[0]
+    if N & (N - 1) != 0:
+        raise ValueError("Input size must be a power of 2")
+
+    return _run_vectorized(x, get_plan(N, result_dtype(x), kind="radix2_numpy"), out)
+
+
+@register_fft(name="iterative_numpy", direction="inverse")
+def ifft_iterative_numpy(x: np.ndarray, norm: str = "backward", out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Inverse FFT using the vectorized iterative Radix-2 algorithm, on the cached inverse plan (conjugated twiddles).
+    """
+    N = x.shape[0]
+    if N & (N - 1) != 0:
+        raise ValueError("Input size must be a power of 2")
+
+    out = _run_vectorized(x, get_plan(N, result_dtype(x), "inverse", kind="radix2_numpy"), out)
+    scale = norm_scale(N, "inverse", norm)
+    if scale != 1:
+        out *= scale
+    return out
+
+
 if __name__ == "__main__":
     x = np.array([1, 2, 3, 4])
     print(f"Expected: {np.fft.fft(x)}")
-    print(f"Got     : {fft_iterative(x)}")
\ No newline at end of file
+    print(f"Got     : {fft_iterative(x)}")
+    print(f"Numpy   : {fft_iterative_numpy(x)}")
\ No newline at end of file
@@ -0,0 +1,245 @@
+"""Arbitrary-length FFT implementations: mixed-radix Cooley-Tukey with a Bluestein fallback."""
+
+import numpy as np
+from numba import njit
+
+from fft_core.example.fft_numba import fft_execute
+from fft_core.plan import get_plan, register_plan_builder, result_dtype
+from fft_core.selection import register_fft
+
+# Radices with hard-coded butterflies, tried in this order when factorizing
+SPECIALIZED_RADICES = (4, 2, 3, 5)
+
+
+def factorize(n: int) -> list[int]:
+    """
+    Split n into radices: 4, 2, 3, 5 first, then the remaining prime factors.
+    """
+    radices = []
+    for radix in SPECIALIZED_RADICES:
+        while n % radix == 0:
+            radices.append(radix)
+            n //= radix
+    p = 7
+    while p * p <= n:
+        while n % p == 0:
+            radices.append(p)
+            n //= p
+        p += 2
+    if n > 1:
+        radices.append(n)
+    return radices
+
+
+def digit_reverse_indices(n: int, radices: list[int]) -> np.ndarray:
+    """
+    Mixed-radix generalization of the bit-reversal permutation (gather indices).
+
+    The last radix splits the input first (x[j::r] goes to block j), then the
+    remaining radices recursively, which is the order the DIT stages combine them in.
+    """
+    indices = np.arange(n, dtype=np.int64)
+    positions = np.zeros(n, dtype=np.int64)
+    rem = indices.copy()
+    size = n
+    for radix in reversed(radices):
+        size //= radix
+        positions += (rem % radix) * size
+        rem //= radix
+
+    perm = np.empty(n, dtype=np.int64)
+    perm[positions] = indices
+    return perm
+
+
+def mixed_radix_cost(radices: list[int]) -> int:
+    # Complex multiply-adds of the DIT stages: each stage of radix r costs about N * r
+    n = int(np.prod(radices)) if radices else 1
+    return n * sum(radices)
+
+
+def bluestein_size(n: int) -> int:
+    # Smallest power of 2 that holds the linear convolution of two length-n sequences
+    return 1 << (2 * n - 2).bit_length() if n > 1 else 1
+
+
+def bluestein_cost(n: int) -> int:
+    # Two Radix-2 FFTs of size M (forward and inverse) plus the pointwise products
+    m = bluestein_size(n)
+    return 2 * m * max(m.bit_length() - 1, 1) + 3 * m
+
+
+@register_plan_builder("mixed_radix")
+def build_mixed_radix(n: int, dtype: np.dtype, direction: str) -> dict:
+    """
+    Tables for an arbitrary-length transform.
+
+    Mixed-radix plans hold "radices", "perm" (digit reversal) and "twiddles" (exp(-+2j*pi*t/n), t < n).
+    If the factorization has large primes and Bluestein is cheaper, the plan instead holds
+    "chirp" (exp(-+1j*pi*t^2/n)) and "kernel_fft" (FFT of the conjugate chirp, zero-padded to a power of 2).
+    """
+    if n < 1:
+        raise ValueError("Input size must be positive")
+
+    sign = -1 if direction == "forward" else 1
+    radices = factorize(n)
+
+    if mixed_radix_cost(radices) <= bluestein_cost(n):
+        t = np.arange(n)
+        return {
+            "radices": np.array(radices, dtype=np.int64),
+            "perm": digit_reverse_indices(n, radices),
+            "twiddles": np.exp(sign * 2j * np.pi * t / n).astype(dtype),
+        }
+
+    # Bluestein: nk = (n^2 + k^2 - (k - n)^2) / 2 turns the DFT into a convolution with a chirp
+    m = bluestein_size(n)
+    t = np.arange(n)
+    chirp = np.exp(sign * 1j * np.pi * ((t * t) % (2 * n)) / n)
+    kernel = np.zeros(m, dtype=np.complex128)
+    kernel[:n] = np.conj(chirp)
+    kernel[m - n + 1:] = np.conj(chirp[1:][::-1])
+    return {
+        "chirp": chirp.astype(dtype),
+        "kernel_fft": np.fft.fft(kernel).astype(dtype),
+    }
+
+
+@njit(fastmath=True, cache=True)
+def _mixed_radix_kernel(x: np.ndarray, perm: np.ndarray, radices: np.ndarray, twiddles: np.ndarray, sign: int, out: np.ndarray) -> np.ndarray:
+    """
+    In-place decimation-in-time stages over the digit-reversed input.
+
+    The stage of radix r combines r sub-transforms of length L into one of length L * r:
+        out[start + k + t*L] = sum_j W_r^(j*t) * W_(L*r)^(j*k) * out[start + k + j*L]
+    Radices 2, 3, 4 and 5 use hard-coded butterflies; other radices use a direct O(r^2) DFT.
+    All twiddles are read from the length-N table W_N^t.
+    """
+    N = x.shape[0]
+
+    # Copy the input in digit-reversed order
+    for i in range(N):
+        out[i] = x[perm[i]]
+
+    max_radix = 1
+    for s in range(radices.shape[0]):
+        max_radix = max(max_radix, radices[s])
+    a = np.empty(max_radix, dtype=out.dtype)
+
+    # Constants of the radix-3 and radix-5 butterflies (sign selects the direction), in the working
+    # precision: Python floats would promote complex64 butterflies to double precision
+    real = out.real.dtype.type
+    c3 = out.dtype.type(np.sin(2 * np.pi / 3) * sign * 1j)
+    c51 = real(np.cos(2 * np.pi / 5))
+    c52 = real(np.cos(4 * np.pi / 5))
+    s51 = out.dtype.type(np.sin(2 * np.pi / 5) * sign * 1j)
+    s52 = out.dtype.type(np.sin(4 * np.pi / 5) * sign * 1j)
+    j4 = out.dtype.type(sign * 1j)
+    half = real(0.5)
+
+    L = 1
+    for s in range(radices.shape[0]):
+        r = radices[s]
+        size = L * r
+        tw_stride = N // size
+        dft_stride = N // r
+
+        for start in range(0, N, size):
+            for k in range(L):
+                # Load the r inputs of this butterfly and apply the stage twiddles
+                a[0] = out[start + k]
+                for j in range(1, r):
+                    a[j] = out[start + k + j * L] * twiddles[j * k * tw_stride]
+
+                base = start + k
+                if r == 2:
+                    out[base] = a[0] + a[1]
+                    out[base + L] = a[0] - a[1]
+                elif r == 4:
+                    t0 = a[0] + a[2]
+                    t1 = a[0] - a[2]
+                    t2 = a[1] + a[3]
+                    t3 = (a[1] - a[3]) * j4
+                    out[base] = t0 + t2
+                    out[base + L] = t1 + t3
+                    out[base + 2 * L] = t0 - t2
+                    out[base + 3 * L] = t1 - t3
+                elif r == 3:
+                    t = a[1] + a[2]
+                    d = (a[1] - a[2]) * c3
+                    m = a[0] - half * t
+                    out[base] = a[0] + t
+                    out[base + L] = m + d
+                    out[base + 2 * L] = m - d
+                elif r == 5:
+                    t1 = a[1] + a[4]
+                    t2 = a[2] + a[3]
+                    d1 = a[1] - a[4]
+                    d2 = a[2] - a[3]
+                    b1 = a[0] + c51 * t1 + c52 * t2
+                    b2 = a[0] + c52 * t1 + c51 * t2
+                    e1 = s51 * d1 + s52 * d2
+                    e2 = s52 * d1 - s51 * d2
+                    out[base] = a[0] + t1 + t2
+                    out[base + L] = b1 + e1
+                    out[base + 2 * L] = b2 + e2
+                    out[base + 3 * L] = b2 - e2
+                    out[base + 4 * L] = b1 - e1
+                else:
+                    # Generic radix: direct DFT of the r twiddled inputs
+                    for q in range(r):
+                        acc = a[0]
+                        for j in range(1, r):
+                            acc += a[j] * twiddles[((j * q) % r) * dft_stride]
+                        out[base + q * L] = acc
+
+        L = size
+
+    return out
+
+
+def _bluestein(x: np.ndarray, chirp: np.ndarray, kernel_fft: np.ndarray) -> np.ndarray:
+    """
+    Bluestein's chirp-z algorithm: X[k] = chirp[k] * (a conv conj(chirp))[k] with a = x * chirp.
+    The convolution runs on the power-of-2 Radix-2 Numba engine (inverse via conjugation).
+    """
+    N = chirp.shape[0]
+    M = kernel_fft.shape[0]
+    plan = get_plan(M, kernel_fft.dtype)
+
+    a = np.zeros(M, dtype=kernel_fft.dtype)
+    a[:N] = x * chirp
+    spectrum = fft_execute(a, plan)
+    spectrum *= kernel_fft
+    np.conjugate(spectrum, out=spectrum)
+    conv = fft_execute(spectrum, plan)
+    return np.conj(conv[:N]) * (chirp / M)
+
+
+def mixed_radix_execute(x: np.ndarray, plan) -> np.ndarray:
+    """
+    Run a "mixed_radix" plan (either the mixed-radix kernel or Bluestein).
+    """
+    if "chirp" in plan.tables:
+        return _bluestein(x, plan.tables["chirp"], plan.tables["kernel_fft"])
+
+    sign = -1 if plan.direction == "forward" else 1
+    out = np.empty(plan.n, dtype=plan.dtype)
+    return _mixed_radix_kernel(x, plan.perm, plan.tables["radices"], plan.twiddles, sign, out)
+
+
+@register_fft(name="mixed_radix_numba")
+def fft_mixed_radix_numba(x: np.ndarray) -> np.ndarray:
+    """
+    Fast Fourier Transform (FFT) of any length using mixed-radix (2/3/4/5 + generic) Cooley-Tukey
+    with digit-reversal permutation, compiled with Numba.
+    Sizes with large prime factors fall back to Bluestein's algorithm on the Radix-2 engine.
+    """
+    N = x.shape[0]
+    return mixed_radix_execute(x, get_plan(N, result_dtype(x), kind="mixed_radix"))
+
+
+if __name__ == "__main__":
+    x = np.array([1, 2, 3, 4, 5, 6])
+    print(f"Expected: {np.fft.fft(x)}")
+    print(f"Got     : {fft_mixed_radix_numba(x)}")
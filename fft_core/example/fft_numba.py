@@ -1,99 +1,407 @@
 """Numba-optimized FFT implementations."""
 
+import os
+from functools import partial
+from time import perf_counter
 
 import numpy as np
-from numba import njit
+from numba import from_dtype, get_num_threads, njit, prange, set_num_threads, types
 
-from fft_core.selection import register_fft
+from fft_core.plan import FFTPlan, get_plan, norm_scale, result_dtype
+from fft_core.selection import register_batch_fft, register_fft, register_stage_profiler
+from fft_core.workspace import prepare_out
 
 
-@njit(cache=True)
-def bit_reverse_indices(n: int) -> np.ndarray:
+@njit(fastmath=True, cache=True)
+def _bit_reverse_copy(x: np.ndarray, perm: np.ndarray, out: np.ndarray):
+    """
+    Copy the input in bit-reversed order -> mimics the order of recursion.
     """
-    Compute bit-reversed indices for an array of size n.
+    for i in range(x.shape[0]):
+        out[i] = x[perm[i]]
+
 
-    The bit-reversed indices are used to reorder the array in a way that
-    mimics the order of the base-case subproblems in recursion. This
-    helps in optimizing the iterative FFT algorithm.
+@njit(fastmath=True, cache=True)
+def _bit_reverse_swap(out: np.ndarray, perm: np.ndarray):
+    """
+    Reorder `out` into bit-reversed order in place: the permutation is its own inverse,
+    so swapping every pair (i, perm[i]) once is enough.
     """
-    # Calculate the number of bits required to represent the size
-    bits = int(np.log2(n))
+    for i in range(out.shape[0]):
+        j = perm[i]
+        if i < j:
+            t = out[i]
+            out[i] = out[j]
+            out[j] = t
 
-    # Initialize the result array
-    result = np.empty(n, dtype=np.int32)
 
-    # Iterate over the array and compute the bit-reversed indices
-    for i in range(n):
-        rev = 0
+@njit(fastmath=True, cache=True)
+def _radix2_stage(out: np.ndarray, twiddles: np.ndarray, size: int, inverse: bool):
+    """
+    One in-place Radix-2 butterfly pass over `out` with blocks of `size` points.
+    """
+    N = out.shape[0]
 
-        # Iterate over the bits of the index
-        for j in range(bits):
-            # Right shift the index by j bits and take the least significant bit
-            # Left shift the least significant bit by (bits - 1 - j) bits and add to rev
-            rev |= ((i >> j) & 1) << (bits - 1 - j)
+    # Compute the half-size of the block and the twiddle stride for this stage
+    half = size // 2
+    stride = N // size
 
-        # Store the bit-reversed index
-        result[i] = rev
+    # Iterate over the blocks
+    for start in range(0, N, size):
+        # Iterate over the elements of the block
+        for k in range(half):
+            # Look up the twiddle factor
+            w = twiddles[k * stride]
+            if inverse:
+                w = w.conjugate()
+
+            # Compute the indices of the elements of the block
+            i = start + k
+            j = i + half
+
+            # Apply the Radix-2 butterfly operation
+            t = w * out[j]
+            out[j] = out[i] - t
+            out[i] = out[i] + t
 
-    return result
 
-@register_fft(name="iterative_numba")
 @njit(fastmath=True, cache=True)
-def fft_iterative_numba(x: np.ndarray) -> np.ndarray:
+def _fft_radix2_kernel(x: np.ndarray, perm: np.ndarray, twiddles: np.ndarray, out: np.ndarray, inverse: bool = False) -> np.ndarray:
+    """
+    Iterative Radix-2 butterflies using precomputed plan tables.
+
+    `perm` holds the bit-reversed gather indices and `twiddles` holds exp(-2j*pi*k/N) for k < N/2.
+    The stage with block size `size` reads every (N/size)-th twiddle.
+    With `inverse`, the forward twiddles are conjugated on the fly (unscaled inverse transform).
+    """
+    N = x.shape[0]
+
+    _bit_reverse_copy(x, perm, out)
+
+    # Initialize the size of the blocks -> base case of recursion
+    size = 2
+
+    # Iterate over the array in blocks of size 'size'
+    while size <= N:
+        _radix2_stage(out, twiddles, size, inverse)
+
+        # Double the size of the blocks -> next level of recursion
+        size *= 2
+
+    return out
+
+
+@njit(fastmath=True, cache=True)
+def _fft_radix2_inplace_kernel(out: np.ndarray, perm: np.ndarray, twiddles: np.ndarray, inverse: bool = False) -> np.ndarray:
+    """
+    In-place variant of `_fft_radix2_kernel`: the input is already in `out`, and the
+    bit-reversal is done by swaps instead of a gather into a second array.
+    """
+    N = out.shape[0]
+
+    _bit_reverse_swap(out, perm)
+
+    size = 2
+    while size <= N:
+        _radix2_stage(out, twiddles, size, inverse)
+        size *= 2
+
+    return out
+
+
+def _run_radix2(x: np.ndarray, plan: FFTPlan, out: np.ndarray | None, inverse: bool) -> np.ndarray:
+    out = prepare_out(out, plan.n, plan.dtype)
+    # `inverse` is passed explicitly so the calls match the precompiled signatures
+    if not np.may_share_memory(x, out):
+        return _fft_radix2_kernel(x, plan.perm, plan.twiddles, out, inverse)
+    if x.dtype != out.dtype or x.ctypes.data != out.ctypes.data or x.strides != out.strides:
+        raise ValueError("out must either be x itself (in-place transform) or not overlap it")
+    return _fft_radix2_inplace_kernel(out, plan.perm, plan.twiddles, inverse)
+
+
+def fft_execute(x: np.ndarray, plan: FFTPlan, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Run the Radix-2 Numba kernel with an already built plan.
+    The result is written to `out` when given (see `fft_core.workspace.prepare_out`);
+    `out=x` transforms x in place.
+    """
+    return _run_radix2(x, plan, out, False)
+
+
+def ifft_execute(x: np.ndarray, plan: FFTPlan, norm: str = "backward", out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Run the inverse Radix-2 Numba kernel with an already built forward plan
+    (same permutation and twiddle tables, conjugated in the kernel).
+    """
+    out = _run_radix2(x, plan, out, True)
+    scale = norm_scale(plan.n, "inverse", norm)
+    if scale != 1:
+        out *= scale
+    return out
+
+
+@register_fft(name="iterative_numba")
+def fft_iterative_numba(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
     """
     Fast Fourier Transform (FFT) using the iterative Radix-2 Cooley-Tukey algorithm with bit-reversal permutation.
     The bit-reversed order mimics the order of the base-case subproblems in recursion.
-    Compiled with Numba for performance optimization.
+    Compiled with Numba; the permutation and twiddle tables come from the cached per-size plan.
+    Single-precision input runs in complex64 (a separate compiled specialization).
+    Pass a preallocated `out` to skip allocating the result, or `out=x` to transform in place.
     """
     N = x.shape[0]
-    
-    # (commented out for speed)
+
     # Check if the input size is a power of 2
     if N & (N - 1) != 0:
         raise ValueError("Input size must be a power of 2")
 
-    # Compute the bit-reversed indices
-    indices = bit_reverse_indices(N)
+    return fft_execute(x, get_plan(N, result_dtype(x)), out)
 
-    # Create a copy of the input array with the bit-reversed order -> mimics the order of recursion
-    x_copy = np.empty(N, dtype=np.complex128)
-    for i in range(N):
-        x_copy[i] = x[indices[i]]
 
-    # Initialize the size of the blocks -> base case of recursion
+@register_fft(name="iterative_numba", direction="inverse")
+def ifft_iterative_numba(x: np.ndarray, norm: str = "backward", out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Inverse of `fft_iterative_numba` (scaled by 1/N, as scipy.fft.ifft).
+    Runs the same compiled kernel on the same cached forward plan, with the twiddles conjugated.
+    """
+    N = x.shape[0]
+
+    # Check if the input size is a power of 2
+    if N & (N - 1) != 0:
+        raise ValueError("Input size must be a power of 2")
+
+    return ifft_execute(x, get_plan(N, result_dtype(x)), norm, out)
+
+
+@register_stage_profiler(name="iterative_numba")
+def fft_iterative_numba_stages(x: np.ndarray) -> list[tuple[str, int, callable]]:
+    """
+    Stages of `fft_iterative_numba`: the bit-reversal copy, then one butterfly pass per block size.
+    Every stage is its own compiled call on the same buffers, so each one can be timed alone.
+    """
+    N = x.shape[0]
+
+    # Check if the input size is a power of 2
+    if N & (N - 1) != 0:
+        raise ValueError("Input size must be a power of 2")
+
+    plan = get_plan(N, result_dtype(x))
+    out = np.empty(N, dtype=plan.dtype)
+    stages = [("bit_reverse", 0, partial(_bit_reverse_copy, x, plan.perm, out))]
     size = 2
+    while size <= N:
+        stages.append((f"butterfly_{size}", size, partial(_radix2_stage, out, plan.twiddles, size, False)))
+        size *= 2
+    return stages
 
-    # Iterate over the array in blocks of size 'size'
+
+# Length of the sub-transforms that each thread finishes on its own before the
+# remaining stages are split butterfly by butterfly (2^13 complex128 = 128 KiB, fits in L2)
+DEFAULT_PARALLEL_BLOCK = 2**13
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _fft_radix2_parallel_kernel(x: np.ndarray, perm: np.ndarray, twiddles: np.ndarray, block: int, out: np.ndarray, inverse: bool = False) -> np.ndarray:
+    """
+    Multi-threaded Radix-2 butterflies using precomputed plan tables.
+
+    After the bit-reversed copy, the first log2(block) stages only mix elements within
+    each aligned block of `block` points, so the N/block sub-transforms run in parallel
+    (one thread per block, in cache). The remaining stages span blocks; their N/2
+    independent butterflies are split across threads stage by stage.
+    With `inverse`, the forward twiddles are conjugated on the fly (unscaled inverse transform).
+    """
+    N = x.shape[0]
+    block = min(block, N)
+
+    # Copy the input in bit-reversed order
+    for i in prange(N):
+        out[i] = x[perm[i]]
+
+    # Early stages: independent sub-transforms of length `block`
+    for b in prange(N // block):
+        base = b * block
+        size = 2
+        while size <= block:
+            half = size // 2
+            stride = N // size
+            for start in range(base, base + block, size):
+                for k in range(half):
+                    w = twiddles[k * stride]
+                    if inverse:
+                        w = w.conjugate()
+                    i = start + k
+                    j = i + half
+                    t = w * out[j]
+                    out[j] = out[i] - t
+                    out[i] = out[i] + t
+            size *= 2
+
+    # Late stages: butterflies across blocks, split evenly between threads
+    size = block * 2
     while size <= N:
-        # Compute the half-size of the block
         half = size // 2
+        stride = N // size
+        for m in prange(N // 2):
+            k = m & (half - 1)
+            i = (m - k) * 2 + k
+            j = i + half
+            w = twiddles[k * stride]
+            if inverse:
+                w = w.conjugate()
+            t = w * out[j]
+            out[j] = out[i] - t
+            out[i] = out[i] + t
+        size *= 2
 
-        # Compute the twiddle factor
-        angle = -2j * np.pi / size
+    return out
 
-        # Iterate over the blocks
-        for start in range(0, N, size):
-            # Iterate over the elements of the block
-            for k in range(half):
-                # Compute the twiddle factor
-                w = np.exp(angle * k)
 
-                # Compute the indices of the elements of the block
-                i = start + k
-                j = i + half
+def fft_execute_parallel(x: np.ndarray, plan: FFTPlan, block: int = DEFAULT_PARALLEL_BLOCK, inverse: bool = False, norm: str = "backward") -> np.ndarray:
+    """
+    Run the multi-threaded Radix-2 Numba kernel with an already built (forward) plan.
+    With `inverse`, the same tables give the inverse transform, scaled according to `norm`.
+    """
+    out = np.empty(plan.n, dtype=plan.dtype)
+    _fft_radix2_parallel_kernel(x, plan.perm, plan.twiddles, block, out, inverse)
+    scale = norm_scale(plan.n, "inverse" if inverse else "forward", norm)
+    if scale != 1:
+        out *= scale
+    return out
 
-                # Apply the Radix-2 butterfly operation
-                t = w * x_copy[j]
-                x_copy[j] = x_copy[i] - t
-                x_copy[i] = x_copy[i] + t
 
-        # Double the size of the blocks -> next level of recursion
-        size *= 2
+def _run_parallel(x: np.ndarray, threads: int | None, inverse: bool = False, norm: str = "backward") -> np.ndarray:
+    N = x.shape[0]
+
+    # Check if the input size is a power of 2
+    if N & (N - 1) != 0:
+        raise ValueError("Input size must be a power of 2")
+
+    plan = get_plan(N, result_dtype(x))
+    if threads is None:
+        return fft_execute_parallel(x, plan, inverse=inverse, norm=norm)
+
+    previous = get_num_threads()
+    set_num_threads(threads)
+    try:
+        return fft_execute_parallel(x, plan, inverse=inverse, norm=norm)
+    finally:
+        set_num_threads(previous)
+
+
+@register_fft(name="parallel_numba")
+def fft_parallel_numba(x: np.ndarray, threads: int | None = None) -> np.ndarray:
+    """
+    Multi-threaded version of `fft_iterative_numba` for large inputs (Numba `prange`).
+    The early stages run as independent cache-sized sub-transforms, one per thread; the
+    late stages split their butterflies across threads.
+
+    The number of threads defaults to Numba's current setting (`NUMBA_NUM_THREADS`,
+    or `numba.set_num_threads`); pass `threads` to override it for this call only.
+    """
+    return _run_parallel(x, threads)
+
+
+@register_fft(name="parallel_numba", direction="inverse")
+def ifft_parallel_numba(x: np.ndarray, threads: int | None = None, norm: str = "backward") -> np.ndarray:
+    """
+    Inverse of `fft_parallel_numba` (scaled by 1/N, as scipy.fft.ifft), on the same forward plan.
+    """
+    return _run_parallel(x, threads, inverse=True, norm=norm)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _fft_radix2_batch_kernel(x: np.ndarray, perm: np.ndarray, twiddles: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Run the Radix-2 kernel over every row of a (batch, N) block, rows spread across threads.
+    """
+    for b in prange(x.shape[0]):
+        _fft_radix2_kernel(x[b], perm, twiddles, out[b])
+    return out
+
+
+@register_batch_fft(name="iterative_numba")
+def fft_iterative_numba_batch(x: np.ndarray, axis: int = -1) -> np.ndarray:
+    """
+    Batched version of `fft_iterative_numba`: transforms every 1-D slice along `axis`.
+    The whole batch runs inside one compiled call (rows in parallel with `prange`),
+    so there is no per-frame Python dispatch.
+    """
+    x = np.asarray(x)
+    N = x.shape[axis]
+
+    # Check if the input size is a power of 2
+    if N & (N - 1) != 0:
+        raise ValueError("Input size must be a power of 2")
+
+    # Move the transform axis last and flatten the rest into one batch dimension
+    moved = np.moveaxis(x, axis, -1)
+    batch_shape = moved.shape[:-1]
+    x_2d = moved.reshape(-1, N)
+
+    plan = get_plan(N, result_dtype(x))
+    out = np.empty(x_2d.shape, dtype=plan.dtype)
+    _fft_radix2_batch_kernel(x_2d, plan.perm, plan.twiddles, out)
+
+    return np.moveaxis(out.reshape(*batch_shape, N), -1, axis)
+
+
+# Input dtype -> dtype the transform is computed in (see `result_dtype`), for the precompiled signatures
+EAGER_DTYPES = {
+    np.complex128: np.complex128,
+    np.float64: np.complex128,
+    np.complex64: np.complex64,
+    np.float32: np.complex64,
+}
+
+
+def kernel_signatures(dtypes: dict = EAGER_DTYPES) -> dict:
+    """
+    Explicit signatures of the kernels of this module, for C-contiguous inputs of the given dtypes.
+    Plans index with int32 up to 2^31 points, so only int32 permutations are listed;
+    anything else still compiles lazily on first use.
+    """
+    perm = types.Array(types.int32, 1, "C")
+    signatures = {_fft_radix2_kernel: [], _fft_radix2_inplace_kernel: [], _fft_radix2_parallel_kernel: [], _fft_radix2_batch_kernel: []}
+    for in_dtype, dtype in dtypes.items():
+        x_1d = types.Array(from_dtype(np.dtype(in_dtype)), 1, "C")
+        x_2d = types.Array(from_dtype(np.dtype(in_dtype)), 2, "C")
+        c_1d = types.Array(from_dtype(np.dtype(dtype)), 1, "C")
+        c_2d = types.Array(from_dtype(np.dtype(dtype)), 2, "C")
+        signatures[_fft_radix2_kernel].append((x_1d, perm, c_1d, c_1d, types.boolean))
+        if in_dtype == dtype:
+            signatures[_fft_radix2_inplace_kernel].append((c_1d, perm, c_1d, types.boolean))
+        signatures[_fft_radix2_parallel_kernel].append((x_1d, perm, c_1d, types.int64, c_1d, types.boolean))
+        signatures[_fft_radix2_batch_kernel].append((x_2d, perm, c_1d, c_2d))
+    return signatures
+
+
+def precompile(dtypes: dict = EAGER_DTYPES) -> dict:
+    """
+    Compile the kernels of this module now for every signature of `kernel_signatures`, instead of on first call.
+
+    With `cache=True`, each signature is loaded from the on-disk cache when it is there, and written to it
+    otherwise, so running this once at deployment prebuilds the cache. Other signatures still compile lazily.
+    Set FFT_NUMBA_EAGER=1 to run it when this module is imported.
+
+    Returns:
+        dict: kernel name -> seconds spent compiling (or loading) its signatures.
+    """
+    timings = {}
+    for kernel, signatures in kernel_signatures(dtypes).items():
+        start = perf_counter()
+        for signature in signatures:
+            kernel.compile(signature)
+        timings[kernel.__name__] = perf_counter() - start
+    return timings
+
 
-    return x_copy
+if os.environ.get("FFT_NUMBA_EAGER", "") not in ("", "0"):
+    precompile()
 
 
 if __name__ == "__main__":
     x = np.array([1, 2, 3, 4])
     print(f"Expected: {np.fft.fft(x)}")
-    print(f"Got     : {fft_iterative_numba(x)}")
\ No newline at end of file
+    print(f"Got     : {fft_iterative_numba(x)}")
+    print(f"Inverse : {ifft_iterative_numba(fft_iterative_numba(x))}")
\ No newline at end of file
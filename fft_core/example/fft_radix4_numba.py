@@ -0,0 +1,234 @@
+"""Iterative, in-place Radix-4 and Split-Radix FFT implementations compiled with Numba."""
+
+import numpy as np
+from numba import njit
+
+from fft_core.example.fft_mixed_radix import digit_reverse_indices
+from fft_core.plan import bit_reverse_indices, get_plan, register_plan_builder, result_dtype
+from fft_core.selection import register_fft
+
+
+def radix4_flops(n: int) -> float:
+    """
+    Real floating-point operations of the Radix-4 algorithm: 34 per 4-point butterfly
+    (3 complex multiplies + 8 complex adds), N/4 butterflies per stage, log4(N) stages.
+    """
+    return 4.25 * n * np.log2(n) if n > 1 else 0.0
+
+
+def split_radix_flops(n: int) -> float:
+    """
+    Real floating-point operations of the Split-Radix algorithm (Yavne): 4 N log2(N) - 6 N + 8.
+    """
+    return 4 * n * np.log2(n) - 6 * n + 8 if n > 1 else 0.0
+
+
+def _check_power_of_two(n: int):
+    if n < 1 or n & (n - 1) != 0:
+        raise ValueError("Input size must be a power of 2")
+
+
+@register_plan_builder("radix4")
+def build_radix4(n: int, dtype: np.dtype, direction: str) -> dict:
+    """
+    Tables for the iterative Radix-4 algorithm.
+
+    - perm: base-4 digit reversal (with one leading radix-2 stage if log2(n) is odd)
+    - twiddles: per stage of sub-length L, the triples W_4L^k, W_4L^2k, W_4L^3k for k < L, stored contiguously
+    """
+    _check_power_of_two(n)
+    bits = n.bit_length() - 1
+    radices = [2] * (bits % 2) + [4] * (bits // 2)
+
+    sign = -1 if direction == "forward" else 1
+    stages = []
+    L = 2 if bits % 2 else 1
+    while L < n:
+        k = np.arange(L)
+        angle = sign * 2j * np.pi * k / (4 * L)
+        stages.append(np.stack([np.exp(angle), np.exp(2 * angle), np.exp(3 * angle)], axis=1).reshape(-1))
+        L *= 4
+
+    twiddles = np.concatenate(stages) if stages else np.empty(0)
+    return {
+        "perm": digit_reverse_indices(n, radices),
+        "twiddles": twiddles.astype(dtype),
+    }
+
+
+@register_plan_builder("split_radix")
+def build_split_radix(n: int, dtype: np.dtype, direction: str) -> dict:
+    """
+    Tables for the iterative Split-Radix algorithm.
+
+    - perm: bit reversal (the DIF passes leave the output in bit-reversed order)
+    - twiddles: per L-shaped pass of length n2, the pairs W_n2^j, W_n2^3j for j < n2/4, stored contiguously
+    """
+    _check_power_of_two(n)
+    sign = -1 if direction == "forward" else 1
+    stages = []
+    n2 = n
+    while n2 >= 4:
+        j = np.arange(n2 // 4)
+        angle = sign * 2j * np.pi * j / n2
+        stages.append(np.stack([np.exp(angle), np.exp(3 * angle)], axis=1).reshape(-1))
+        n2 //= 2
+
+    twiddles = np.concatenate(stages) if stages else np.empty(0)
+    return {
+        "perm": bit_reverse_indices(n),
+        "twiddles": twiddles.astype(dtype),
+    }
+
+
+@njit(fastmath=True, cache=True)
+def _radix4_kernel(x: np.ndarray, perm: np.ndarray, twiddles: np.ndarray, sign: int, out: np.ndarray) -> np.ndarray:
+    """
+    In-place Radix-4 decimation-in-time stages over the digit-reversed input.
+    """
+    N = x.shape[0]
+    # Rotation sign in the working precision, so complex64 butterflies stay in single precision
+    s = out.real.dtype.type(sign)
+
+    # Copy the input in digit-reversed order
+    for i in range(N):
+        out[i] = x[perm[i]]
+
+    # Leading Radix-2 stage when log2(N) is odd
+    bits = 0
+    while (1 << bits) < N:
+        bits += 1
+
+    L = 1
+    if bits % 2 == 1:
+        for i in range(0, N, 2):
+            a = out[i]
+            b = out[i + 1]
+            out[i] = a + b
+            out[i + 1] = a - b
+        L = 2
+
+    offset = 0
+    while L < N:
+        size = 4 * L
+        for start in range(0, N, size):
+            for k in range(L):
+                w = offset + 3 * k
+                i0 = start + k
+                a0 = out[i0]
+                a1 = out[i0 + L] * twiddles[w]
+                a2 = out[i0 + 2 * L] * twiddles[w + 1]
+                a3 = out[i0 + 3 * L] * twiddles[w + 2]
+
+                t0 = a0 + a2
+                t1 = a0 - a2
+                t2 = a1 + a3
+                d = a1 - a3
+                # Multiply by -1j (forward) or +1j (inverse) without a complex multiply
+                t3 = out.dtype.type(complex(-s * d.imag, s * d.real))
+
+                out[i0] = t0 + t2
+                out[i0 + L] = t1 + t3
+                out[i0 + 2 * L] = t0 - t2
+                out[i0 + 3 * L] = t1 - t3
+        offset += 3 * L
+        L = size
+
+    return out
+
+
+@njit(fastmath=True, cache=True)
+def _split_radix_kernel(x: np.ndarray, perm: np.ndarray, twiddles: np.ndarray, sign: int, work: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    In-place Split-Radix decimation-in-frequency (Sorensen, Heideman & Burrus, 1986).
+
+    Each L-shaped pass splits a block of length n2 into one half-length and two quarter-length
+    sub-transforms; the blocks still to be split are visited with the (is, id) index recurrence.
+    The output of the passes is bit-reversed, so it is gathered into `out` with `perm`.
+    """
+    N = x.shape[0]
+    # Rotation sign in the working precision, so complex64 butterflies stay in single precision
+    s = work.real.dtype.type(sign)
+    for i in range(N):
+        work[i] = x[i]
+
+    offset = 0
+    n2 = N
+    while n2 >= 4:
+        n4 = n2 // 4
+        for j in range(n4):
+            w1 = twiddles[offset + 2 * j]
+            w3 = twiddles[offset + 2 * j + 1]
+            is_ = j
+            id_ = 2 * n2
+            while is_ < N - 1:
+                for i0 in range(is_, N - 1, id_):
+                    i1 = i0 + n4
+                    i2 = i1 + n4
+                    i3 = i2 + n4
+                    d1 = work[i0] - work[i2]
+                    work[i0] = work[i0] + work[i2]
+                    d2 = work[i1] - work[i3]
+                    work[i1] = work[i1] + work[i3]
+                    # -1j * d2 (forward) or +1j * d2 (inverse)
+                    jd2 = work.dtype.type(complex(-s * d2.imag, s * d2.real))
+                    work[i2] = (d1 + jd2) * w1
+                    work[i3] = (d1 - jd2) * w3
+                is_ = 2 * id_ - n2 + j
+                id_ = 4 * id_
+        offset += 2 * n4
+        n2 //= 2
+
+    # Last pass: length-2 butterflies on the blocks that are left
+    is_ = 0
+    id_ = 4
+    while is_ < N - 1:
+        for i0 in range(is_, N, id_):
+            a = work[i0]
+            b = work[i0 + 1]
+            work[i0] = a + b
+            work[i0 + 1] = a - b
+        is_ = 2 * id_ - 2
+        id_ = 4 * id_
+
+    # Undo the bit-reversed output order
+    for i in range(N):
+        out[i] = work[perm[i]]
+
+    return out
+
+
+@register_fft(name="radix4_numba")
+def fft_radix4_numba(x: np.ndarray) -> np.ndarray:
+    """
+    Fast Fourier Transform (FFT) using the iterative, in-place Radix-4 Cooley-Tukey algorithm
+    with base-4 digit-reversal permutation and precomputed per-stage twiddles.
+    Sizes with an odd log2 get one leading Radix-2 stage. Compiled with Numba.
+    """
+    N = x.shape[0]
+    _check_power_of_two(N)
+    plan = get_plan(N, result_dtype(x), kind="radix4")
+    out = np.empty(N, dtype=plan.dtype)
+    return _radix4_kernel(x, plan.perm, plan.twiddles, -1, out)
+
+
+@register_fft(name="split_radix_numba")
+def fft_split_radix_numba(x: np.ndarray) -> np.ndarray:
+    """
+    Fast Fourier Transform (FFT) using the iterative, in-place Split-Radix algorithm
+    (L-shaped Radix-2/Radix-4 passes, decimation in frequency) with precomputed twiddles
+    and a final bit-reversal permutation. Compiled with Numba.
+    """
+    N = x.shape[0]
+    _check_power_of_two(N)
+    plan = get_plan(N, result_dtype(x), kind="split_radix")
+    work = np.empty(N, dtype=plan.dtype)
+    out = np.empty(N, dtype=plan.dtype)
+    return _split_radix_kernel(x, plan.perm, plan.twiddles, -1, work, out)
+
+
+if __name__ == "__main__":
+    x = np.array([1, 2, 3, 4, 5, 6, 7, 8])
+    print(f"Expected: {np.fft.fft(x)}")
+    print(f"Got     : {fft_radix4_numba(x)}")
+    print(f"Got     : {fft_split_radix_numba(x)}")
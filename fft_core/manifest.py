@@ -0,0 +1,118 @@
+"""Static discovery of registered FFT implementations: an AST scan of the package, cached in a manifest file."""
+
+import ast
+import json
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 2
+DEFAULT_MANIFEST_PATH = Path(os.environ.get("FFT_MANIFEST_PATH", Path(".cache") / "registry_manifest.json"))
+
+# Decorator name -> registry it fills (see fft_core.selection)
+REGISTER_DECORATORS = {
+    "register_fft": "fft",
+    "register_batch_fft": "batch",
+    "register_rfft": "rfft",
+    "register_stage_profiler": "stages",
+}
+
+
+def _literal(node: ast.expr, default=None):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return default
+
+
+def scan_module(path: Path, module: str) -> list[dict]:
+    """
+    Find the functions of a module that are decorated with a register_* decorator, without importing it.
+
+    Only literal decorator arguments are understood (e.g. `@register_fft(name="myalgo", direction="inverse")`).
+    Each entry holds the registry, name, module, qualname, docstring, direction, norm and parameter names.
+    """
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    entries = []
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        for decorator in node.decorator_list:
+            call = decorator if isinstance(decorator, ast.Call) else None
+            target = call.func if call else decorator
+            decorator_name = target.attr if isinstance(target, ast.Attribute) else getattr(target, "id", None)
+            if decorator_name not in REGISTER_DECORATORS:
+                continue
+
+            kwargs = {kw.arg: _literal(kw.value) for kw in call.keywords} if call else {}
+            entries.append({
+                "registry": REGISTER_DECORATORS[decorator_name],
+                "name": kwargs.get("name") or node.name,
+                "module": module,
+                "qualname": node.name,
+                "doc": ast.get_docstring(node),
+                "direction": kwargs.get("direction", "forward"),
+                "norm": kwargs.get("norm", "backward"),
+                "params": [arg.arg for arg in node.args.args + node.args.kwonlyargs],
+            })
+    return entries
+
+
+def _iter_modules(dir: Path, base_pkg: str, skip_files: list[str]):
+    # Same traversal as fft_core.import_files: .py files, and subfolders with an __init__.py
+    for path in sorted(dir.iterdir()):
+        if path.is_file() and path.suffix == ".py" and path.name not in skip_files:
+            yield path, f"{base_pkg}.{path.stem}"
+        elif path.is_dir() and (path / "__init__.py").exists():
+            yield from _iter_modules(path, f"{base_pkg}.{path.name}", skip_files)
+
+
+def load_manifest(dir: Path, base_pkg: str, skip_files: list[str], manifest_path: str | Path | None = DEFAULT_MANIFEST_PATH) -> list[dict]:
+    """
+    Return the registry entries of every implementation module under `dir`.
+
+    Files are re-scanned only when their size or modification time changed since the cached
+    manifest was written; the manifest is rewritten when anything changed.
+    None as `manifest_path` scans every file without caching.
+    """
+    manifest_path = Path(manifest_path) if manifest_path is not None else None
+    cached = {}
+    if manifest_path is not None and manifest_path.exists():
+        try:
+            with open(manifest_path) as f:
+                stored = json.load(f)
+            if stored.get("version") == MANIFEST_VERSION:
+                cached = stored.get("files", {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable registry manifest {manifest_path}: {e}")
+
+    files = {}
+    changed = False
+    for path, module in _iter_modules(dir, base_pkg, skip_files):
+        stat = path.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        old = cached.get(str(path))
+        if old is not None and old["stamp"] == stamp and old["module"] == module:
+            files[str(path)] = old
+            continue
+        try:
+            entries = scan_module(path, module)
+        except SyntaxError as e:
+            logger.warning(f"Could not scan {path}: {e}")
+            entries = []
+        files[str(path)] = {"module": module, "stamp": stamp, "entries": entries}
+        changed = True
+
+    if manifest_path is not None and (changed or files.keys() != cached.keys()):
+        try:
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = manifest_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"version": MANIFEST_VERSION, "files": files}, f, indent=2)
+            os.replace(tmp_path, manifest_path)
+        except OSError as e:
+            logger.warning(f"Could not write registry manifest {manifest_path}: {e}")
+
+    return [entry for file in files.values() for entry in file["entries"]]
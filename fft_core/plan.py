@@ -0,0 +1,213 @@
+"""FFTW-style plans: precomputed permutation and twiddle tables, kept in a bounded LRU cache."""
+
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from time import perf_counter
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DIRECTIONS = ("forward", "inverse")
+DEFAULT_MAX_BYTES = int(os.environ.get("FFT_PLAN_CACHE_BYTES", 512 * 1024**2))
+
+_plan_builders = {}
+
+
+@dataclass(frozen=True)
+class FFTPlan:
+    """
+    Precomputed tables for one transform, identified by (kind, n, dtype, direction).
+
+    Attributes:
+        kind (str): Name of the plan builder (e.g. "radix2").
+        n (int): Transform size.
+        dtype (np.dtype): Complex dtype the tables are stored in.
+        direction (str): "forward" or "inverse".
+        tables (dict[str, np.ndarray]): The precomputed arrays, e.g. "perm" and "twiddles".
+        build_time_s (float): Time spent building the tables.
+    """
+    kind: str
+    n: int
+    dtype: np.dtype
+    direction: str
+    tables: dict = field(repr=False)
+    build_time_s: float = 0.0
+
+    @property
+    def nbytes(self) -> int:
+        return sum(table.nbytes for table in self.tables.values())
+
+    @property
+    def perm(self) -> np.ndarray:
+        return self.tables["perm"]
+
+    @property
+    def twiddles(self) -> np.ndarray:
+        return self.tables["twiddles"]
+
+
+def register_plan_builder(kind: str):
+    """
+    Decorator to register a plan builder.
+    Usage:
+      @register_plan_builder("radix2")
+      def build_radix2(n, dtype, direction) -> dict[str, np.ndarray]: ...
+    """
+    def _register(f):
+        if kind in _plan_builders:
+            raise ValueError(f"Plan builder '{kind}' is already registered")
+        _plan_builders[kind] = f
+        return f
+    return _register
+
+
+def build_plan(n: int, dtype=np.complex128, direction: str = "forward", kind: str = "radix2") -> FFTPlan:
+    """
+    Build a plan without touching the cache (useful for measuring plan-build cost).
+    """
+    if direction not in DIRECTIONS:
+        raise ValueError(f"direction must be one of {DIRECTIONS}, got '{direction}'")
+    if kind not in _plan_builders:
+        raise KeyError(f"Unknown plan kind '{kind}'")
+
+    dtype = np.dtype(dtype)
+    start_time = perf_counter()
+    tables = _plan_builders[kind](n, dtype, direction)
+    build_time_s = perf_counter() - start_time
+    return FFTPlan(kind, n, dtype, direction, tables, build_time_s)
+
+
+class PlanCache:
+    """
+    Least-recently-used cache of plans, bounded by the total bytes of their tables.
+
+    The most recently built plan is always kept, even if it alone exceeds `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._plans = OrderedDict()
+
+    def __len__(self):
+        return len(self._plans)
+
+    def get(self, n: int, dtype=np.complex128, direction: str = "forward", kind: str = "radix2") -> FFTPlan:
+        key = (kind, n, np.dtype(dtype), direction)
+        plan = self._plans.get(key)
+        if plan is not None:
+            self.hits += 1
+            self._plans.move_to_end(key)
+            return plan
+
+        self.misses += 1
+        plan = build_plan(n, dtype, direction, kind)
+        self._plans[key] = plan
+        self.nbytes += plan.nbytes
+        self._evict()
+        return plan
+
+    def clear(self):
+        self._plans.clear()
+        self.nbytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "plans": len(self._plans),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self):
+        while self.nbytes > self.max_bytes and len(self._plans) > 1:
+            key, plan = self._plans.popitem(last=False)
+            self.nbytes -= plan.nbytes
+            self.evictions += 1
+            logger.debug(f"Evicted FFT plan {key} ({plan.nbytes} bytes)")
+
+
+plan_cache = PlanCache()
+
+
+def get_plan(n: int, dtype=np.complex128, direction: str = "forward", kind: str = "radix2") -> FFTPlan:
+    """
+    Return the cached plan for (kind, n, dtype, direction), building it on first use.
+    """
+    return plan_cache.get(n, dtype, direction, kind)
+
+
+def result_dtype(x: np.ndarray) -> np.dtype:
+    """
+    Complex dtype a transform of x is computed in: complex64 for single-precision input
+    (float32/complex64), complex128 otherwise. Same rule as scipy.fft.
+    """
+    return np.result_type(x.dtype, np.complex64)
+
+
+def norm_scale(n: int, direction: str = "forward", norm: str = "backward") -> float:
+    """
+    Scale factor of a transform of size n under a scipy.fft `norm` mode
+    ("backward": 1/n on the inverse, "forward": 1/n on the forward, "ortho": 1/sqrt(n) on both).
+    """
+    if norm == "ortho":
+        return 1 / np.sqrt(n)
+    if (norm == "backward") == (direction == "inverse"):
+        return 1 / n
+    return 1.0
+
+
+def nominal_flops(n: int) -> float:
+    """
+    Conventional flop count of a complex FFT of size n, 5 * N * log2(N) (as reported by FFTW and benchFFT),
+    whatever the algorithm actually does; it makes GFLOP/s comparable across implementations and sizes.
+    It is also the exact count of the Radix-2 algorithm: 10 real operations per butterfly
+    (1 complex multiply + 2 complex adds), N/2 butterflies per stage, log2(N) stages.
+    """
+    return 5 * n * np.log2(n) if n > 1 else 0.0
+
+
+def bit_reverse_indices(n: int) -> np.ndarray:
+    """
+    Compute bit-reversed indices for an array of size n (a power of 2).
+
+    The bit-reversed order mimics the order of the base-case subproblems in recursion.
+    Computed arithmetically, one bit at a time over the whole index array.
+    """
+    bits = max(n.bit_length() - 1, 0)
+    index_dtype = np.int32 if n <= np.iinfo(np.int32).max else np.int64
+    indices = np.arange(n, dtype=index_dtype)
+    result = np.zeros(n, dtype=index_dtype)
+    for j in range(bits):
+        result |= ((indices >> j) & 1) << (bits - 1 - j)
+    return result
+
+
+@register_plan_builder("radix2")
+def build_radix2(n: int, dtype: np.dtype, direction: str) -> dict:
+    """
+    Tables for the iterative Radix-2 Cooley-Tukey algorithm.
+
+    - perm: bit-reversal permutation (gather indices)
+    - twiddles: exp(-+2j*pi*k/n) for k < n/2; the stage of block size `size` uses every (n/size)-th entry
+    """
+    if n < 1 or n & (n - 1) != 0:
+        raise ValueError("Input size must be a power of 2")
+
+    sign = -1 if direction == "forward" else 1
+    k = np.arange(n // 2)
+    twiddles = np.exp(sign * 2j * np.pi * k / n).astype(dtype)
+    return {"perm": bit_reverse_indices(n), "twiddles": twiddles}
+
+
+if __name__ == "__main__":
+    plan = get_plan(8)
+    print(plan, plan.perm, plan.twiddles, plan_cache.stats(), sep="\n")
@@ -1,33 +1,473 @@
-"""Mechanism for registering FFT implementations."""
+"""Mechanism for registering FFT implementations, and an auto-tuning dispatcher over them."""
 
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import json
 import logging
+import os
+import platform
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+WISDOM_VERSION = 1
+DEFAULT_WISDOM_PATH = Path(os.environ.get("FFT_WISDOM_PATH", Path(".cache") / "wisdom.json"))
+
+DIRECTIONS = ("forward", "inverse")
+# Same meaning as the `norm` argument of scipy.fft: which direction is scaled by 1/n ("ortho": both by 1/sqrt(n))
+NORMS = ("backward", "ortho", "forward")
+
 fft_functions = {}
+ifft_functions = {}
+batch_fft_functions = {}
+rfft_functions = {}
+stage_profilers = {}
 _duplicates_names = {}
 
-def register_fft(func=None, *, name=None):
+
+class LazyImplementation:
+    """
+    Registry placeholder for an implementation found by the manifest scan (see fft_core.manifest).
+
+    It carries the metadata of the real function (`__name__`, `__module__`, `__qualname__`, `__doc__`,
+    `direction`, `norm`, `params`) so that listing and selecting implementations imports nothing.
+    The first call imports the defining module, whose decorator swaps the real function into the
+    registry, and forwards to it.
+    """
+
+    def __init__(self, entry: dict):
+        self.__name__ = entry["qualname"]
+        self.__qualname__ = entry["qualname"]
+        self.__module__ = entry["module"]
+        self.__doc__ = entry["doc"]
+        self.direction = entry["direction"]
+        self.norm = entry["norm"]
+        self.params = entry["params"]
+        self._func = None
+
+    def load(self) -> callable:
+        """
+        Import the defining module (once) and return the real function.
+        """
+        if self._func is None:
+            module = importlib.import_module(self.__module__)
+            # The decorator normally resolves the placeholder while the module runs
+            if self._func is None:
+                self._func = getattr(module, self.__qualname__)
+        return self._func
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._func is not None else "not loaded"
+        return f"<lazy {self.__module__}.{self.__qualname__} ({state})>"
+
+
+def _find_placeholder(registry: dict, f) -> str | None:
+    for key, existing in registry.items():
+        if isinstance(existing, LazyImplementation) and existing.__module__ == f.__module__ and existing.__qualname__ == f.__qualname__:
+            return key
+    return None
+
+
+def _add_to_registry(registry: dict, label: str, key: str, f):
+    placeholder = _find_placeholder(registry, f)
+    if placeholder is not None:
+        # The module of a manifest entry was imported: the real function replaces its placeholder
+        registry[placeholder]._func = f
+        registry[placeholder] = f
+        logger.debug(f"Loaded {label} implementation: '{placeholder}'")
+        return f
+
+    if key in registry:
+        i = _duplicates_names.get((label, key), 0) + 1
+        _duplicates_names[(label, key)] = i
+        key = f"{key}_{i}"
+        logger.warning(f"Duplicate {label} name detected—registering as '{key}'")
+
+    registry[key] = f
+    logger.info(f"Registered {label} implementation: '{key}'")
+    return f
+
+
+def register_fft(func=None, *, name=None, direction="forward", norm="backward"):
     """
     Decorator to register an FFT implementation.
+    Forward transforms go to `fft_functions`, inverse transforms to `ifft_functions`.
+    `norm` declares the scaling the implementation applies, as in scipy.fft
+    ("backward": the inverse is scaled by 1/n). It is stored as `f.norm` (and `f.direction`).
+    Give an inverse the same name as its forward transform so they can be paired.
+    An implementation may also take an `out` argument: a preallocated array of shape (N,) and the
+    result dtype that it writes the transform to and returns (`out=x` for an in-place transform),
+    with scratch buffers from `fft_core.workspace`, so steady-state calls allocate nothing.
+    Check for it with `supports_out`.
+    A multi-threaded implementation takes a `threads` argument (the thread count of one call, None
+    for Numba's current setting); check for it with `is_multithreaded`.
     Usage:
       @register_fft
       def your_fft_name(x): ...
     or
       @register_fft(name="superfft")
       def your_fft_name(x): ...
+    or
+      @register_fft(name="superfft", direction="inverse")
+      def your_ifft_name(x): ...
     """
+    if direction not in DIRECTIONS:
+        raise ValueError(f"direction must be one of {DIRECTIONS}, got '{direction}'")
+    if norm not in NORMS:
+        raise ValueError(f"norm must be one of {NORMS}, got '{norm}'")
+
     def _register(f):
-        key = name or f.__name__
-        if key in fft_functions:
-            i = _duplicates_names.get(key, 0) + 1
-            _duplicates_names[key] = i
-            key = f"{key}_{i}"
-            logger.warning(f"Duplicate FFT name detected—registering as '{key}'")
-            
-        fft_functions[key] = f
-        logger.info(f"Registered FFT implementation: '{key}'")
-        return f
+        f.direction = direction
+        f.norm = norm
+        if direction == "inverse":
+            return _add_to_registry(ifft_functions, "inverse FFT", name or f.__name__, f)
+        return _add_to_registry(fft_functions, "FFT", name or f.__name__, f)
+
+    # support both forms
+    return _register(func) if func else _register
+
+
+def register_batch_fft(func=None, *, name=None):
+    """
+    Decorator to register a batched FFT implementation.
+    A batched implementation transforms every 1-D slice of an N-D array along `axis`.
+    Use the same name as the 1-D implementation it accelerates.
+    Usage:
+      @register_batch_fft(name="superfft")
+      def your_fft_name_batch(x, axis=-1): ...
+    """
+    def _register(f):
+        return _add_to_registry(batch_fft_functions, "batched FFT", name or f.__name__, f)
 
     # support both forms
-    return _register(func) if func else _register
\ No newline at end of file
+    return _register(func) if func else _register
+
+
+def register_rfft(func=None, *, name=None):
+    """
+    Decorator to register a real-input FFT implementation.
+    A real-input FFT takes N real values and returns the N // 2 + 1 non-negative
+    frequency bins (same output as `scipy.fft.rfft`).
+    Usage:
+      @register_rfft(name="superrfft")
+      def your_rfft_name(x): ...
+    """
+    def _register(f):
+        return _add_to_registry(rfft_functions, "real FFT", name or f.__name__, f)
+
+    # support both forms
+    return _register(func) if func else _register
+
+
+def register_stage_profiler(func=None, *, name=None):
+    """
+    Decorator to register the stage breakdown of a compiled implementation, for instrumented runs.
+    A stage profiler prepares the buffers for one input and returns the ordered stages of the
+    transform as (label, span, run) tuples: `run()` executes that stage alone, and running all of
+    them in order computes the full transform. `span` is the block size of a butterfly stage (0 for
+    permutation passes). Use the same name as the implementation it breaks down.
+    Usage:
+      @register_stage_profiler(name="superfft")
+      def your_fft_name_stages(x): ...
+    """
+    def _register(f):
+        return _add_to_registry(stage_profilers, "stage profiler", name or f.__name__, f)
+
+    # support both forms
+    return _register(func) if func else _register
+
+
+def register_lazy(entry: dict):
+    """
+    Register a placeholder for a manifest entry (see `fft_core.manifest.scan_module`) without importing its module.
+    """
+    registry, label = {
+        ("fft", "forward"): (fft_functions, "FFT"),
+        ("fft", "inverse"): (ifft_functions, "inverse FFT"),
+        ("batch", "forward"): (batch_fft_functions, "batched FFT"),
+        ("rfft", "forward"): (rfft_functions, "real FFT"),
+        ("stages", "forward"): (stage_profilers, "stage profiler"),
+    }[(entry["registry"], entry["direction"])]
+    return _add_to_registry(registry, label, entry["name"], LazyImplementation(entry))
+
+
+def load_implementation(func: callable) -> callable:
+    """
+    The real function behind a registry entry, importing its module if it is still a placeholder.
+    """
+    return func.load() if isinstance(func, LazyImplementation) else func
+
+
+def supports_out(func: callable) -> bool:
+    """
+    Whether an implementation accepts a preallocated `out` array (see `register_fft`).
+    Placeholders answer from their manifest entry, without importing their module.
+    """
+    params = getattr(func, "params", None)
+    if params is None:
+        try:
+            params = inspect.signature(func).parameters
+        except (TypeError, ValueError):
+            return False
+    return "out" in params
+
+
+def is_multithreaded(func: callable) -> bool:
+    """
+    Whether an implementation runs on several threads, i.e. accepts a `threads` argument (see `register_fft`).
+    Placeholders answer from their manifest entry, without importing their module.
+    """
+    params = getattr(func, "params", None)
+    if params is None:
+        try:
+            params = inspect.signature(func).parameters
+        except (TypeError, ValueError):
+            return False
+    return "threads" in params
+
+
+def loop_batch(func: callable) -> callable:
+    """
+    Wrap a 1-D FFT into a batched one that calls it once per slice (Python-level loop).
+    """
+    func_name = getattr(func, "__name__", "fft")
+
+    def batched(x: np.ndarray, axis: int = -1) -> np.ndarray:
+        return np.apply_along_axis(func, axis, x)
+
+    batched.__name__ = f"{func_name}_loop"
+    batched.__doc__ = f"Per-slice Python loop over {func_name}."
+    return batched
+
+
+def get_round_trip_pairs() -> dict:
+    """
+    Return name -> (forward, inverse) for every implementation registered in both directions with the same norm.
+    """
+    return {
+        name: (fft_functions[name], inverse)
+        for name, inverse in ifft_functions.items()
+        if name in fft_functions and getattr(fft_functions[name], "norm", "backward") == inverse.norm
+    }
+
+
+def get_batch_fft(name: str) -> callable:
+    """
+    Return the batched entry point for a registered implementation.
+    Falls back to a per-slice Python loop if no compiled batch version is registered.
+    """
+    if name in batch_fft_functions:
+        return batch_fft_functions[name]
+    return loop_batch(fft_functions[name])
+
+
+def get_host_id() -> str:
+    """
+    Fingerprint of the machine the wisdom was measured on (host name, OS, CPU, core count).
+    """
+    uname = platform.uname()
+    host = f"{uname.node}|{uname.system}|{uname.machine}|{uname.processor}|{os.cpu_count()}"
+    return hashlib.blake2b(host.encode(), digest_size=8).hexdigest()
+
+
+def get_implementation_id(func: callable) -> str:
+    """
+    Fingerprint of an implementation: its qualified name and the source of the module that defines it,
+    so editing a kernel (or anything else in its file) invalidates the wisdom measured for it.
+    The source is located from the module name, so placeholders are fingerprinted without being imported.
+    """
+    module = getattr(func, "__module__", "") or ""
+    h = hashlib.blake2b(digest_size=8)
+    h.update(f"{module}.{getattr(func, '__qualname__', repr(func))}".encode())
+    try:
+        spec = importlib.util.find_spec(module)
+        h.update(Path(spec.origin).read_bytes())
+    except (AttributeError, ImportError, TypeError, ValueError, OSError):
+        pass
+    return h.hexdigest()
+
+
+class FFTPlanner:
+    """
+    Auto-tuner that picks the fastest registered FFT per (size, input dtype), FFTW-wisdom style.
+
+    On the first call for a (size, dtype) without valid wisdom, every implementation in
+    `fft_functions` is checked against `np.fft.fft` and timed; the fastest correct one is
+    remembered in memory and in the wisdom file. Later calls only cost one dict lookup.
+
+    Wisdom is invalidated automatically:
+    - all of it, when the file was written on another host (see `get_host_id`)
+    - one entry, when the set of candidates or the source of any of them changed (see `get_implementation_id`)
+
+    Parameters:
+        wisdom_path (str | Path | None): JSON wisdom file. None keeps the wisdom in memory only.
+        repeat (int): Timed trials per candidate (the minimum is kept).
+        min_time (float): Minimum seconds per trial.
+
+    Example:
+        >>> import fft_core
+        >>> from fft_core.selection import fft
+        >>> X = fft(x)  # tuned on the first call for len(x) and x.dtype
+    """
+
+    def __init__(self, wisdom_path: str | Path | None = DEFAULT_WISDOM_PATH, repeat: int = 5, min_time: float = 0.01):
+        self.wisdom_path = Path(wisdom_path) if wisdom_path is not None else None
+        self.repeat = repeat
+        self.min_time = min_time
+        self._routes = {}
+        self._wisdom = None
+
+    @staticmethod
+    def wisdom_key(n: int, dtype) -> str:
+        return f"{np.dtype(dtype).name}:{n}"
+
+    def _candidates(self) -> dict:
+        return {name: get_implementation_id(func) for name, func in fft_functions.items()}
+
+    def load_wisdom(self) -> dict:
+        """
+        Read the wisdom file, dropping it entirely if it belongs to another host or format version.
+        """
+        host = get_host_id()
+        wisdom = {"version": WISDOM_VERSION, "host": host, "entries": {}}
+        if self.wisdom_path is None or not self.wisdom_path.exists():
+            return wisdom
+        try:
+            with open(self.wisdom_path) as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable wisdom file {self.wisdom_path}: {e}")
+            return wisdom
+
+        if stored.get("version") != WISDOM_VERSION or stored.get("host") != host:
+            logger.info(f"Wisdom in {self.wisdom_path} was measured on another host or version, discarding it")
+            return wisdom
+        wisdom["entries"] = stored.get("entries", {})
+        return wisdom
+
+    def save_wisdom(self):
+        if self.wisdom_path is None or self._wisdom is None:
+            return
+        self.wisdom_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.wisdom_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self._wisdom, f, indent=2)
+        os.replace(tmp_path, self.wisdom_path)
+
+    @property
+    def wisdom(self) -> dict:
+        if self._wisdom is None:
+            self._wisdom = self.load_wisdom()
+        return self._wisdom
+
+    def _time(self, func: callable, x: np.ndarray) -> float:
+        # Best of `repeat` trials, each looping until `min_time` has passed (seconds per call)
+        best = np.inf
+        for _ in range(self.repeat):
+            loops = 0
+            start = perf_counter()
+            while True:
+                func(x)
+                loops += 1
+                elapsed = perf_counter() - start
+                if elapsed >= self.min_time:
+                    break
+            best = min(best, elapsed / loops)
+        return best
+
+    def tune(self, n: int, dtype=np.complex128, save: bool = True) -> str:
+        """
+        Benchmark every registered implementation at (n, dtype), store the winner and return its name.
+
+        Raises:
+            RuntimeError: If no implementation handles this size correctly.
+        """
+        dtype = np.dtype(dtype)
+        rng = np.random.default_rng(n)
+        x = rng.random(n) + 1j * rng.random(n) if dtype.kind == "c" else rng.random(n)
+        x = x.astype(dtype)
+        expected = np.fft.fft(x.astype(np.promote_types(dtype, np.complex128)))
+        atol = 1e-3 * max(float(np.max(np.abs(expected), initial=0.0)), 1.0)
+
+        timings = {}
+        candidates = self._candidates()
+        for name in candidates:
+            func = load_implementation(fft_functions[name])
+            try:
+                if not np.allclose(func(x), expected, rtol=1e-3, atol=atol):
+                    logger.warning(f"Tuning {self.wisdom_key(n, dtype)}: '{name}' gives wrong results, skipping it")
+                    continue
+                timings[name] = self._time(func, x) * 1e6
+            except Exception as e:
+                logger.debug(f"Tuning {self.wisdom_key(n, dtype)}: '{name}' failed ({e})")
+
+        if not timings:
+            raise RuntimeError(f"No registered FFT implementation handles size {n} with dtype {dtype}")
+
+        best = min(timings, key=timings.get)
+        self.wisdom["entries"][self.wisdom_key(n, dtype)] = {
+            "best": best,
+            "timings_us": timings,
+            "implementations": candidates,
+            "tuned_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        self._routes[(n, dtype)] = load_implementation(fft_functions[best])
+        logger.info(f"Tuned {self.wisdom_key(n, dtype)}: '{best}' ({timings[best]:.2f} µs)")
+        if save:
+            self.save_wisdom()
+        return best
+
+    def best(self, n: int, dtype=np.complex128) -> str:
+        """
+        Name of the implementation to use for (n, dtype), from valid wisdom or by tuning now.
+        """
+        dtype = np.dtype(dtype)
+        entry = self.wisdom["entries"].get(self.wisdom_key(n, dtype))
+        if entry is not None and entry.get("implementations") == self._candidates() and entry["best"] in fft_functions:
+            self._routes[(n, dtype)] = load_implementation(fft_functions[entry["best"]])
+            return entry["best"]
+        if entry is not None:
+            logger.info(f"Wisdom for {self.wisdom_key(n, dtype)} is stale (implementations changed), retuning")
+        return self.tune(n, dtype)
+
+    def invalidate(self, n: int | None = None, dtype=None, save: bool = True):
+        """
+        Forget the wisdom for (n, dtype); None matches every size / dtype.
+        """
+        dtype = np.dtype(dtype) if dtype is not None else None
+        for key in list(self.wisdom["entries"]):
+            name, size = key.split(":")
+            if (n is None or int(size) == n) and (dtype is None or name == dtype.name):
+                del self.wisdom["entries"][key]
+        self._routes = {
+            (size, dt): f for (size, dt), f in self._routes.items()
+            if not ((n is None or size == n) and (dtype is None or dt == dtype))
+        }
+        if save:
+            self.save_wisdom()
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        func = self._routes.get((x.shape[0], x.dtype))
+        if func is None:
+            self.best(x.shape[0], x.dtype)
+            func = self._routes[(x.shape[0], x.dtype)]
+        return func(x)
+
+
+planner = FFTPlanner()
+
+
+def fft(x: np.ndarray) -> np.ndarray:
+    """
+    FFT of x on the fastest registered implementation for len(x) and x.dtype (see `FFTPlanner`).
+    """
+    return planner(x)
@@ -0,0 +1,104 @@
+"""Reusable scratch buffers for FFT kernels and the `out=` calling convention, so steady-state calls allocate nothing."""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = int(os.environ.get("FFT_WORKSPACE_BYTES", 512 * 1024**2))
+
+
+class WorkspacePool:
+    """
+    Least-recently-used pool of scratch buffers, keyed by (tag, n, dtype, thread) and bounded by their total bytes.
+
+    A kernel asks for the same buffer on every call of the same size instead of allocating it, so
+    repeated calls skip the allocator and the page faults of fresh memory. Buffers are per thread,
+    so concurrent calls from different threads never share one. The most recently requested buffer
+    is always kept, even if it alone exceeds `max_bytes`.
+
+    The contents of a buffer are undefined on every `get`; never return one to the caller.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._buffers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._buffers)
+
+    def get(self, n: int, dtype=np.complex128, tag: str = "work") -> np.ndarray:
+        key = (tag, n, np.dtype(dtype), threading.get_ident())
+        with self._lock:
+            buffer = self._buffers.get(key)
+            if buffer is not None:
+                self.hits += 1
+                self._buffers.move_to_end(key)
+                return buffer
+
+            self.misses += 1
+            buffer = np.empty(n, dtype=dtype)
+            self._buffers[key] = buffer
+            self.nbytes += buffer.nbytes
+            self._evict()
+            return buffer
+
+    def clear(self):
+        with self._lock:
+            self._buffers.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "buffers": len(self._buffers),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self):
+        while self.nbytes > self.max_bytes and len(self._buffers) > 1:
+            key, buffer = self._buffers.popitem(last=False)
+            self.nbytes -= buffer.nbytes
+            self.evictions += 1
+            logger.debug(f"Evicted workspace {key[:3]} ({buffer.nbytes} bytes)")
+
+
+workspace_pool = WorkspacePool()
+
+
+def get_workspace(n: int, dtype=np.complex128, tag: str = "work") -> np.ndarray:
+    """
+    Return the pooled scratch buffer of n elements for (tag, dtype) on this thread, allocating it on first use.
+    """
+    return workspace_pool.get(n, dtype, tag)
+
+
+def prepare_out(out: np.ndarray | None, n: int, dtype) -> np.ndarray:
+    """
+    Output buffer of an `out=` call: a new array when `out` is None, else `out` itself once
+    checked to be a writeable, C-contiguous array of shape (n,) and the transform's dtype.
+    """
+    if out is None:
+        return np.empty(n, dtype=dtype)
+    if not isinstance(out, np.ndarray) or out.shape != (n,) or out.dtype != np.dtype(dtype):
+        raise ValueError(f"out must be an array of shape ({n},) and dtype {np.dtype(dtype)}, got {getattr(out, 'shape', None)} {getattr(out, 'dtype', type(out).__name__)}")
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError("out must be C-contiguous and writeable")
+    return out
+
+
+if __name__ == "__main__":
+    work = get_workspace(8)
+    print(work is get_workspace(8), workspace_pool.stats())
@@ -3,6 +3,7 @@
 import argparse
 
 from fft_core import fft_functions
+from fft_core.selection import ifft_functions
 
 parser = argparse.ArgumentParser()
 parser.add_argument("-v", "--verbose", help="print verbose output", action="store_true")
@@ -29,4 +30,13 @@ for i, (name, func) in enumerate(fft_functions.items()):
         # print docstring
         print(func.__doc__)
     else:
-        print(f"{i+1}. {name}")
\ No newline at end of file
+        print(f"{i+1}. {name}")
+
+if ifft_functions:
+    print(f"\nFound {len(ifft_functions)} registered inverse FFT implementations:\n")
+    for i, (name, func) in enumerate(ifft_functions.items()):
+        if args.verbose:
+            print(f"{i+1}. {name} ({func.__module__}.{func.__name__}, norm={func.norm})")
+            print(func.__doc__)
+        else:
+            print(f"{i+1}. {name}")
\ No newline at end of file
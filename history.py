@@ -0,0 +1,77 @@
+"""This script lists the recorded benchmark runs and compares two of them, exiting with 1 on significant slowdowns."""
+
+import argparse
+
+import polars as pl
+
+from utils.history import COMPARE_METHODS, DEFAULT_HISTORY_DIR, compare_runs, list_runs, load_history, resolve_run
+from utils.io_utils import colored_print
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-d", "--dir", help=f"history directory (default: {DEFAULT_HISTORY_DIR})", default=DEFAULT_HISTORY_DIR)
+commands = parser.add_subparsers(dest="command", required=True)
+commands.add_parser("list", help="list the recorded runs")
+compare_parser = commands.add_parser("compare", help="flag statistically significant slowdowns of a run against a baseline run")
+compare_parser.add_argument("baseline", help="baseline run: run id, unique prefix, 'latest' or 'previous'")
+compare_parser.add_argument("candidate", help="run to check (default: latest)", nargs="?", default="latest")
+compare_parser.add_argument("--method", help="significance test (default: mannwhitney)", choices=COMPARE_METHODS, default="mannwhitney")
+compare_parser.add_argument("--alpha", help="significance level (default: 0.05)", type=float, default=0.05)
+compare_parser.add_argument("--threshold", help="smallest slowdown worth flagging, as a fraction of the baseline median (default: 0.05)", type=float, default=0.05)
+compare_parser.add_argument("-f", "--funcs", help="only compare these implementations", nargs="+", default=None)
+args = parser.parse_args()
+
+history = load_history(args.dir)
+
+if args.command == "list":
+    if history.is_empty():
+        print(f"No runs recorded in '{args.dir}'.")
+        exit(0)
+    runs = list_runs(history).with_columns(pl.col("commit").str.slice(0, 8))
+    columns = ["run_id", "timestamp", "host", "commit", "dirty", "dtype", "speed_suite", "funcs", "rows"]
+    with pl.Config(tbl_rows=-1, tbl_cols=-1, tbl_width_chars=200):
+        print(runs.select(col for col in columns if col in runs.columns))
+    exit(0)
+
+try:
+    baseline = resolve_run(history, args.baseline)
+    candidate = resolve_run(history, args.candidate)
+except ValueError as e:
+    parser.error(str(e))
+
+runs = list_runs(history).filter(pl.col("run_id").is_in([baseline, candidate]))
+for column in ["host_id", "dtype", "speed_suite"]:
+    if column in runs.columns and runs[column].n_unique() > 1:
+        colored_print(f"⚠️  The runs differ in {column}: {runs[column].to_list()}", color="YELLOW")
+
+if args.funcs:
+    history = history.filter(pl.col("func").is_in(args.funcs))
+result = compare_runs(history, baseline, candidate, method=args.method, alpha=args.alpha, threshold=args.threshold)
+if result.is_empty():
+    parser.error(f"Runs '{baseline}' and '{candidate}' have no (func, size) in common")
+
+print(f"Comparing '{candidate}' against baseline '{baseline}' ({args.method}, alpha={args.alpha}, threshold={args.threshold:.0%})...\n")
+for row in result.iter_rows(named=True):
+    line = (
+        f"{row['func']:<20} (size: {row['input_size']:>9}): {row['baseline_median_us']:>12.2f} -> {row['candidate_median_us']:>12.2f} µs, "
+        f"x{row['ratio']:.3f} [{row['ratio_ci_low']:.3f}, {row['ratio_ci_high']:.3f}], p={row['p_value']:.3g}"
+    )
+    if row["insufficient_samples"]:
+        line += " (too few trials for Mann-Whitney, gated by bootstrap)"
+    if row["is_regression"]:
+        colored_print(f"  🐢 {line}", color="RED")
+    else:
+        colored_print(f"  ✅ {line}", color="GREEN")
+
+regressions = result.filter(pl.col("is_regression"))
+insufficient = result.filter(pl.col("insufficient_samples"))
+print()
+if not insufficient.is_empty():
+    colored_print(
+        f"⚠️  {len(insufficient)} of {len(result)} (func, size) pairs have too few trials for a Mann-Whitney p-value below "
+        f"alpha={args.alpha}; they were gated by the bootstrap interval instead. Record runs with a higher --repeat and --max-time.",
+        color="YELLOW",
+    )
+if not regressions.is_empty():
+    colored_print(f"{len(regressions)} of {len(result)} (func, size) pairs are significantly slower.", color="RED")
+    exit(1)
+print(f"No significant slowdown in {len(result)} (func, size) pairs.")
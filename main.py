@@ -13,18 +13,52 @@ logging.getLogger().setLevel(logging.INFO)
 
 
 import argparse
+import os
+import tempfile
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+import numpy as np
 import polars as pl
 from numpy.fft import fft as numpy_fft
 from scipy.fft import fft as scipy_fft
+from scipy.fft import ifft as scipy_ifft
+from scipy.fft import rfft as scipy_rfft
 
-from fft_core import fft_functions
-from utils import csv_utils, test, test_case
+from fft_core import convolution, fft_functions, plan
+from fft_core.selection import batch_fft_functions, get_batch_fft, get_round_trip_pairs, is_multithreaded, load_implementation, loop_batch, rfft_functions, stage_profilers, supports_out
+from utils import corpus, csv_utils, history, test, test_case
 from utils.io_utils import colored_print, qprint
+from utils.checkpoint import DEFAULT_CHECKPOINT_DIR, Checkpoint
+from utils.reference_cache import DEFAULT_CACHE_DIR, ReferenceCache
+from utils.runner import SPEED_LAYOUTS, BenchmarkRunner, Job
 
 RESULT_DIR = "results"
+METRICS_MAX_SIZE = 2**19
+SPEED_SUITES = {
+    "massive": test_case.get_massive_test_cases,
+    "large": test_case.get_large_test_cases,
+    "arbitrary": test_case.get_arbitrary_size_test_cases,
+}
+
+CONVOLUTION_SIGNAL_SIZE = 2**22
+CONVOLUTION_FILTER_LENGTHS = [16, 128, 1024, 8192, 65536]
+CONVOLUTION_FFTS = ["scipy", "iterative_numba"]
+
+# Numba's own default, read without importing Numba
+DEFAULT_THREADS = int(os.environ.get("NUMBA_NUM_THREADS", os.cpu_count()))
+STARTUP_COMMANDS = {
+    "python": (["-c", "pass"], {}),
+    "import fft_core": (["-c", "import fft_core"], {}),
+    "import fft_core (eager)": (["-c", "import fft_core"], {"FFT_CORE_EAGER": "1"}),
+    "list implementations": (["get_regitered_fft.py", "--list"], {}),
+    "first call iterative_numba": (["-c", "import numpy as np, fft_core; fft_core.fft_functions['iterative_numba'](np.ones(8, complex))"], {}),
+    "main.py --help": (["main.py", "--help"], {}),
+}
+COLD_START_SIZE = 1024
+# Seconds per call after which the vectorized mode stops timing the pure-Python loop version
+VECTORIZED_LOOP_BUDGET = 0.1
 
 fft_functions = {
     "scipy": scipy_fft,
@@ -35,7 +69,7 @@ fft_functions = {
 
 def get_args():
     parser = argparse.ArgumentParser()
-    parser.add_argument("-m", "--mode", help="test mode: all, metrics, speed", choices=["all", "metrics", "speed"], default="all")
+    parser.add_argument("-m", "--mode", help="test mode: all, metrics, speed, plan (plan-build vs execute cost), batch (2-D throughput), real (real-input FFTs), radix (flop-count vs time savings over Radix-2), scaling (multi-threaded speedup vs threads), roundtrip (ifft(fft(x)) latency and error), convolution (streaming overlap-add/save vs scipy.signal.oaconvolve), startup (import and first-call time in fresh interpreters), coldstart (per-implementation import, JIT compile and cache-load time), stages (time of the bit-reversal and each butterfly stage of the instrumented compiled engines), steadystate (regular vs allocation-free out= calls), vectorized (pure-NumPy iterative engine vs the loop version and iterative_numba)", choices=["all", "metrics", "speed", "plan", "batch", "real", "radix", "scaling", "roundtrip", "convolution", "startup", "coldstart", "stages", "steadystate", "vectorized"], default="all")
     parser.add_argument("-t", "--table", help="output as table", action="store_true")
     parser.add_argument(
         "-s", "--save-csv",
@@ -44,22 +78,86 @@ def get_args():
         const=True,  # Temporary placeholder to detect usage without value
         help="Optionally save results to CSV files. If no directory name is provided, uses /results_YYYYMMDD_HHMMSS"
     )
+    parser.add_argument(
+        "--history",
+        metavar="DIR",
+        nargs="?",
+        const=history.DEFAULT_HISTORY_DIR,
+        help=f"Append the speed results (every trial) with host, commit and library versions to the Parquet run history (default: {history.DEFAULT_HISTORY_DIR}); compare runs with history.py"
+    )
     parser.add_argument("--minimal", help="Reduce output verbosity during tests", action="store_true")
+    parser.add_argument("--speed-suite", help="test cases of the speed mode (default: massive); 'arbitrary' mixes non-power-of-two and prime sizes with their power-of-two neighbours", choices=list(SPEED_SUITES), default="massive")
+    parser.add_argument("--memory", help="also profile peak RSS, heap peak and allocations per (func, size) in speed mode (each in its own process)", action="store_true")
+    parser.add_argument("--seed", help=f"base seed of the generated test signals (default: {test_case.DEFAULT_SEED})", type=int, default=test_case.DEFAULT_SEED)
+    parser.add_argument("--corpus", metavar="DIR", help="use a prebuilt on-disk corpus (see build_corpus.py) instead of generated signals")
+    parser.add_argument("--ref-cache", metavar="DIR", help=f"directory of the on-disk reference-output cache (default: {DEFAULT_CACHE_DIR})", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--no-ref-cache", help="keep reference outputs in memory only (no on-disk cache)", action="store_true")
+    parser.add_argument("--dtype", help="precision of the metrics and speed test signals (default: complex128); with complex64, speed mode also reports the float32 speedup over complex128 per size", choices=["complex128", "complex64"], default="complex128")
+    parser.add_argument("--threads", help=f"largest thread count of the scaling mode (default: {DEFAULT_THREADS})", type=int, default=DEFAULT_THREADS)
+    parser.add_argument("-r", "--repeat", help=f"number of timed trials per size (default: {test.DEFAULT_REPEAT})", type=int, default=test.DEFAULT_REPEAT)
+    parser.add_argument("--min-time", help=f"minimum seconds per timed trial, used to pick the loop count (default: {test.DEFAULT_MIN_TIME})", type=float, default=test.DEFAULT_MIN_TIME)
+    parser.add_argument("--max-time", help=f"stop repeating a size after this many seconds (default: {test.DEFAULT_MAX_TIME})", type=float, default=test.DEFAULT_MAX_TIME)
+    parser.add_argument("--checkpoint", metavar="DIR", help=f"directory where metrics and speed records are written as soon as they are measured (default: {DEFAULT_CHECKPOINT_DIR})", default=DEFAULT_CHECKPOINT_DIR)
+    parser.add_argument("--resume", help="keep the records of the interrupted run in the checkpoint directory and only measure the missing (func, test case) pairs", action="store_true")
+    parser.add_argument("--budget-per-call", metavar="SEC", help="in speed and vectorized mode, skip sizes whose predicted time per call (extrapolated from the smaller sizes) exceeds SEC", type=float, default=None)
+    parser.add_argument("--budget-total", metavar="SEC", help="in speed mode, skip sizes whose predicted measurement time would take an implementation over SEC in total", type=float, default=None)
+    parser.add_argument("--timeout", metavar="SEC", help="in speed mode, kill the measurement of a size after SEC (it runs in a forked process) and skip the larger sizes", type=float, default=None)
+    parser.add_argument("--workers", help="run each (implementation, suite) job in its own forked process, with correctness jobs in parallel on up to N pinned cores (default: 0, everything in this process)", type=int, default=0)
+    parser.add_argument("--speed-cores", metavar="LIST", help="comma-separated cores of the speed jobs with --workers (default: the last available core)", type=parse_cores, default=None)
+    parser.add_argument("--speed-layout", help="with --workers, run speed jobs one at a time on the first speed core (serial) or one per speed core in parallel (isolated) (default: serial)", choices=SPEED_LAYOUTS, default="serial")
     return parser.parse_args()
+
+
+def parse_cores(value: str) -> list[int]:
+    """Parse a core list like "2,3" or "4-7"."""
+    cores = []
+    for part in value.split(","):
+        start, _, end = part.partition("-")
+        cores.extend(range(int(start), int(end or start) + 1))
+    return cores
     
 
-def test_fft_metrics(testcase, verbose=True) -> pl.DataFrame:
+def checkpointed(checkpoint, kind, on_result=None):
+    """Record callback that writes each record to the checkpoint (if any) before passing it on to `on_result`."""
+    def on_record(record):
+        if checkpoint is not None:
+            checkpoint.write(kind, record)
+        if on_result is not None:
+            on_result(record)
+    return on_record
+
+
+def test_fft_metrics(testcase, verbose=True, reference_cache=None, runner=None, checkpoint=None, kind="metrics") -> pl.DataFrame:
     columns = ["func", "test_no", "input_size", "mae", "mse", "is_pass", "is_error"]
-    results = []
-    for name, func in fft_functions.items():
-        res = test.test_metrics(
+    # Share reference outputs across implementations (each one is computed once per run)
+    if reference_cache is None:
+        reference_cache = ReferenceCache(cache_dir=None)
+
+    def run_test(func, name, verbose, on_result=None):
+        # Call the real function, not the registry placeholder (which would add a dispatch to every call)
+        func = load_implementation(func)
+        return test.test_metrics(
             func, 
             testcase, 
             reference_func=scipy_fft, 
             name=name,
             verbose=verbose,
+            reference_cache=reference_cache,
+            on_result=checkpointed(checkpoint, kind, on_result),
+            skip=checkpoint.completed(kind, name) if checkpoint is not None else None,
         )
-        results.extend(res)
+
+    results = []
+    jobs = []
+    for name, func in fft_functions.items():
+        if checkpoint is not None:
+            results.extend(checkpoint.records(kind, name))
+        if runner is None:
+            results.extend(run_test(func, name, verbose))
+        else:
+            jobs.append(Job(f"metrics:{name}", "correctness", partial(run_test, func, name, False)))
+    if runner is not None:
+        results.extend(runner.run(jobs))
         
     results = [
         [x[y] for y in columns]
@@ -69,17 +167,58 @@ def test_fft_metrics(testcase, verbose=True) -> pl.DataFrame:
     
 
 
-def test_fft_speed(testcase, verbose=True) -> pl.DataFrame:
-    columns = ["func", "test_no", "input_size", "time_used_us", "time_per_bin_us", "is_error"]
-    results = []
-    for name, func in fft_functions.items():
+def test_fft_speed(testcase, verbose=True, repeat=test.DEFAULT_REPEAT, min_time=test.DEFAULT_MIN_TIME, max_time=test.DEFAULT_MAX_TIME, memory=False, dtype=np.complex128, runner=None, budget=None, checkpoint=None, kind="speed") -> pl.DataFrame:
+    memory_columns = ["peak_rss_delta_bytes", "tracemalloc_peak_bytes", "alloc_count", "bytes_per_point"]
+    columns = [
+        "func", "test_no", "input_size", "time_used_us", "time_per_bin_us", "gflops", "bandwidth_gbs",
+        *(memory_columns if memory else []),
+        "time_min_us", "time_median_us", "time_mean_us", "time_std_us", "time_iqr_us",
+        "time_ci_low_us", "time_ci_high_us", "loops", "repeats", "time_samples_us", "skip_reason", "is_error",
+    ]
+    # Warm up on the same precision as the test cases, so the right specialization is compiled
+    warmup_input = test_case.to_precision(np.random.rand(256) + 1j * np.random.rand(256), dtype)
+
+    def run_test(func, name, verbose, on_result=None):
+        # Call the real function, not the registry placeholder (which would add a dispatch to every call)
+        func = load_implementation(func)
+        on_result = checkpointed(checkpoint, kind, on_result)
+        done = checkpoint.completed(kind, name) if checkpoint is not None else set()
         res = test.test_speed(
             func, 
             testcase, 
             name=name,
             verbose=verbose,
+            repeat=repeat,
+            min_time=min_time,
+            max_time=max_time,
+            warmup_input=warmup_input,
+            budget=budget,
+            # With memory profiling, records are only complete once the memory columns are merged in
+            on_result=None if memory else on_result,
+            skip=done,
+            resumed=checkpoint.records(kind, name) if checkpoint is not None else None,
         )
-        results.extend(res)
+        if memory:
+            # Leave out the sizes skipped by the budget or measured before resuming
+            skipped = {row["test_no"] for row in res if row["skip_reason"] is not None} | done
+            mem_res = {row["test_no"]: row for row in test.test_memory(func, testcase, name=name, verbose=verbose, skip=skipped)}
+            for speed_row in res:
+                mem_row = mem_res[speed_row["test_no"]]
+                speed_row.update({col: mem_row[col] for col in memory_columns})
+                on_result(speed_row)
+        return res
+
+    results = []
+    jobs = []
+    for name, func in fft_functions.items():
+        if checkpoint is not None:
+            results.extend(checkpoint.records(kind, name))
+        if runner is None:
+            results.extend(run_test(func, name, verbose))
+        else:
+            jobs.append(Job(f"speed:{name}", "speed", partial(run_test, func, name, False), multithreaded=is_multithreaded(func)))
+    if runner is not None:
+        results.extend(runner.run(jobs))
         
     results = [
         [x[y] for y in columns]
@@ -88,6 +227,305 @@ def test_fft_speed(testcase, verbose=True) -> pl.DataFrame:
     return pl.DataFrame(results, schema=columns, orient="row")
 
 
+def add_float32_speedup(single_df: pl.DataFrame, double_df: pl.DataFrame, verbose=True) -> pl.DataFrame:
+    """Add `f32_speedup` (complex128 time / complex64 time) per (func, size) to the single-precision speed results."""
+    df = single_df.join(
+        double_df.select("func", "test_no", pl.col("time_used_us").alias("time_f64_us")),
+        on=["func", "test_no"],
+        how="left",
+    ).with_columns((pl.col("time_f64_us") / pl.col("time_used_us")).alias("f32_speedup"))
+
+    qprint("⚡ Float32 speedup over float64:", quiet=not verbose)
+    for row in df.filter(pl.col("f32_speedup").is_not_null()).iter_rows(named=True):
+        qprint(f"  {row['func']:<20} (size: {row['input_size']:>9}): {row['f32_speedup']:>5.2f}x", quiet=not verbose)
+    return df
+
+
+def test_fft_batch(testcase, verbose=True, repeat=test.DEFAULT_REPEAT, min_time=test.DEFAULT_MIN_TIME, max_time=test.DEFAULT_MAX_TIME) -> pl.DataFrame:
+    columns = ["func", "test_no", "batch_size", "input_size", "time_used_us", "time_per_transform_us", "transforms_per_sec", "is_error"]
+    batch_functions = {"scipy": scipy_fft}
+    for name in batch_fft_functions:
+        batch_functions[name] = load_implementation(get_batch_fft(name))
+        # Per-frame Python loop over the 1-D version, to show the dispatch overhead
+        if name in fft_functions:
+            batch_functions[f"{name}_loop"] = loop_batch(load_implementation(fft_functions[name]))
+
+    results = []
+    for name, func in batch_functions.items():
+        res = test.test_batch_speed(
+            func,
+            testcase,
+            name=name,
+            verbose=verbose,
+            repeat=repeat,
+            min_time=min_time,
+            max_time=max_time,
+        )
+        results.extend(res)
+
+    results = [
+        [x[y] for y in columns]
+        for x in sorted(results, key=lambda x: (x["func"], x["test_no"]))
+    ]
+    return pl.DataFrame(results, schema=columns, orient="row")
+
+
+def test_rfft(testcase, verbose=True, reference_cache=None, repeat=test.DEFAULT_REPEAT, min_time=test.DEFAULT_MIN_TIME, max_time=test.DEFAULT_MAX_TIME) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Validate real-input FFTs against scipy.fft.rfft, then time them against scipy.fft.rfft and the full complex path."""
+    metrics_columns = ["func", "test_no", "input_size", "mae", "mse", "is_pass", "is_error"]
+    speed_columns = ["func", "test_no", "input_size", "time_used_us", "time_per_bin_us", "time_iqr_us", "is_error"]
+    if reference_cache is None:
+        reference_cache = ReferenceCache(cache_dir=None)
+
+    real_functions = {"scipy_rfft": scipy_rfft, **{name: load_implementation(func) for name, func in rfft_functions.items()}}
+    complex_functions = {f"{name} (complex)": load_implementation(func) for name, func in fft_functions.items()}
+    warmup_input = np.random.rand(256)
+
+    metrics = []
+    for name, func in real_functions.items():
+        metrics.extend(test.test_metrics(func, testcase, reference_func=scipy_rfft, name=name, verbose=verbose, reference_cache=reference_cache))
+
+    speed = []
+    for name, func in {**real_functions, **complex_functions}.items():
+        speed.extend(test.test_speed(func, testcase, name=name, verbose=verbose, repeat=repeat, min_time=min_time, max_time=max_time, warmup_input=warmup_input))
+
+    metrics = [[x[y] for y in metrics_columns] for x in sorted(metrics, key=lambda x: (x["func"], x["test_no"]))]
+    speed = [[x[y] for y in speed_columns] for x in sorted(speed, key=lambda x: (x["func"], x["test_no"]))]
+    return (
+        pl.DataFrame(metrics, schema=metrics_columns, orient="row"),
+        pl.DataFrame(speed, schema=speed_columns, orient="row"),
+    )
+
+
+def test_radix_savings(testcase, verbose=True, repeat=test.DEFAULT_REPEAT, min_time=test.DEFAULT_MIN_TIME, max_time=test.DEFAULT_MAX_TIME) -> pl.DataFrame:
+    from fft_core.example import fft_numba, fft_radix4_numba
+
+    columns = ["func", "test_no", "input_size", "time_used_us", "flops", "flop_saving_pct", "time_saving_pct", "is_error"]
+    functions = {
+        "iterative_numba": (fft_numba.fft_iterative_numba, plan.nominal_flops),
+        "radix4_numba": (fft_radix4_numba.fft_radix4_numba, fft_radix4_numba.radix4_flops),
+        "split_radix_numba": (fft_radix4_numba.fft_split_radix_numba, fft_radix4_numba.split_radix_flops),
+    }
+    results = test.test_flop_savings(
+        functions,
+        testcase,
+        baseline="iterative_numba",
+        verbose=verbose,
+        repeat=repeat,
+        min_time=min_time,
+        max_time=max_time,
+    )
+    results = [
+        [x[y] for y in columns]
+        for x in sorted(results, key=lambda x: (x["func"], x["test_no"]))
+    ]
+    return pl.DataFrame(results, schema=columns, orient="row")
+
+
+def test_vectorized_speedup(testcase, verbose=True, repeat=test.DEFAULT_REPEAT, min_time=test.DEFAULT_MIN_TIME, max_time=test.DEFAULT_MAX_TIME, budget=None) -> pl.DataFrame:
+    from fft_core.example import fft_iterative, fft_numba
+
+    columns = ["func", "test_no", "input_size", "time_used_us", "speedup_vs_loop", "speedup_vs_numba", "skip_reason", "is_error"]
+    functions = {
+        "iterative": fft_iterative.fft_iterative,
+        "iterative_numpy": fft_iterative.fft_iterative_numpy,
+        "iterative_numba": fft_numba.fft_iterative_numba,
+    }
+    results = test.test_speedup(
+        functions,
+        testcase,
+        baselines={"speedup_vs_loop": "iterative", "speedup_vs_numba": "iterative_numba"},
+        verbose=verbose,
+        repeat=repeat,
+        min_time=min_time,
+        max_time=max_time,
+        # The loop version takes seconds per call from ~2^16 points on
+        budget=budget or test.TimeBudget(per_call=VECTORIZED_LOOP_BUDGET),
+    )
+    results = [
+        [x[y] for y in columns]
+        for x in sorted(results, key=lambda x: (x["func"], x["test_no"]))
+    ]
+    return pl.DataFrame(results, schema=columns, orient="row")
+
+
+def scipy_oaconvolve(path, h, output_path):
+    """Convolve the whole signal in memory with scipy.signal.oaconvolve."""
+    from scipy.signal import oaconvolve
+
+    oaconvolve(np.load(path), h).tofile(output_path)
+
+
+def stream_convolve(fft_name, method, path, h, output_path):
+    """Convolve the signal chunk by chunk with the streaming convolver."""
+    fft = fft_name if fft_name != "scipy" else fft_functions[fft_name]
+    with open(output_path, "wb") as f:
+        for block in convolution.convolve_stream(path, h, fft=fft, method=method):
+            block.tofile(f)
+
+
+def test_convolution(signal_size=CONVOLUTION_SIGNAL_SIZE, filter_lengths=CONVOLUTION_FILTER_LENGTHS, verbose=True, memory=True, repeat=test.DEFAULT_REPEAT, min_time=test.DEFAULT_MIN_TIME, max_time=test.DEFAULT_MAX_TIME) -> pl.DataFrame:
+    """Filter a signal on disk with scipy.signal.oaconvolve (loads it whole) and with the streaming convolver (chunk by chunk)."""
+    columns = ["func", "filter_len", "input_size", "time_used_us", "samples_per_sec", "peak_rss_delta_bytes", "tracemalloc_peak_bytes", "max_err", "is_error"]
+
+    # Module-level functions (and partials of them), so the memory profile can run them in an isolated process
+    conv_functions = {"scipy_oaconvolve": scipy_oaconvolve}
+    for fft_name in CONVOLUTION_FFTS:
+        conv_functions[f"{fft_name}_overlap_add"] = partial(stream_convolve, fft_name, "overlap_add")
+        conv_functions[f"{fft_name}_overlap_save"] = partial(stream_convolve, fft_name, "overlap_save")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        signal_path = Path(tmp_dir) / "signal.npy"
+        np.save(signal_path, test_case.get_case_rng("convolution", 0).standard_normal(signal_size))
+        results = test.test_convolution(
+            conv_functions,
+            signal_path,
+            filter_lengths,
+            Path(tmp_dir) / "output.bin",
+            verbose=verbose,
+            memory=memory,
+            repeat=repeat,
+            min_time=min_time,
+            max_time=max_time,
+        )
+
+    results = [
+        [x[y] for y in columns]
+        for x in sorted(results, key=lambda x: (x["func"], x["filter_len"]))
+    ]
+    return pl.DataFrame(results, schema=columns, orient="row")
+
+
+def test_round_trip(testcase, verbose=True, repeat=test.DEFAULT_REPEAT, min_time=test.DEFAULT_MIN_TIME, max_time=test.DEFAULT_MAX_TIME) -> pl.DataFrame:
+    columns = [
+        "func", "test_no", "input_size", "time_used_us", "time_per_bin_us",
+        "recon_max_err", "recon_rms_err", "ref_recon_max_err", "ifft_max_err", "is_pass", "is_error",
+    ]
+    round_trip_pairs = {
+        "scipy": (scipy_fft, scipy_ifft),
+        **{name: (load_implementation(fft_func), load_implementation(ifft_func)) for name, (fft_func, ifft_func) in get_round_trip_pairs().items()},
+    }
+
+    results = []
+    for name, (fft_func, ifft_func) in round_trip_pairs.items():
+        res = test.test_round_trip(
+            fft_func,
+            ifft_func,
+            testcase,
+            name=name,
+            verbose=verbose,
+            repeat=repeat,
+            min_time=min_time,
+            max_time=max_time,
+        )
+        results.extend(res)
+
+    results = [
+        [x[y] for y in columns]
+        for x in sorted(results, key=lambda x: (x["func"], x["test_no"]))
+    ]
+    return pl.DataFrame(results, schema=columns, orient="row")
+
+
+def test_thread_scaling(testcase, max_threads, verbose=True, repeat=test.DEFAULT_REPEAT, min_time=test.DEFAULT_MIN_TIME, max_time=test.DEFAULT_MAX_TIME) -> pl.DataFrame:
+    from fft_core.example import fft_numba
+
+    columns = ["func", "test_no", "input_size", "threads", "time_used_us", "speedup", "efficiency", "is_error"]
+    scaling_functions = {
+        "scipy": lambda x, threads: scipy_fft(x, workers=threads),
+        "parallel_numba": lambda x, threads: fft_numba.fft_parallel_numba(x, threads=threads),
+    }
+    thread_counts = test.get_thread_counts(max_threads)
+
+    results = []
+    for name, func in scaling_functions.items():
+        res = test.test_thread_scaling(
+            func,
+            testcase,
+            thread_counts,
+            name=name,
+            verbose=verbose,
+            repeat=repeat,
+            min_time=min_time,
+            max_time=max_time,
+        )
+        results.extend(res)
+
+    results = [
+        [x[y] for y in columns]
+        for x in sorted(results, key=lambda x: (x["func"], x["test_no"], x["threads"]))
+    ]
+    return pl.DataFrame(results, schema=columns, orient="row")
+
+
+def test_plan_cost(testcase, verbose=True, repeat=test.DEFAULT_REPEAT, min_time=test.DEFAULT_MIN_TIME, max_time=test.DEFAULT_MAX_TIME) -> pl.DataFrame:
+    from fft_core.example import fft_numba
+
+    columns = ["func", "test_no", "input_size", "plan_build_us", "execute_us", "break_even_calls", "is_error"]
+    results = test.test_plan_cost(
+        lambda n: plan.build_plan(n, np.complex128),
+        fft_numba.fft_execute,
+        testcase,
+        name="iterative_numba",
+        verbose=verbose,
+        repeat=repeat,
+        min_time=min_time,
+        max_time=max_time,
+    )
+    results = [[x[y] for y in columns] for x in results]
+    return pl.DataFrame(results, schema=columns, orient="row")
+
+
+def test_fft_stages(testcase, verbose=True, repeat=test.DEFAULT_REPEAT, min_time=test.DEFAULT_MIN_TIME) -> pl.DataFrame:
+    columns = ["func", "test_no", "input_size", "stage_no", "stage", "span", "time_us", "share_pct", "bandwidth_gbs", "trials", "is_error"]
+    results = []
+    for name, profiler in stage_profilers.items():
+        results.extend(test.test_stages(load_implementation(profiler), testcase, name=name, verbose=verbose, repeat=repeat, min_time=min_time))
+
+    results = [
+        [x[y] for y in columns]
+        for x in sorted(results, key=lambda x: (x["func"], x["test_no"], x["stage_no"] or 0))
+    ]
+    return pl.DataFrame(results, schema=columns, orient="row")
+
+
+def test_fft_steady_state(testcase, verbose=True, repeat=test.DEFAULT_REPEAT, min_time=test.DEFAULT_MIN_TIME, max_time=test.DEFAULT_MAX_TIME) -> pl.DataFrame:
+    columns = ["func", "test_no", "input_size", "time_alloc_us", "time_out_us", "saving_pct", "heap_alloc_bytes", "heap_out_bytes", "is_error"]
+    results = []
+    for name, func in fft_functions.items():
+        if supports_out(func):
+            results.extend(test.test_steady_state(load_implementation(func), testcase, name=name, verbose=verbose, repeat=repeat, min_time=min_time, max_time=max_time))
+
+    results = [
+        [x[y] for y in columns]
+        for x in sorted(results, key=lambda x: (x["func"], x["test_no"]))
+    ]
+    return pl.DataFrame(results, schema=columns, orient="row")
+
+
+def test_startup(repeat=test.DEFAULT_REPEAT, verbose=True) -> pl.DataFrame:
+    columns = ["func", "time_min_ms", "time_median_ms", "time_max_ms", "repeats", "is_error"]
+    results = test.test_startup(STARTUP_COMMANDS, repeat=repeat, verbose=verbose, cwd=Path(__file__).parent)
+    results = [[x[y] for y in columns] for x in results]
+    return pl.DataFrame(results, schema=columns, orient="row")
+
+
+def test_cold_start(repeat=test.DEFAULT_REPEAT, verbose=True) -> pl.DataFrame:
+    columns = ["func", "input_size", "fft_core_ms", "import_ms", "cold_import_ms", "compile_ms", "cache_load_ms", "steady_call_ms", "repeats", "is_error"]
+    implementations = {}
+    for name, func in fft_functions.items():
+        if name == "scipy":
+            continue
+        implementations[name] = (name, {})
+        # Engines with explicit signatures can also compile on import instead (see fft_numba.precompile)
+        if func.__module__ == "fft_core.example.fft_numba":
+            implementations[f"{name} (eager)"] = (name, {"FFT_NUMBA_EAGER": "1"})
+
+    results = test.test_cold_start(implementations, n=COLD_START_SIZE, repeat=repeat, verbose=verbose, cwd=Path(__file__).parent)
+    results = [[x[y] for y in columns] for x in results]
+    return pl.DataFrame(results, schema=columns, orient="row")
+
+
 if __name__ == "__main__":
     # Handle args
     args = get_args()
@@ -104,12 +542,62 @@ if __name__ == "__main__":
     
     metrics_df = None
     speed_df = None
+    plan_df = None
+    batch_df = None
+    real_metrics_df = None
+    real_speed_df = None
+    radix_df = None
+    scaling_df = None
+    round_trip_df = None
+    convolution_df = None
+    startup_df = None
+    cold_start_df = None
+    stages_df = None
+    steady_state_df = None
+    vectorized_df = None
 
+    # Test cases
+    test_case.set_seed(args.seed)
+    if args.corpus:
+        metrics_cases = corpus.load_corpus(args.corpus, max_size=METRICS_MAX_SIZE)
+        speed_cases = corpus.load_corpus(args.corpus)
+    else:
+        metrics_cases = test_case.get_combined_test_cases()
+        speed_cases = SPEED_SUITES[args.speed_suite]()
+    is_single = args.dtype == "complex64"
+    if is_single:
+        metrics_cases = metrics_cases.astype(args.dtype)
     
-    # Warm up
-    qprint(quiet=is_quiet)
-    qprint("Warming up...", quiet=is_quiet)
-    test_fft_metrics(test_case.get_simple_test_cases(), verbose=False)
+    reference_cache = ReferenceCache(cache_dir=None if args.no_ref_cache else args.ref_cache)
+    checkpoint = None
+    if args.mode in ["metrics", "speed", "all"]:
+        checkpoint_config = {
+            "dtype": args.dtype,
+            "speed_suite": args.speed_suite,
+            "corpus": str(Path(args.corpus).resolve()) if args.corpus else None,
+            "seed": args.seed,
+            "memory": args.memory,
+        }
+        try:
+            checkpoint = Checkpoint(args.checkpoint, checkpoint_config, resume=args.resume)
+        except ValueError as e:
+            colored_print(f"💥 {e}", color="RED")
+            exit(1)
+        if args.resume:
+            done = sum(len(checkpoint.records(kind)) for kind in ["metrics", "speed", "speed_complex128"])
+            qprint(f"Resuming from '{args.checkpoint}': {done} records already measured", quiet=is_quiet)
+
+    budget = None
+    if any(limit is not None for limit in (args.budget_per_call, args.budget_total, args.timeout)):
+        budget = test.TimeBudget(per_call=args.budget_per_call, total=args.budget_total, timeout=args.timeout)
+    runner = BenchmarkRunner(workers=args.workers, speed_cores=args.speed_cores, speed_layout=args.speed_layout, verbose=is_verbose) if args.workers > 0 else None
+    
+    # Warm up (workers warm up on their own: starting Numba's parallel threading layer here before
+    # forking them can hang this process at exit)
+    if runner is None:
+        qprint(quiet=is_quiet)
+        qprint("Warming up...", quiet=is_quiet)
+        test_fft_metrics(test_case.get_simple_test_cases(), verbose=False, reference_cache=reference_cache)
     
     # Test metrics
     if args.mode in ["metrics", "all"]:
@@ -117,7 +605,11 @@ if __name__ == "__main__":
         qprint("Testing metrics...", quiet=is_quiet)
         qprint(quiet=is_quiet)
         
-        metrics_df = test_fft_metrics(test_case.get_combined_test_cases(), verbose=is_verbose)
+        metrics_df = test_fft_metrics(metrics_cases, verbose=is_verbose, reference_cache=reference_cache, runner=runner, checkpoint=checkpoint)
+        # Worker processes update their own copies of the cache statistics
+        if runner is None:
+            stats = reference_cache.stats
+            qprint(f"Reference cache: {stats['misses']} computed, {stats['disk_hits']} loaded from disk, {stats['memory_hits']} from memory", quiet=is_quiet)
         if args.table:
             with pl.Config(tbl_rows=-1):
                 qprint("Metrics", quiet=args.minimal)
@@ -128,12 +620,252 @@ if __name__ == "__main__":
         qprint(quiet=is_quiet)
         qprint("Testing speed...", quiet=is_quiet)
         qprint(quiet=is_quiet)
-        speed_df = test_fft_speed(test_case.get_massive_test_cases(), verbose=is_verbose)
+        speed_df = test_fft_speed(
+            speed_cases.astype(args.dtype) if is_single else speed_cases,
+            verbose=is_verbose,
+            repeat=args.repeat,
+            min_time=args.min_time,
+            max_time=args.max_time,
+            memory=args.memory,
+            dtype=args.dtype,
+            runner=runner,
+            budget=budget,
+            checkpoint=checkpoint,
+        )
+        if is_single:
+            qprint(quiet=is_quiet)
+            qprint("Testing speed (complex128 baseline)...", quiet=is_quiet)
+            qprint(quiet=is_quiet)
+            double_df = test_fft_speed(
+                speed_cases,
+                verbose=is_verbose,
+                repeat=args.repeat,
+                min_time=args.min_time,
+                max_time=args.max_time,
+                runner=runner,
+                budget=budget,
+                checkpoint=checkpoint,
+                kind="speed_complex128",
+            )
+            speed_df = add_float32_speedup(speed_df, double_df, verbose=is_verbose)
         if args.table:
             with pl.Config(tbl_rows=-1):
                 qprint("Speed", quiet=args.minimal)
                 qprint(speed_df, quiet=args.minimal)
                 
+    if runner is not None and runner.failures:
+        qprint(quiet=is_quiet)
+        colored_print(f"⚠️  {len(runner.failures)} job(s) failed, their results are missing or partial:", color="YELLOW")
+        for name, reason in runner.failures:
+            colored_print(f"  {name}: {reason}", color="YELLOW")
+                
+    # Test plan-build vs execute cost
+    if args.mode == "plan":
+        qprint(quiet=is_quiet)
+        qprint("Testing plan cost...", quiet=is_quiet)
+        qprint(quiet=is_quiet)
+        plan_df = test_plan_cost(
+            test_case.get_large_test_cases_extended(),
+            verbose=is_verbose,
+            repeat=args.repeat,
+            min_time=args.min_time,
+            max_time=args.max_time,
+        )
+        if args.table:
+            with pl.Config(tbl_rows=-1):
+                qprint("Plan", quiet=args.minimal)
+                qprint(plan_df, quiet=args.minimal)
+
+    # Test batch throughput
+    if args.mode == "batch":
+        qprint(quiet=is_quiet)
+        qprint("Testing batch throughput...", quiet=is_quiet)
+        qprint(quiet=is_quiet)
+        batch_df = test_fft_batch(
+            test_case.get_batch_test_cases(),
+            verbose=is_verbose,
+            repeat=args.repeat,
+            min_time=args.min_time,
+            max_time=args.max_time,
+        )
+        if args.table:
+            with pl.Config(tbl_rows=-1):
+                qprint("Batch", quiet=args.minimal)
+                qprint(batch_df, quiet=args.minimal)
+
+    # Test real-input FFTs
+    if args.mode == "real":
+        qprint(quiet=is_quiet)
+        qprint("Testing real-input FFTs...", quiet=is_quiet)
+        qprint(quiet=is_quiet)
+        real_cases = corpus.load_corpus(args.corpus, kinds=["real"]) if args.corpus else test_case.get_real_test_cases()
+        real_metrics_df, real_speed_df = test_rfft(
+            real_cases,
+            verbose=is_verbose,
+            reference_cache=reference_cache,
+            repeat=args.repeat,
+            min_time=args.min_time,
+            max_time=args.max_time,
+        )
+        if args.table:
+            with pl.Config(tbl_rows=-1):
+                qprint("Real metrics", quiet=args.minimal)
+                qprint(real_metrics_df, quiet=args.minimal)
+                qprint("Real speed", quiet=args.minimal)
+                qprint(real_speed_df, quiet=args.minimal)
+
+    # Test flop-count savings of Radix-4 / Split-Radix
+    if args.mode == "radix":
+        qprint(quiet=is_quiet)
+        qprint("Testing Radix-4 / Split-Radix savings...", quiet=is_quiet)
+        qprint(quiet=is_quiet)
+        radix_df = test_radix_savings(
+            test_case.get_large_test_cases_extended(),
+            verbose=is_verbose,
+            repeat=args.repeat,
+            min_time=args.min_time,
+            max_time=args.max_time,
+        )
+        if args.table:
+            with pl.Config(tbl_rows=-1):
+                qprint("Radix", quiet=args.minimal)
+                qprint(radix_df, quiet=args.minimal)
+
+    # Test multi-threaded scaling
+    if args.mode == "scaling":
+        qprint(quiet=is_quiet)
+        qprint(f"Testing thread scaling (1..{args.threads} threads)...", quiet=is_quiet)
+        qprint(quiet=is_quiet)
+        scaling_df = test_thread_scaling(
+            test_case.get_parallel_test_cases(),
+            args.threads,
+            verbose=is_verbose,
+            repeat=args.repeat,
+            min_time=args.min_time,
+            max_time=args.max_time,
+        )
+        if args.table:
+            with pl.Config(tbl_rows=-1):
+                qprint("Scaling", quiet=args.minimal)
+                qprint(scaling_df, quiet=args.minimal)
+
+    # Test inverse FFTs: ifft(fft(x))
+    if args.mode == "roundtrip":
+        qprint(quiet=is_quiet)
+        qprint("Testing round trips...", quiet=is_quiet)
+        qprint(quiet=is_quiet)
+        round_trip_cases = test_case.get_large_test_cases_extended()
+        round_trip_df = test_round_trip(
+            round_trip_cases.astype(args.dtype) if is_single else round_trip_cases,
+            verbose=is_verbose,
+            repeat=args.repeat,
+            min_time=args.min_time,
+            max_time=args.max_time,
+        )
+        if args.table:
+            with pl.Config(tbl_rows=-1):
+                qprint("Round trip", quiet=args.minimal)
+                qprint(round_trip_df, quiet=args.minimal)
+
+    # Test streaming convolution
+    if args.mode == "convolution":
+        qprint(quiet=is_quiet)
+        qprint("Testing streaming convolution...", quiet=is_quiet)
+        qprint(quiet=is_quiet)
+        convolution_df = test_convolution(
+            verbose=is_verbose,
+            repeat=args.repeat,
+            min_time=args.min_time,
+            max_time=args.max_time,
+        )
+        if args.table:
+            with pl.Config(tbl_rows=-1):
+                qprint("Convolution", quiet=args.minimal)
+                qprint(convolution_df, quiet=args.minimal)
+
+    # Test startup time
+    if args.mode == "startup":
+        qprint(quiet=is_quiet)
+        qprint("Testing startup time...", quiet=is_quiet)
+        qprint(quiet=is_quiet)
+        startup_df = test_startup(repeat=args.repeat, verbose=is_verbose)
+        if args.table:
+            with pl.Config(tbl_rows=-1):
+                qprint("Startup", quiet=args.minimal)
+                qprint(startup_df, quiet=args.minimal)
+
+    # Test cold start (JIT compile and cache load)
+    if args.mode == "coldstart":
+        qprint(quiet=is_quiet)
+        qprint("Testing cold start...", quiet=is_quiet)
+        qprint(quiet=is_quiet)
+        cold_start_df = test_cold_start(repeat=args.repeat, verbose=is_verbose)
+        if args.table:
+            with pl.Config(tbl_rows=-1, tbl_cols=-1):
+                qprint("Cold start", quiet=args.minimal)
+                qprint(cold_start_df, quiet=args.minimal)
+
+    # Test per-stage timing
+    if args.mode == "stages":
+        qprint(quiet=is_quiet)
+        qprint("Testing stages...", quiet=is_quiet)
+        qprint(quiet=is_quiet)
+        stages_df = test_fft_stages(
+            speed_cases.astype(args.dtype) if is_single else speed_cases,
+            verbose=is_verbose,
+            repeat=args.repeat,
+            min_time=args.min_time,
+        )
+        if args.table:
+            with pl.Config(tbl_rows=-1):
+                qprint("Stages", quiet=args.minimal)
+                qprint(stages_df, quiet=args.minimal)
+
+    # Test allocation-free steady-state calls
+    if args.mode == "steadystate":
+        qprint(quiet=is_quiet)
+        qprint("Testing steady state...", quiet=is_quiet)
+        qprint(quiet=is_quiet)
+        steady_state_df = test_fft_steady_state(
+            speed_cases.astype(args.dtype) if is_single else speed_cases,
+            verbose=is_verbose,
+            repeat=args.repeat,
+            min_time=args.min_time,
+            max_time=args.max_time,
+        )
+        if args.table:
+            with pl.Config(tbl_rows=-1):
+                qprint("Steady state", quiet=args.minimal)
+                qprint(steady_state_df, quiet=args.minimal)
+
+    # Test the vectorized NumPy engine against the loop version and Numba
+    if args.mode == "vectorized":
+        qprint(quiet=is_quiet)
+        qprint("Testing vectorized NumPy iterative FFT...", quiet=is_quiet)
+        qprint(quiet=is_quiet)
+        vectorized_df = test_vectorized_speedup(
+            test_case.get_large_test_cases_extended(),
+            verbose=is_verbose,
+            repeat=args.repeat,
+            min_time=args.min_time,
+            max_time=args.max_time,
+            budget=budget,
+        )
+        if args.table:
+            with pl.Config(tbl_rows=-1):
+                qprint("Vectorized", quiet=args.minimal)
+                qprint(vectorized_df, quiet=args.minimal)
+
+    # Record the run in the history
+    if args.history and speed_df is not None:
+        run_metadata = history.get_run_metadata(
+            dtype=args.dtype,
+            speed_suite="corpus" if args.corpus else args.speed_suite,
+            seed=args.seed,
+        )
+        run_path = history.record_run(speed_df, run_metadata, args.history)
+        colored_print(f"\n📚 Recorded run '{run_metadata['run_id']}' in {run_path}", color="CYAN")
+
     # Save to CSV
     if args.save_csv:
         print("\n🗂️  Saving results…")
@@ -173,3 +905,68 @@ if __name__ == "__main__":
                 func_path = speed_dir / f"{func}_speed.csv"
                 csv_utils.df_to_csv(func_df, func_path)
                 colored_print(f"  💾  Saved {func:<20} speed to {func_path}", color="CYAN")
+
+        if plan_df is not None:
+            combined_plan = base_dir / "plan.csv"
+            csv_utils.df_to_csv(plan_df, combined_plan)
+            colored_print(f"  💾  Saved {'combined':<20} plan to {combined_plan}", color="CYAN")
+
+        if batch_df is not None:
+            combined_batch = base_dir / "batch.csv"
+            csv_utils.df_to_csv(batch_df, combined_batch)
+            colored_print(f"  💾  Saved {'combined':<20} batch to {combined_batch}", color="CYAN")
+
+        if convolution_df is not None:
+            combined_convolution = base_dir / "convolution.csv"
+            csv_utils.df_to_csv(convolution_df, combined_convolution)
+            colored_print(f"  💾  Saved {'combined':<20} convolution to {combined_convolution}", color="CYAN")
+
+        if startup_df is not None:
+            combined_startup = base_dir / "startup.csv"
+            csv_utils.df_to_csv(startup_df, combined_startup)
+            colored_print(f"  💾  Saved {'combined':<20} startup to {combined_startup}", color="CYAN")
+
+        if stages_df is not None:
+            combined_stages = base_dir / "stages.csv"
+            csv_utils.df_to_csv(stages_df, combined_stages)
+            colored_print(f"  💾  Saved {'combined':<20} stages to {combined_stages}", color="CYAN")
+
+        if steady_state_df is not None:
+            combined_steady_state = base_dir / "steadystate.csv"
+            csv_utils.df_to_csv(steady_state_df, combined_steady_state)
+            colored_print(f"  💾  Saved {'combined':<20} steady state to {combined_steady_state}", color="CYAN")
+
+        if vectorized_df is not None:
+            combined_vectorized = base_dir / "vectorized.csv"
+            csv_utils.df_to_csv(vectorized_df, combined_vectorized)
+            colored_print(f"  💾  Saved {'combined':<20} vectorized to {combined_vectorized}", color="CYAN")
+
+        if cold_start_df is not None:
+            combined_cold_start = base_dir / "coldstart.csv"
+            csv_utils.df_to_csv(cold_start_df, combined_cold_start)
+            colored_print(f"  💾  Saved {'combined':<20} cold start to {combined_cold_start}", color="CYAN")
+
+        if round_trip_df is not None:
+            combined_round_trip = base_dir / "roundtrip.csv"
+            csv_utils.df_to_csv(round_trip_df, combined_round_trip)
+            colored_print(f"  💾  Saved {'combined':<20} round trip to {combined_round_trip}", color="CYAN")
+
+        if scaling_df is not None:
+            combined_scaling = base_dir / "scaling.csv"
+            csv_utils.df_to_csv(scaling_df, combined_scaling)
+            colored_print(f"  💾  Saved {'combined':<20} scaling to {combined_scaling}", color="CYAN")
+
+        if radix_df is not None:
+            combined_radix = base_dir / "radix.csv"
+            csv_utils.df_to_csv(radix_df, combined_radix)
+            colored_print(f"  💾  Saved {'combined':<20} radix to {combined_radix}", color="CYAN")
+
+        if real_metrics_df is not None:
+            combined_real = base_dir / "real_metrics.csv"
+            csv_utils.df_to_csv(real_metrics_df, combined_real)
+            colored_print(f"  💾  Saved {'combined':<20} real metrics to {combined_real}", color="CYAN")
+
+        if real_speed_df is not None:
+            combined_real = base_dir / "real_speed.csv"
+            csv_utils.df_to_csv(real_speed_df, combined_real)
+            colored_print(f"  💾  Saved {'combined':<20} real speed to {combined_real}", color="CYAN")
@@ -0,0 +1,38 @@
+"""This script tunes the FFT dispatcher: it benchmarks the registered implementations per size and dtype and stores the winners as wisdom."""
+
+import argparse
+
+import fft_core  # noqa: F401  (registers the implementations)
+from fft_core.selection import DEFAULT_WISDOM_PATH, FFTPlanner
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-w", "--wisdom", help=f"wisdom file (default: {DEFAULT_WISDOM_PATH}, or $FFT_WISDOM_PATH)", default=DEFAULT_WISDOM_PATH)
+parser.add_argument("--min-exp", help="smallest size as a power of 2 (default: 1)", type=int, default=1)
+parser.add_argument("--max-exp", help="largest size as a power of 2 (default: 20)", type=int, default=20)
+parser.add_argument("--sizes", help="tune these sizes instead of the power-of-2 range", type=int, nargs="+", default=None)
+parser.add_argument("--dtypes", help="input dtypes to tune (default: complex128)", nargs="+", choices=["complex128", "complex64", "float64", "float32"], default=["complex128"])
+parser.add_argument("-r", "--repeat", help="timed trials per implementation (default: 5)", type=int, default=5)
+parser.add_argument("--min-time", help="minimum seconds per trial (default: 0.01)", type=float, default=0.01)
+parser.add_argument("--force", help="retune sizes that already have valid wisdom", action="store_true")
+parser.add_argument("--forget", help="delete the wisdom of the selected sizes and dtypes instead of tuning", action="store_true")
+args = parser.parse_args()
+
+planner = FFTPlanner(args.wisdom, repeat=args.repeat, min_time=args.min_time)
+sizes = args.sizes or [2**x for x in range(args.min_exp, args.max_exp + 1)]
+
+if args.forget:
+    for dtype in args.dtypes:
+        for n in sizes:
+            planner.invalidate(n, dtype, save=False)
+    planner.save_wisdom()
+    print(f"Forgot wisdom for {len(sizes)} sizes x {len(args.dtypes)} dtypes in '{args.wisdom}'.")
+    exit(0)
+
+print(f"Tuning {len(sizes)} sizes x {len(args.dtypes)} dtypes into '{args.wisdom}'...")
+for dtype in args.dtypes:
+    for n in sizes:
+        best = planner.tune(n, dtype, save=False) if args.force else planner.best(n, dtype)
+        entry = planner.wisdom["entries"][planner.wisdom_key(n, dtype)]
+        print(f"  🏁 {dtype:<10} {n:>9}: {best:<20} {entry['timings_us'][best]:>12.2f} µs")
+    planner.save_wisdom()
+print("Done.")
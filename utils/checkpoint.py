@@ -0,0 +1,105 @@
+"""Crash-safe checkpoint of benchmark records, written one record at a time, for resuming interrupted runs."""
+
+import json
+import os
+import re
+from pathlib import Path
+
+import polars as pl
+
+DEFAULT_CHECKPOINT_DIR = Path("results") / "checkpoint"
+CONFIG_FILE = "config.json"
+
+
+class Checkpoint:
+    """
+    Streaming result sink: every finished (func, test_no) record is written to disk as soon as
+    it is produced, as its own Arrow IPC part file `{kind}/{func}-{test_no}.arrow`.
+
+    Part files are written to a temporary name and renamed, so a run killed at any point leaves
+    only complete records behind. With `resume`, the records of the previous run are loaded
+    (except error records, which are measured again) and `completed` tells which test cases to
+    skip; otherwise the checkpoint files are deleted. A directory that exists without a
+    checkpoint `config.json` is never cleared: it raises a ValueError instead.
+    Part files can be written from several processes at once (e.g. runner workers).
+
+    Parameters:
+        directory (str | Path): Checkpoint directory.
+        config (dict): Settings the records depend on (e.g. dtype, suite, seed). Resuming
+            a checkpoint written with other settings raises a ValueError.
+        resume (bool): Keep and load the records of the previous run.
+
+    Example:
+        >>> checkpoint = Checkpoint("results/checkpoint", {"seed": 0}, resume=True)
+        >>> checkpoint.completed("speed", "scipy")
+        {1, 2, 3}
+        >>> checkpoint.write("speed", record)
+    """
+
+    def __init__(self, directory: str | Path = DEFAULT_CHECKPOINT_DIR, config: dict | None = None, resume: bool = False):
+        self.directory = Path(directory)
+        self.config = config or {}
+        self._records = {}  # kind -> records of the previous run
+
+        config_path = self.directory / CONFIG_FILE
+        if resume and config_path.exists():
+            saved = json.loads(config_path.read_text())
+            if saved != self.config:
+                changed = sorted(key for key in saved.keys() | self.config.keys() if saved.get(key) != self.config.get(key))
+                raise ValueError(f"Checkpoint in '{self.directory}' was written with other settings ({', '.join(changed)}), rerun without --resume")
+            for kind_dir in sorted(p for p in self.directory.iterdir() if p.is_dir()):
+                self._records[kind_dir.name] = [record for record in self._load(kind_dir) if not record.get("is_error")]
+        elif config_path.exists():
+            self._clear()
+        elif self.directory.exists() and any(self.directory.iterdir()):
+            raise ValueError(f"'{self.directory}' is not empty and holds no checkpoint ({CONFIG_FILE}), refusing to clear it: choose another checkpoint directory")
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        config_path.write_text(json.dumps(self.config, indent=2))
+
+    def _clear(self):
+        # Only what `write` creates: part files (and leftover temporary files) in the kind
+        # directories, the directories once empty, and the config
+        for kind_dir in (p for p in self.directory.iterdir() if p.is_dir()):
+            for path in [*kind_dir.glob("*.arrow"), *kind_dir.glob("*.tmp")]:
+                path.unlink()
+            if not any(kind_dir.iterdir()):
+                kind_dir.rmdir()
+        (self.directory / CONFIG_FILE).unlink()
+
+    @staticmethod
+    def _load(kind_dir: Path) -> list[dict]:
+        frames = []
+        for path in sorted(kind_dir.glob("*.arrow")):
+            try:
+                frames.append(pl.read_ipc(path))
+            except (OSError, pl.exceptions.PolarsError):
+                continue  # unreadable leftover, the record is measured again
+        if not frames:
+            return []
+        return pl.concat(frames, how="diagonal_relaxed").to_dicts()
+
+    def records(self, kind: str, func: str | None = None) -> list[dict]:
+        """
+        Records of the previous run (all of them, or those of `func`), without error records.
+        """
+        records = self._records.get(kind, [])
+        return [record for record in records if func is None or record["func"] == func]
+
+    def completed(self, kind: str, func: str) -> set[int]:
+        """
+        Test numbers of `func` that the previous run finished without an error.
+        """
+        return {record["test_no"] for record in self.records(kind, func)}
+
+    def write(self, kind: str, record: dict):
+        """
+        Append one record (a dict with at least `func` and `test_no`).
+        """
+        kind_dir = self.directory / kind
+        kind_dir.mkdir(exist_ok=True)
+        func = re.sub(r"[^\w.-]", "_", str(record["func"]))
+        path = kind_dir / f"{func}-{record['test_no']:05d}.arrow"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        pl.DataFrame([record]).write_ipc(tmp_path)
+        os.replace(tmp_path, path)
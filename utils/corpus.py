@@ -0,0 +1,131 @@
+"""Seeded on-disk test corpus, opened with memory mapping for zero-copy access."""
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from .test_case import DEFAULT_SEED, LazyTestCases, get_case_rng, signal_builders
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _entry_name(kind: str, size: int) -> str:
+    return f"{kind}_{size}.npy"
+
+
+def read_manifest(corpus_dir: str | Path) -> dict:
+    """
+    Read the manifest of a corpus directory.
+
+    Raises:
+        FileNotFoundError: If the directory has no manifest (i.e. it was not built with `build_corpus`).
+    """
+    with open(Path(corpus_dir) / MANIFEST_NAME) as f:
+        return json.load(f)
+
+
+def build_corpus(corpus_dir: str | Path, sizes: list[int], kinds: list[str] | None = None, seed: int = DEFAULT_SEED, overwrite: bool = False, verbose: bool = False) -> dict:
+    """
+    Write seeded test signals to `.npy` files and record them in a manifest.
+
+    Each signal is generated from (seed, kind, size), so the same arguments always produce
+    the same corpus. Files that are already listed in the manifest with the same seed, dtype
+    and size are kept (the corpus is built once and extended incrementally).
+
+    Parameters:
+        corpus_dir (str | Path): Output directory.
+        sizes (list[int]): Signal lengths.
+        kinds (list[str] | None): Signal kinds from `test_case.signal_builders`. Defaults to all.
+        seed (int): Base seed.
+        overwrite (bool): Regenerate files even if the manifest already lists them.
+        verbose (bool): Print each file as it is written.
+
+    Returns:
+        dict: The manifest, also written to `corpus_dir/manifest.json`.
+
+    Example:
+        >>> build_corpus("corpus", [2**x for x in range(1, 28)], seed=0)
+    """
+    corpus_dir = Path(corpus_dir)
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    kinds = list(signal_builders) if kinds is None else kinds
+
+    unknown = set(kinds) - set(signal_builders)
+    if unknown:
+        raise ValueError(f"Unknown signal kinds: {sorted(unknown)}")
+
+    try:
+        existing = {entry["file"]: entry for entry in read_manifest(corpus_dir)["entries"]}
+    except FileNotFoundError:
+        existing = {}
+
+    for kind in kinds:
+        for size in sizes:
+            file_name = _entry_name(kind, size)
+            old = existing.get(file_name)
+            if not overwrite and old and old["seed"] == seed and (corpus_dir / file_name).exists():
+                continue
+
+            x = signal_builders[kind](size, get_case_rng(kind, size, seed=seed))
+            np.save(corpus_dir / file_name, x)
+            existing[file_name] = {
+                "file": file_name,
+                "kind": kind,
+                "size": size,
+                "dtype": x.dtype.name,
+                "seed": seed,
+            }
+            if verbose:
+                print(f"  💾  Wrote {file_name} ({x.nbytes / 1024**2:.1f} MiB)")
+            del x
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "entries": sorted(existing.values(), key=lambda e: (e["kind"], e["size"])),
+    }
+    tmp_path = corpus_dir / f"{MANIFEST_NAME}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, corpus_dir / MANIFEST_NAME)
+    return manifest
+
+
+def _load_entry(path: Path, rng: np.random.Generator) -> np.ndarray:
+    return np.load(path, mmap_mode="r")
+
+
+def load_corpus(corpus_dir: str | Path, kinds: list[str] | None = None, min_size: int | None = None, max_size: int | None = None) -> LazyTestCases:
+    """
+    Open a corpus as lazily loaded, read-only memory-mapped test cases.
+
+    Cases are ordered by kind, then size. Nothing is read until iteration reaches a case,
+    and pages are only loaded as an implementation touches them.
+
+    Raises:
+        FileNotFoundError: If the manifest or one of its files is missing.
+    """
+    corpus_dir = Path(corpus_dir)
+    entries = read_manifest(corpus_dir)["entries"]
+
+    paths = []
+    for entry in entries:
+        if kinds is not None and entry["kind"] not in kinds:
+            continue
+        if min_size is not None and entry["size"] < min_size:
+            continue
+        if max_size is not None and entry["size"] > max_size:
+            continue
+        path = corpus_dir / entry["file"]
+        if not path.exists():
+            raise FileNotFoundError(f"Corpus file listed in manifest is missing: {path}")
+        paths.append(path)
+
+    return LazyTestCases(f"corpus:{corpus_dir}", _load_entry, paths)
+
+
+if __name__ == "__main__":
+    manifest = build_corpus("corpus_demo", [2**x for x in range(1, 5)], verbose=True)
+    print([x.shape for x in load_corpus("corpus_demo")])
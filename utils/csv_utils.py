@@ -33,6 +33,7 @@ def df_to_csv(df: pl.DataFrame | pd.DataFrame, path: str | Path) -> None:
         df (pl.DataFrame | pd.DataFrame): The DataFrame to save.
             - If a Pandas DataFrame is provided, it will be converted to Polars.
         path (str | Path): Destination file path. Parent directories will be created if needed.
+            List columns (e.g. per-trial times) are written as ';'-separated values.
     
     Example:
         >>> df = pd.DataFrame({"x": [1, 2], "y": [3, 4]})
@@ -41,6 +42,12 @@ def df_to_csv(df: pl.DataFrame | pd.DataFrame, path: str | Path) -> None:
     if isinstance(df, pd.DataFrame):
         df = pl.from_pandas(df)
 
+    # CSV has no nested types
+    df = df.with_columns(
+        pl.col(name).cast(pl.List(pl.String)).list.join(";")
+        for name, dtype in df.schema.items() if isinstance(dtype, pl.List)
+    )
+
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     df.write_csv(str(path))
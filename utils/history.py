@@ -0,0 +1,197 @@
+"""Append-only benchmark history (one Parquet file per run) and regression detection between runs."""
+
+import os
+import platform
+import subprocess
+import sys
+import uuid
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+
+import polars as pl
+
+from .stats import bootstrap_ratio_ci, mann_whitney_min_p, mann_whitney_slower
+
+DEFAULT_HISTORY_DIR = Path("results") / "history"
+TRACKED_PACKAGES = ("numpy", "scipy", "numba", "polars")
+COMPARE_METHODS = ("mannwhitney", "bootstrap")
+
+# Columns of every history row besides the run metadata
+TIMING_COLUMNS = ["func", "test_no", "input_size", "time_median_us", "time_samples_us", "loops", "repeats"]
+
+
+def get_commit(repo_dir: str | Path = ".") -> tuple[str | None, bool]:
+    """
+    Current git commit of `repo_dir` and whether tracked files have uncommitted changes.
+    (None, False) outside a git checkout.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo_dir, capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=repo_dir, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+    return commit, bool(status.strip())
+
+
+def get_run_metadata(**extra) -> dict:
+    """
+    Identify a benchmark run: time, host, commit and library versions, plus any `extra` fields
+    (e.g. dtype, speed suite and seed of the run).
+    """
+    # Imported here: fft_core pulls in the FFT registry, which history readers do not need
+    from fft_core.selection import get_host_id
+
+    now = datetime.now()
+    commit, dirty = get_commit(Path(__file__).parent.parent)
+    versions = {}
+    for package in TRACKED_PACKAGES:
+        try:
+            versions[f"{package}_version"] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[f"{package}_version"] = None
+
+    return {
+        # Random suffix: runs started in the same second (e.g. parallel CI jobs) get distinct ids
+        "run_id": f"{now.strftime('%Y%m%d_%H%M%S')}_{(commit or 'nogit')[:8]}_{uuid.uuid4().hex[:6]}",
+        "timestamp": now.isoformat(timespec="seconds"),
+        "host": platform.node(),
+        "host_id": get_host_id(),
+        "commit": commit,
+        "dirty": dirty,
+        "python_version": platform.python_version(),
+        **versions,
+        **extra,
+    }
+
+
+def record_run(speed_df: pl.DataFrame, run_metadata: dict, history_dir: str | Path = DEFAULT_HISTORY_DIR) -> Path:
+    """
+    Append a run to the history: its speed results (one row per (func, size), with every
+    per-call trial time in `time_samples_us`) and its metadata on every row.
+
+    Each run is its own Parquet file, so recording never rewrites earlier runs.
+
+    Returns:
+        Path: The Parquet file that was written.
+    """
+    history_dir = Path(history_dir)
+    history_dir.mkdir(parents=True, exist_ok=True)
+
+    # Sizes skipped by a time budget have no timings either
+    df = speed_df.filter(~pl.col("is_error") & pl.col("time_median_us").is_not_null()).select(TIMING_COLUMNS)
+    df = df.with_columns(pl.col("time_samples_us").cast(pl.List(pl.Float64)))
+    df = df.with_columns(**{key: pl.lit(value) for key, value in run_metadata.items()})
+    df = df.select([*run_metadata, *TIMING_COLUMNS])
+
+    path = history_dir / f"{run_metadata['run_id']}.parquet"
+    if path.exists():
+        raise FileExistsError(f"Run '{run_metadata['run_id']}' is already recorded in {history_dir}")
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    df.write_parquet(tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_history(history_dir: str | Path = DEFAULT_HISTORY_DIR) -> pl.DataFrame:
+    """
+    All recorded runs as one DataFrame (empty if nothing was recorded yet).
+    """
+    paths = sorted(Path(history_dir).glob("*.parquet"))
+    if not paths:
+        return pl.DataFrame()
+    return pl.concat([pl.read_parquet(path) for path in paths], how="diagonal_relaxed")
+
+
+def list_runs(history: pl.DataFrame) -> pl.DataFrame:
+    """
+    One row per recorded run, oldest first.
+    """
+    if history.is_empty():
+        return history
+    meta_columns = [col for col in history.columns if col not in TIMING_COLUMNS]
+    return (
+        history.group_by("run_id", maintain_order=True)
+        .agg([pl.col(col).first() for col in meta_columns if col != "run_id"] + [pl.col("func").n_unique().alias("funcs"), pl.len().alias("rows")])
+        .sort("timestamp")
+    )
+
+
+def resolve_run(history: pl.DataFrame, run: str) -> str:
+    """
+    Run id from an exact id, a unique prefix, "latest" or "previous".
+    """
+    run_ids = list_runs(history)["run_id"].to_list() if not history.is_empty() else []
+    if not run_ids:
+        raise ValueError("The history is empty")
+    if run == "latest":
+        return run_ids[-1]
+    if run == "previous":
+        if len(run_ids) < 2:
+            raise ValueError("The history has a single run, there is no previous run")
+        return run_ids[-2]
+    if run in run_ids:
+        return run
+    matches = [run_id for run_id in run_ids if run_id.startswith(run)]
+    if len(matches) != 1:
+        raise ValueError(f"'{run}' matches {len(matches)} recorded runs")
+    return matches[0]
+
+
+def compare_runs(history: pl.DataFrame, baseline: str, candidate: str, method: str = "mannwhitney", alpha: float = 0.05, threshold: float = 0.05) -> pl.DataFrame:
+    """
+    Compare the timing distributions of two runs for every (func, input_size) they share.
+
+    A slowdown is flagged (`is_regression`) when the median ratio candidate / baseline exceeds
+    1 + `threshold` and it is statistically significant:
+    - "mannwhitney": the one-sided Mann-Whitney U p-value is below `alpha`
+    - "bootstrap": the lower bound of the (1 - `alpha`) bootstrap interval of the ratio exceeds 1 + `threshold`
+
+    Both the p-value and the interval are reported whatever the method. With "mannwhitney", pairs with
+    too few trials for the p-value to ever fall below `alpha` (e.g. 3 against 3 at alpha = 0.05) are
+    marked `insufficient_samples` and gated by the bootstrap interval instead; `test` names the test used.
+    """
+    if method not in COMPARE_METHODS:
+        raise ValueError(f"method must be one of {COMPARE_METHODS}, got '{method}'")
+
+    def run_rows(run_id):
+        return history.filter(pl.col("run_id") == run_id).select("func", "input_size", "time_median_us", "time_samples_us")
+
+    joined = run_rows(baseline).join(run_rows(candidate), on=["func", "input_size"], suffix="_candidate").sort("func", "input_size")
+
+    rows = []
+    for row in joined.iter_rows(named=True):
+        base, cand = row["time_samples_us"], row["time_samples_us_candidate"]
+        ratio = row["time_median_us_candidate"] / row["time_median_us"]
+        p_value = mann_whitney_slower(base, cand)
+        ci_low, ci_high = bootstrap_ratio_ci(base, cand, confidence=1 - alpha)
+        insufficient = method == "mannwhitney" and mann_whitney_min_p(len(base), len(cand)) >= alpha
+        test = "bootstrap" if method == "bootstrap" or insufficient else "mannwhitney"
+        if test == "mannwhitney":
+            is_regression = ratio > 1 + threshold and p_value < alpha
+        else:
+            is_regression = ci_low > 1 + threshold
+        rows.append({
+            "func": row["func"],
+            "input_size": row["input_size"],
+            "baseline_median_us": row["time_median_us"],
+            "candidate_median_us": row["time_median_us_candidate"],
+            "ratio": ratio,
+            "ratio_ci_low": ci_low,
+            "ratio_ci_high": ci_high,
+            "p_value": p_value,
+            "test": test,
+            "insufficient_samples": insufficient,
+            "is_regression": is_regression,
+        })
+
+    schema = {
+        "func": pl.String, "input_size": pl.Int64, "baseline_median_us": pl.Float64, "candidate_median_us": pl.Float64,
+        "ratio": pl.Float64, "ratio_ci_low": pl.Float64, "ratio_ci_high": pl.Float64, "p_value": pl.Float64,
+        "test": pl.String, "insufficient_samples": pl.Boolean, "is_regression": pl.Boolean,
+    }
+    return pl.DataFrame(rows, schema=schema)
+
+
+if __name__ == "__main__":
+    print(list_runs(load_history(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_HISTORY_DIR)))
@@ -0,0 +1,158 @@
+"""Two-level (memory + on-disk .npy) cache for reference FFT outputs."""
+
+import hashlib
+import logging
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(".cache") / "reference"
+DEFAULT_MAX_MEMORY_BYTES = 256 * 1024**2
+DEFAULT_MAX_DISK_BYTES = 2 * 1024**3
+
+
+def get_func_id(func: callable) -> str:
+    """
+    Identify a reference function by its qualified name and the version of its top-level package.
+    """
+    module = getattr(func, "__module__", None) or ""
+    qualname = getattr(func, "__qualname__", None) or getattr(func, "__name__", repr(func))
+    package = sys.modules.get(module.split(".")[0])
+    version = getattr(package, "__version__", "")
+    return f"{module}.{qualname}@{version}"
+
+
+class ReferenceCache:
+    """
+    Cache of reference outputs keyed by a content hash of the input and the reference function.
+
+    Lookups go memory -> disk -> compute. Both layers are bounded by size and evict
+    the least recently used entries. Returned arrays are read-only because they are shared.
+
+    Parameters:
+        cache_dir (str | Path | None): Directory of the on-disk layer. None disables it.
+        max_memory_bytes (int): Size limit of the in-process layer.
+        max_disk_bytes (int): Size limit of the on-disk layer.
+
+    Example:
+        >>> cache = ReferenceCache()
+        >>> expected = cache.get(x, scipy_fft)  # computed once, then served from memory/disk
+    """
+
+    def __init__(self, cache_dir: str | Path | None = DEFAULT_CACHE_DIR, max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES, max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.memory_bytes = 0
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._memory = OrderedDict()
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(x: np.ndarray, reference_func: callable) -> str:
+        x = np.ascontiguousarray(x)
+        h = hashlib.blake2b(digest_size=20)
+        h.update(get_func_id(reference_func).encode())
+        h.update(f"{x.dtype.str}{x.shape}".encode())
+        h.update(x.view(np.uint8).reshape(-1))
+        return h.hexdigest()
+
+    def get(self, x: np.ndarray, reference_func: callable) -> np.ndarray:
+        """
+        Return `reference_func(x)`, computing it only if neither layer has it.
+        """
+        key = self.make_key(x, reference_func)
+
+        # Memory layer
+        expected = self._memory.get(key)
+        if expected is not None:
+            self._memory.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return expected
+
+        # Disk layer
+        expected = self._load(key)
+        if expected is not None:
+            self.stats["disk_hits"] += 1
+        else:
+            self.stats["misses"] += 1
+            expected = np.asarray(reference_func(x))
+            self._save(key, expected)
+
+        expected.flags.writeable = False
+        self._remember(key, expected)
+        return expected
+
+    def clear_memory(self):
+        self._memory.clear()
+        self.memory_bytes = 0
+
+    def _remember(self, key: str, expected: np.ndarray):
+        self._memory[key] = expected
+        self.memory_bytes += expected.nbytes
+        while self.memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self.memory_bytes -= evicted.nbytes
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npy"
+
+    def _load(self, key: str) -> np.ndarray | None:
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            expected = np.load(path)
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        # Refresh the modification time so eviction is least-recently-used
+        # (another process may have evicted the file since it was read)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return expected
+
+    def _save(self, key: str, expected: np.ndarray):
+        if self.cache_dir is None or expected.nbytes > self.max_disk_bytes:
+            return
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, expected)
+        os.replace(tmp_path, path)
+        self._evict_disk()
+
+    def _evict_disk(self):
+        entries = []
+        for path in self.cache_dir.glob("*.npy"):
+            # Runner workers share the directory, so files can disappear while it is listed
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                pass
+        entries.sort(key=lambda e: e[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total <= self.max_disk_bytes:
+                break
+            total -= stat.st_size
+            path.unlink(missing_ok=True)
+            logger.debug(f"Evicted reference cache entry {path.name}")
+
+
+if __name__ == "__main__":
+    from scipy.fft import fft as scipy_fft
+
+    cache = ReferenceCache()
+    x = np.random.rand(1024)
+    cache.get(x, scipy_fft)
+    cache.get(x, scipy_fft)
+    print(cache.stats)
@@ -0,0 +1,203 @@
+"""Process-isolated benchmark runner: every job runs in its own forked, CPU-pinned worker and streams its records back."""
+
+import multiprocessing
+import os
+import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from queue import Empty
+from time import perf_counter
+
+from .io_utils import colored_print
+
+KINDS = ("correctness", "speed")
+SPEED_LAYOUTS = ("serial", "isolated")
+# Seconds to wait for the last messages of a worker that has already exited
+DRAIN_TIMEOUT = 1.0
+
+
+@dataclass
+class Job:
+    """
+    One unit of work of the runner, e.g. (implementation, suite).
+
+    Attributes:
+        name (str): Label used in progress output, e.g. "metrics:iterative_numba".
+        kind (str): "correctness" jobs run in parallel; "speed" jobs only run on the speed cores,
+            with no other job running at the same time.
+        target (Callable): Called in the worker as `target(emit)`; it calls `emit(record)` for every
+            result record (a dict) as soon as it is ready.
+        multithreaded (bool): The job times a multi-threaded implementation: as a speed job, it runs
+            alone on every speed core, with as many Numba threads.
+    """
+    name: str
+    kind: str
+    target: Callable
+    multithreaded: bool = False
+
+
+def get_available_cores() -> list[int]:
+    """
+    Cores this process may run on (all of them where CPU affinity is not supported).
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def pin_to_cores(cores: list[int]):
+    """
+    Restrict the current process to `cores`, and Numba's thread pool (if loaded) to as many threads.
+    """
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+    numba = sys.modules.get("numba")
+    if numba is not None:
+        numba.set_num_threads(min(len(cores), numba.config.NUMBA_NUM_THREADS))
+
+
+def _worker(job_id: int, job: Job, cores: list[int], queue):
+    pin_to_cores(cores)
+    try:
+        job.target(lambda record: queue.put(("record", job_id, record)))
+        queue.put(("done", job_id, None))
+    except BaseException as e:
+        queue.put(("error", job_id, repr(e)))
+
+
+class BenchmarkRunner:
+    """
+    Run benchmark jobs, each in a fresh forked process pinned to a core with `os.sched_setaffinity`.
+
+    A crash, leak or corrupted heap in one implementation cannot affect the others, and no GC or
+    allocator state carries over between jobs. Correctness jobs run first, one per core on up to
+    `workers` cores. Speed jobs run afterwards on `speed_cores` only, with nothing else running:
+    - "serial": one job at a time, on the first speed core
+    - "isolated": one job per speed core in parallel (reserve those cores, e.g. with `isolcpus`)
+    Multi-threaded speed jobs run last, one at a time on all the speed cores, so that they are
+    timed with one thread per speed core rather than single-threaded.
+
+    Fork before this process runs any parallel Numba code: a parent whose TBB thread pool is
+    running when it forks can hang at exit.
+
+    Records are yielded by `stream` as workers send them; `failures` lists the jobs that raised
+    or died, with the reason.
+
+    Parameters:
+        workers (int | None): Cores used by correctness jobs. None uses every available core.
+        speed_cores (list[int] | None): Cores of the speed jobs. None uses the last available core.
+        speed_layout (str): "serial" or "isolated".
+        verbose (bool): Print one line per finished job.
+
+    Example:
+        >>> runner = BenchmarkRunner(workers=4, speed_cores=[3])
+        >>> records = runner.run([Job("metrics:fft", "correctness", target)])
+    """
+
+    def __init__(self, workers: int | None = None, speed_cores: list[int] | None = None, speed_layout: str = "serial", verbose: bool = True):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("The benchmark runner needs the 'fork' start method")
+        if speed_layout not in SPEED_LAYOUTS:
+            raise ValueError(f"speed_layout must be one of {SPEED_LAYOUTS}, got '{speed_layout}'")
+
+        available = get_available_cores()
+        self.cores = available[:workers] if workers else available
+        self.speed_cores = list(speed_cores) if speed_cores else available[-1:]
+        self.speed_layout = speed_layout
+        self.verbose = verbose
+        self.failures = []
+        self._ctx = multiprocessing.get_context("fork")
+
+    def run(self, jobs: Iterable[Job]) -> list[dict]:
+        """
+        Run every job and return all their records.
+        """
+        return [record for _, record in self.stream(jobs)]
+
+    def stream(self, jobs: Iterable[Job]) -> Iterator[tuple[Job, dict]]:
+        """
+        Run every job and yield (job, record) pairs as the workers produce them.
+        """
+        jobs = list(jobs)
+        for job in jobs:
+            if job.kind not in KINDS:
+                raise ValueError(f"Job kind must be one of {KINDS}, got '{job.kind}'")
+
+        correctness = [job for job in jobs if job.kind == "correctness"]
+        speed = [job for job in jobs if job.kind == "speed" and not job.multithreaded]
+        multithreaded = [job for job in jobs if job.kind == "speed" and job.multithreaded]
+        yield from self._run_phase(correctness, [[core] for core in self.cores])
+        speed_slots = [[core] for core in self.speed_cores] if self.speed_layout == "isolated" else [self.speed_cores[:1]]
+        yield from self._run_phase(speed, speed_slots)
+        yield from self._run_phase(multithreaded, [self.speed_cores])
+
+    def _run_phase(self, jobs: list[Job], slots: list[list[int]]) -> Iterator[tuple[Job, dict]]:
+        if not jobs:
+            return
+
+        queue = self._ctx.Queue()
+        pending = deque(enumerate(jobs))
+        free = list(slots)
+        running = {}  # job id -> (process, slot, start time, record count)
+        status = {}  # job id -> ("done" | "error", reason)
+
+        while pending or running:
+            while pending and free:
+                job_id, job = pending.popleft()
+                slot = free.pop(0)
+                # Not daemonic: jobs may fork processes of their own (e.g. test.test_memory)
+                process = self._ctx.Process(target=_worker, args=(job_id, job, slot, queue))
+                process.start()
+                running[job_id] = [process, slot, perf_counter(), 0]
+
+            try:
+                message = queue.get(timeout=0.1)
+            except Empty:
+                message = None
+            if message is not None:
+                kind, job_id, payload = message
+                if kind == "record":
+                    running[job_id][3] += 1
+                    yield jobs[job_id], payload
+                else:
+                    status[job_id] = (kind, payload)
+
+            for job_id in list(running):
+                process, slot, start, _ = running[job_id]
+                if process.is_alive():
+                    continue
+                if job_id not in status:
+                    # Its last messages may still be in flight: drain them before declaring a crash
+                    yield from self._drain(queue, jobs, running, status, job_id)
+                    if job_id not in status:
+                        status[job_id] = ("error", f"worker died with exit code {process.exitcode}")
+                process.join()
+                count = running.pop(job_id)[3]
+                free.append(slot)
+                self._report(jobs[job_id], slot, perf_counter() - start, count, status[job_id])
+
+        queue.close()
+
+    def _drain(self, queue, jobs, running, status, job_id) -> Iterator[tuple[Job, dict]]:
+        deadline = perf_counter() + DRAIN_TIMEOUT
+        while job_id not in status and perf_counter() < deadline:
+            try:
+                kind, other_id, payload = queue.get(timeout=0.05)
+            except Empty:
+                continue
+            if kind == "record":
+                if other_id in running:
+                    running[other_id][3] += 1
+                yield jobs[other_id], payload
+            else:
+                status[other_id] = (kind, payload)
+
+    def _report(self, job: Job, slot: list[int], elapsed: float, count: int, status: tuple[str, str | None]):
+        cpus = ",".join(str(core) for core in slot)
+        kind, reason = status
+        if kind == "done":
+            colored_print(f"  ✅ [cpu {cpus}] {job.name:<36}: {count:>4} records in {elapsed:.1f} s", color="GREEN", quiet=not self.verbose)
+        else:
+            self.failures.append((job.name, reason))
+            colored_print(f"  💥 [cpu {cpus}] {job.name:<36}: FAILED after {count} records ({reason})", color="YELLOW", quiet=not self.verbose)
@@ -0,0 +1,102 @@
+"""Utility functions for summarizing repeated timing measurements."""
+
+import math
+
+import numpy as np
+
+
+def summarize_samples(samples: list[float], confidence: float = 0.95) -> dict:
+    """
+    Summarize repeated timing samples with robust statistics.
+
+    Parameters:
+        samples (list[float]): Per-call times of each trial (any unit).
+        confidence (float): Confidence level of the interval around the mean. Defaults to 0.95.
+
+    Returns:
+        dict: min, median, mean, std, iqr, ci_low and ci_high of the samples (same unit as input).
+            The confidence interval uses Student's t-distribution, so it stays honest for few trials.
+
+    Example:
+        >>> summarize_samples([1.0, 1.1, 0.9])["median"]
+        1.0
+    """
+    data = np.asarray(samples, dtype=np.float64)
+    n = data.size
+    if n == 0:
+        raise ValueError("At least one sample is required")
+
+    mean = float(np.mean(data))
+    std = float(np.std(data, ddof=1)) if n > 1 else 0.0
+    q1, median, q3 = np.percentile(data, [25, 50, 75])
+
+    if n > 1:
+        # scipy.stats is slow to import, keep it off the startup path
+        from scipy import stats
+
+        half_width = float(stats.t.ppf((1 + confidence) / 2, df=n - 1) * std / np.sqrt(n))
+    else:
+        half_width = 0.0
+
+    return {
+        "min": float(np.min(data)),
+        "median": float(median),
+        "mean": mean,
+        "std": std,
+        "iqr": float(q3 - q1),
+        "ci_low": mean - half_width,
+        "ci_high": mean + half_width,
+    }
+
+
+def mann_whitney_slower(baseline: list[float], candidate: list[float]) -> float:
+    """
+    One-sided Mann-Whitney U test that the candidate times are larger than the baseline times.
+
+    Returns:
+        float: The p-value (exact for small samples without ties). It cannot go below
+            `mann_whitney_min_p` of the sample sizes (0.05 with 3 trials on each side).
+    """
+    from scipy import stats
+
+    if len(baseline) == 0 or len(candidate) == 0:
+        return float("nan")
+    return float(stats.mannwhitneyu(candidate, baseline, alternative="greater").pvalue)
+
+
+def mann_whitney_min_p(n_baseline: int, n_candidate: int) -> float:
+    """
+    Smallest one-sided p-value the exact Mann-Whitney U test can give for these sample sizes:
+    1 / C(n_baseline + n_candidate, n_baseline), reached when every candidate time exceeds every baseline time.
+
+    Example:
+        >>> mann_whitney_min_p(3, 3)
+        0.05
+    """
+    if n_baseline == 0 or n_candidate == 0:
+        return 1.0
+    return 1 / math.comb(n_baseline + n_candidate, n_baseline)
+
+
+def bootstrap_ratio_ci(baseline: list[float], candidate: list[float], confidence: float = 0.95, resamples: int = 2000, seed: int = 0) -> tuple[float, float]:
+    """
+    Percentile bootstrap confidence interval of median(candidate) / median(baseline).
+
+    Both samples are resampled independently; the seed makes the interval reproducible.
+    """
+    baseline = np.asarray(baseline, dtype=np.float64)
+    candidate = np.asarray(candidate, dtype=np.float64)
+    if baseline.size == 0 or candidate.size == 0:
+        return float("nan"), float("nan")
+
+    rng = np.random.default_rng(seed)
+    base_medians = np.median(rng.choice(baseline, size=(resamples, baseline.size)), axis=1)
+    cand_medians = np.median(rng.choice(candidate, size=(resamples, candidate.size)), axis=1)
+    ratios = cand_medians / base_medians
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(ratios, [alpha, 1 - alpha])
+    return float(low), float(high)
+
+
+if __name__ == "__main__":
+    print(summarize_samples([1.0, 1.2, 0.9, 1.1, 1.0]))
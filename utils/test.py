@@ -1,11 +1,35 @@
 """Functions for testing FFT implementations."""
 
+import gc
+import json
+import math
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
 from time import perf_counter
 
 import numpy as np
 from scipy.fft import fft as scipy_fft
+from scipy.fft import ifft as scipy_ifft
+
+from fft_core.plan import nominal_flops
 
 from .io_utils import colored_print, qprint
+from .reference_cache import ReferenceCache
+from .stats import summarize_samples
+
+# Default repetition settings for speed tests
+DEFAULT_REPEAT = 7
+DEFAULT_MIN_TIME = 0.1  # seconds per trial
+DEFAULT_MAX_TIME = 2.0  # seconds per (func, size) before stopping early
+MIN_REPEAT = 3
 
 
 def get_func_name(func: callable):
@@ -15,7 +39,305 @@ def get_func_name(func: callable):
         return "Function"
 
 
-def test_metrics(func: callable, test_cases: list[np.ndarray], reference_func: callable=scipy_fft, name: str = None, verbose: bool = False):
+def time_loops(func: callable, x: np.ndarray, loops: int) -> float:
+    """
+    Call `func(x)` `loops` times and return the total elapsed time in seconds.
+    """
+    start_time = perf_counter()
+    for _ in range(loops):
+        func(x)
+    return perf_counter() - start_time
+
+
+def autorange(func: callable, x: np.ndarray, min_time: float = DEFAULT_MIN_TIME) -> tuple[int, float]:
+    """
+    Find the number of loops so that one trial takes at least `min_time` seconds.
+
+    Works like `timeit.Timer.autorange`: tries 1, 2, 5, 10, 20, 50, ... loops.
+
+    Returns:
+        tuple[int, float]: The loop count and the elapsed time of the last calibration trial.
+    """
+    loops = 1
+    while True:
+        for factor in (1, 2, 5):
+            number = loops * factor
+            elapsed = time_loops(func, x, number)
+            if elapsed >= min_time:
+                return number, elapsed
+        loops *= 10
+
+
+def measure(func: callable, x: np.ndarray, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, max_time: float = DEFAULT_MAX_TIME) -> dict:
+    """
+    Time `func(x)` over repeated trials and summarize the per-call times.
+
+    The loop count per trial is chosen with `autorange`, so short calls are not dominated
+    by timer resolution. The calibration trial is discarded (it absorbs one-off page faults).
+    Trials stop early once `max_time` is spent, but never before `MIN_REPEAT` trials.
+
+    Returns:
+        dict: Per-call statistics in microseconds (see `summarize_samples`) plus `loops`, `repeats`
+            and `samples` (the per-call time of every trial).
+    """
+    loops, _ = autorange(func, x, min_time)
+
+    samples = []
+    spent = 0.0
+    for i in range(repeat):
+        if i >= MIN_REPEAT and spent >= max_time:
+            break
+        elapsed = time_loops(func, x, loops)
+        spent += elapsed
+        samples.append(elapsed / loops * 1e6)
+
+    summary = summarize_samples(samples)
+    summary["loops"] = loops
+    summary["repeats"] = len(samples)
+    summary["samples"] = samples
+    return summary
+
+
+def compulsory_bytes(x: np.ndarray) -> int:
+    """
+    Bytes an FFT of x must move at least: read the input once and write the complex output once.
+    Traffic above this (e.g. one pass over the array per out-of-cache stage) shows up as a low
+    effective bandwidth compared with the machine's memory bandwidth.
+    """
+    out_itemsize = np.result_type(x.dtype, np.complex64).itemsize
+    return x.nbytes + x.shape[0] * out_itemsize
+
+
+@dataclass
+class TimeBudget:
+    """
+    Time limits of one implementation over a speed suite (None disables a limit).
+
+    Attributes:
+        per_call (float | None): Skip sizes whose predicted time per call exceeds this many seconds.
+        total (float | None): Skip sizes whose predicted measurement time would take the seconds
+            spent on the implementation over this.
+        timeout (float | None): Hard limit in seconds of one size's measurement: it runs in an isolated
+            process (see `run_isolated`) that is killed at the limit, and larger sizes are skipped afterwards.
+    """
+    per_call: float | None = None
+    total: float | None = None
+    timeout: float | None = None
+
+
+class ScalingModel:
+    """
+    Power-law fit t(n) = a * n^b of the time per call of one implementation, from the sizes measured so far.
+
+    The exponent is fitted in log-log space on the `window` largest sizes (small sizes are dominated
+    by call overhead) and kept at least 1, since no FFT scales below linearly. With a single
+    observation it extrapolates as N log N.
+    """
+
+    def __init__(self, window: int = 3):
+        self.window = window
+        self.observations = {}  # size -> seconds per call
+
+    def observe(self, n: int, seconds: float):
+        self.observations[n] = seconds
+
+    def predict(self, n: int) -> float | None:
+        """
+        Predicted seconds per call at size n, None before the first observation.
+        """
+        points = sorted((size, t) for size, t in self.observations.items() if size > 1 and t > 0)[-self.window:]
+        if not points:
+            return None
+        if len(points) == 1 or n <= 1:
+            size, t = points[-1]
+            return t * (n * math.log2(max(n, 2))) / (size * math.log2(size))
+        log_n, log_t = np.log([p[0] for p in points]), np.log([p[1] for p in points])
+        exponent, _ = np.polyfit(log_n, log_t, 1)
+        exponent = max(exponent, 1.0)
+        # Anchor the line on the largest size, which is the most relevant for extrapolation
+        return float(np.exp(log_t[-1] + exponent * (math.log(n) - log_n[-1])))
+
+
+def predict_measure_time(seconds_per_call: float, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, max_time: float = DEFAULT_MAX_TIME) -> float:
+    """
+    Approximate wall time of `measure` for a call of `seconds_per_call`: one calibration trial
+    plus the timed trials (at least `MIN_REPEAT`, fewer than `repeat` once `max_time` is spent).
+    """
+    trial = max(seconds_per_call, min_time)
+    trials = min(repeat, max(MIN_REPEAT, math.ceil(max_time / trial)))
+    return trial * (1 + trials)
+
+
+class BudgetScheduler:
+    """
+    Decide, size by size, whether measuring an implementation still fits its `TimeBudget`.
+
+    Sizes are skipped when the `ScalingModel` predicts their time per call over `per_call`, or
+    their measurement time over `timeout` or what is left of `total`, and once a size timed out,
+    every size at least as large is skipped too.
+    """
+
+    def __init__(self, budget: TimeBudget, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, max_time: float = DEFAULT_MAX_TIME):
+        self.budget = budget
+        self.repeat = repeat
+        self.min_time = min_time
+        self.max_time = max_time
+        self.model = ScalingModel()
+        self.spent = 0.0
+        self.timed_out_size = None
+
+    def skip_reason(self, n: int) -> str | None:
+        """
+        Why size n should be skipped, None if it fits the budget.
+        """
+        if self.timed_out_size is not None and n >= self.timed_out_size:
+            return f"skipped (size {self.timed_out_size} timed out)"
+        predicted = self.model.predict(n)
+        if predicted is None:
+            return None
+        if self.budget.per_call is not None and predicted > self.budget.per_call:
+            return f"skipped (predicted {predicted:.3g}s per call)"
+        cost = predict_measure_time(predicted, self.repeat, self.min_time, self.max_time)
+        if self.budget.timeout is not None and cost > self.budget.timeout:
+            return f"skipped (predicted {cost:.3g}s, over the {self.budget.timeout:g}s timeout)"
+        if self.budget.total is not None and self.spent + cost > self.budget.total:
+            return f"skipped (predicted {cost:.3g}s, {max(self.budget.total - self.spent, 0):.3g}s of budget left)"
+        return None
+
+    def record(self, n: int, seconds_per_call: float | None, elapsed: float):
+        """
+        Account for a measured size; `seconds_per_call` is None when the measurement timed out.
+        """
+        self.spent += elapsed
+        if seconds_per_call is None:
+            self.timed_out_size = n if self.timed_out_size is None else min(n, self.timed_out_size)
+        else:
+            self.model.observe(n, seconds_per_call)
+
+    def resume(self, records: Iterable[dict]):
+        """
+        Account for the speed records of an earlier run (e.g. from a resumed checkpoint), smallest size first.
+        Their time is estimated from their trial samples; a size that timed out counts its whole timeout.
+        """
+        for record in sorted(records, key=lambda record: record["input_size"]):
+            if record["time_samples_us"] is not None:
+                elapsed = sum(record["time_samples_us"]) * record["loops"] / 1e6
+                self.record(record["input_size"], record["time_median_us"] / 1e6, elapsed)
+            elif (record["skip_reason"] or "").startswith("timed out"):
+                self.record(record["input_size"], None, self.budget.timeout or 0.0)
+
+
+class MeasurementTimeout(TimeoutError):
+    """
+    An isolated measurement was killed at its time limit (unlike a TimeoutError raised by the function itself).
+    """
+
+
+def _isolated_context():
+    # Forkserver children are forked from a clean server process, not from this one: they never
+    # inherit a running thread pool (forking while Numba's TBB pool runs can hang the parent at exit)
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return None
+    ctx = multiprocessing.get_context("forkserver")
+    # Imported once by the server instead of by every child (scipy.stats alone takes ~0.5 s)
+    ctx.set_forkserver_preload(["__main__", __name__, "scipy.stats", "numba"])
+    return ctx
+
+
+def _isolated_child(conn, call: callable, x, input_path: str | None):
+    try:
+        if input_path is not None:
+            x = np.load(input_path)
+        conn.send(("ok", call(x)))
+    except Exception as e:
+        conn.send(("error", repr(e)))
+    finally:
+        conn.close()
+
+
+def run_isolated(call: callable, x, timeout: float | None = None):
+    """
+    Run `call(x)` in a fresh child process and return its result.
+
+    The child is started by a fork server, so it inherits nothing from this process (no thread pool,
+    allocator state or JIT-compiled code): `call` must be picklable (a module-level function or a
+    partial of one) and do its own warm-up. Arrays are handed over as a temporary .npy file instead
+    of being pickled. Falls back to an in-process call (without a limit) where the fork server is not available.
+
+    Raises:
+        MeasurementTimeout: The call did not finish within `timeout` seconds (the child is killed).
+        RuntimeError: The call raised, or the child died.
+    """
+    ctx = _isolated_context()
+    if ctx is None:
+        return call(x)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = None
+        if isinstance(x, np.ndarray):
+            input_path = os.path.join(tmp_dir, "input.npy")
+            np.save(input_path, x)
+        parent_conn, child_conn = ctx.Pipe(duplex=False)
+        process = ctx.Process(target=_isolated_child, args=(child_conn, call, None if input_path else x, input_path))
+        process.start()
+        child_conn.close()
+        try:
+            if not parent_conn.poll(timeout):
+                process.kill()
+                raise MeasurementTimeout(f"timed out after {timeout:g}s")
+            status, payload = parent_conn.recv()
+        except EOFError:
+            status, payload = "error", None
+        finally:
+            process.join()
+            parent_conn.close()
+
+    if status != "ok":
+        raise RuntimeError(payload or f"isolated process exited with code {process.exitcode}")
+    return payload
+
+
+def _warm_measure(func: callable, warmup_input: np.ndarray | None, x: np.ndarray, **kwargs) -> dict:
+    if warmup_input is not None:
+        try:
+            func(warmup_input)
+        except Exception:
+            pass  # measure reports the error on x
+    return measure(func, x, **kwargs)
+
+
+def measure_with_timeout(func: callable, x: np.ndarray, timeout: float, warmup_input: np.ndarray = None, **kwargs) -> dict:
+    """
+    `measure` in an isolated child process (see `run_isolated`) that is killed after `timeout` seconds.
+    The child first calls `func(warmup_input)`, so JIT compilation stays out of the timings (but counts
+    towards the limit).
+
+    Raises:
+        MeasurementTimeout: The measurement did not finish in time.
+    """
+    return run_isolated(partial(_warm_measure, func, warmup_input, **kwargs), x, timeout)
+
+
+# Tolerances of `test_metrics` per working precision: (rtol, atol, atol relative to the peak |reference|).
+# Single precision keeps ~7 significant digits and its rounding error grows with the peak
+# magnitude (e.g. ~N * eps on the zero bins of a constant signal), hence the peak-relative term.
+TOLERANCES = {
+    np.dtype(np.complex128): (1e-5, 1e-8, 0.0),
+    np.dtype(np.complex64): (1e-4, 1e-6, 1e-5),
+}
+
+
+def get_tolerances(x: np.ndarray, expected: np.ndarray) -> tuple[float, float]:
+    """
+    (rtol, atol) for checking a transform of x against `expected`, by the precision x is computed in.
+    """
+    rtol, atol, peak_atol = TOLERANCES[np.result_type(x.dtype, np.complex64)]
+    if peak_atol:
+        atol += peak_atol * float(np.max(np.abs(expected), initial=0.0))
+    return rtol, atol
+
+
+def test_metrics(func: callable, test_cases: Iterable[np.ndarray], reference_func: callable=scipy_fft, name: str = None, verbose: bool = False, reference_cache: ReferenceCache = None, on_result: callable = None, skip: set[int] = None):
     is_quiet = not verbose
     results = []
     
@@ -25,32 +347,37 @@ def test_metrics(func: callable, test_cases: list[np.ndarray], reference_func: c
     
     qprint(f"🔍 Metrics Testing: {name}...", is_quiet)
     for i, test in enumerate(test_cases):
+        # Already measured (e.g. by a resumed run)
+        if skip and i + 1 in skip:
+            del test
+            continue
         res = {
             "func": name,
             "test_no": i + 1,
-            "input": test,
             "input_size": len(test),
-            "expected": None,
-            "output": None,
             "mae": None,
             "mse": None,
             "is_pass": False,
             "is_error": False,
         }
+        output = expected = reference_input = None
         
         try:
             output = func(test)
-            expected = reference_func(test)
-            mae = np.mean(np.abs(output - expected))
-            mse = np.mean(np.abs(output - expected) ** 2)
-            
+            # The reference always runs in double precision, so single-precision errors are measured against the exact result
+            reference_input = test.astype(np.promote_types(test.dtype, np.float64), copy=False)
+            if reference_cache is not None:
+                expected = reference_cache.get(reference_input, reference_func)
+            else:
+                expected = reference_func(reference_input)
+            mae = float(np.mean(np.abs(output - expected)))
+            mse = float(np.mean(np.abs(output - expected) ** 2))
             
-            res["expected"] = expected
-            res["output"] = output
             res["mae"] = mae
             res["mse"] = mse
             
-            assert np.allclose(output, expected, rtol=1e-5, atol=1e-8)
+            rtol, atol = get_tolerances(test, expected)
+            assert np.allclose(output, expected, rtol=rtol, atol=atol)
             
             colored_print(f"  ✅ Test case {i + 1:>2} (size: {len(test):>8}): PASS -> MAE: {mae:<8.2g}, MSE: {mse:>8.2g}", color="GREEN",quiet=is_quiet)
             res["is_pass"] = True
@@ -65,13 +392,22 @@ def test_metrics(func: callable, test_cases: list[np.ndarray], reference_func: c
             res["is_error"] = True
         
         results.append(res)
+        if on_result is not None:
+            on_result(res)
+        
+        # Free the arrays before the next case is built
+        del test, output, expected, reference_input
         
     return results
 
 
-def test_speed(func: callable, test_cases: list[np.ndarray], name: str = None, verbose: bool = False):
+def test_speed(func: callable, test_cases: Iterable[np.ndarray], name: str = None, verbose: bool = False, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, max_time: float = DEFAULT_MAX_TIME, warmup_input: np.ndarray = None, on_result: callable = None, budget: TimeBudget = None, skip: set[int] = None, resumed: Iterable[dict] = None):
     is_quiet = not verbose
     results = []
+    scheduler = BudgetScheduler(budget, repeat=repeat, min_time=min_time, max_time=max_time) if budget is not None else None
+    if scheduler is not None and resumed:
+        # Sizes measured before resuming still count against the budget and inform the scaling model
+        scheduler.resume(resumed)
     
     if name is None:
         name = get_func_name(func)
@@ -79,7 +415,8 @@ def test_speed(func: callable, test_cases: list[np.ndarray], name: str = None, v
     qprint(f"🕐 Speed Testing: {name}...", is_quiet)
     
     # Warmup
-    warmup_input = np.random.rand(256) + 1j * np.random.rand(256)
+    if warmup_input is None:
+        warmup_input = np.random.rand(256) + 1j * np.random.rand(256)
     try:
         for _ in range(10):
             func(warmup_input)
@@ -88,43 +425,881 @@ def test_speed(func: callable, test_cases: list[np.ndarray], name: str = None, v
     
     # Run
     for i, test in enumerate(test_cases):
+        # Already measured (e.g. by a resumed run)
+        if skip and i + 1 in skip:
+            del test
+            continue
         res = {
             "func": name,
             "test_no": i + 1,
-            "input": test,
             "input_size": len(test),
             "time_used_us": None,
             "time_per_bin_us": None,
+            "gflops": None,
+            "bandwidth_gbs": None,
+            "time_min_us": None,
+            "time_median_us": None,
+            "time_mean_us": None,
+            "time_std_us": None,
+            "time_iqr_us": None,
+            "time_ci_low_us": None,
+            "time_ci_high_us": None,
+            "loops": None,
+            "repeats": None,
+            "time_samples_us": None,
+            "skip_reason": None,
             "is_error": False
         }
+        if scheduler is not None:
+            res["skip_reason"] = scheduler.skip_reason(len(test))
+            if res["skip_reason"] is not None:
+                colored_print(f"  ⏭️  Time (size: {len(test):>8}): {res['skip_reason']}", color="YELLOW", quiet=is_quiet)
+                results.append(res)
+                if on_result is not None:
+                    on_result(res)
+                del test
+                continue
+
         try:
             # Measure time
-            start_time = perf_counter()
-            func(test)
-            end_time = perf_counter()
+            start = perf_counter()
+            if budget is not None and budget.timeout is not None:
+                summary = measure_with_timeout(func, test, budget.timeout, warmup_input=warmup_input, repeat=repeat, min_time=min_time, max_time=max_time)
+            else:
+                summary = measure(func, test, repeat=repeat, min_time=min_time, max_time=max_time)
+            if scheduler is not None:
+                scheduler.record(len(test), summary["median"] / 1e6, perf_counter() - start)
             
-            time_used_us = (end_time - start_time) * 1e6
+            time_used_us = summary["median"]
             avg_time_us = time_used_us / len(test)
             
             # Output
             is_exceed_thousands = time_used_us > 1000
             unit_str = "ms" if is_exceed_thousands else "µs"
-            colored_print(f"  ✅ Time (size: {len(test):>8}): {time_used_us if not is_exceed_thousands else time_used_us/1000:>8.2f} {unit_str} (avg per bin: {avg_time_us:.3f} µs)", color="GREEN", quiet=is_quiet)
+            scale = 1000 if is_exceed_thousands else 1
+            colored_print(
+                f"  ✅ Time (size: {len(test):>8}): {time_used_us / scale:>8.2f} {unit_str} "
+                f"± {summary['iqr'] / scale:<6.2f} IQR (avg per bin: {avg_time_us:.3f} µs, {nominal_flops(len(test)) / (time_used_us * 1e3):>6.2f} GFLOP/s, "
+                f"{summary['repeats']}x{summary['loops']} loops)",
+                color="GREEN", quiet=is_quiet
+            )
             res["time_used_us"] = time_used_us
             res["time_per_bin_us"] = avg_time_us
+            res["gflops"] = nominal_flops(len(test)) / (time_used_us * 1e3)
+            res["bandwidth_gbs"] = compulsory_bytes(test) / (time_used_us * 1e3)
+            for stat in ("min", "median", "mean", "std", "iqr", "ci_low", "ci_high"):
+                res[f"time_{stat}_us"] = summary[stat]
+            res["loops"] = summary["loops"]
+            res["repeats"] = summary["repeats"]
+            res["time_samples_us"] = summary["samples"]
             res["is_error"] = False
+        except MeasurementTimeout as e:
+            scheduler.record(len(test), None, perf_counter() - start)
+            colored_print(f"  ⏱️  Time (size: {len(test):>8}): {e}", color="YELLOW", quiet=is_quiet)
+            res["skip_reason"] = str(e)
         except Exception as e:
-            colored_print(f"  💥 Time: ERROR ({e})", color="YELLOW", quiet=is_quiet)
+            colored_print(f"  💥 Time (size: {len(test):>8}): ERROR ({e})", color="YELLOW", quiet=is_quiet)
             res["is_error"] = True
             
         results.append(res)
+        if on_result is not None:
+            on_result(res)
+        
+        # Free the input before the next case is built
+        del test
         
     return results
             
 
+def _read_proc_status(field: str) -> int | None:
+    """
+    Read a memory field (e.g. VmRSS, VmHWM) of the current process from /proc, in bytes.
+    Returns None where /proc is not available.
+    """
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _reset_peak_rss():
+    # Reset VmHWM to the current RSS (Linux >= 4.0); silently ignored elsewhere
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
+
+
+def profile_memory(func: callable, x: np.ndarray) -> dict:
+    """
+    Profile the memory of one `func(x)` call in the steady state.
+
+    The function is called once untraced (JIT compile, plans, caches), then profiled on a second call.
+
+    Returns:
+        dict:
+            - peak_rss_delta_bytes: peak RSS during the call minus RSS before it (page granular, Linux only)
+            - tracemalloc_peak_bytes: peak of Python/NumPy heap allocations during the call
+            - alloc_count: blocks allocated during the call that are still alive when it returns (incl. the output)
+
+    Note:
+        Memory allocated inside Numba-compiled code is not seen by tracemalloc, only by the RSS figure.
+    """
+    func(x)
+    gc.collect()
+
+    _reset_peak_rss()
+    rss_before = _read_proc_status("VmRSS")
+    tracemalloc.start()
+    try:
+        output = func(x)
+        _, tracemalloc_peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    rss_peak = _read_proc_status("VmHWM")
+    del output
+
+    return {
+        "peak_rss_delta_bytes": rss_peak - rss_before if rss_peak is not None and rss_before is not None else None,
+        "tracemalloc_peak_bytes": tracemalloc_peak,
+        "alloc_count": sum(stat.count for stat in snapshot.statistics("filename")),
+    }
+
+
+def profile_memory_isolated(func: callable, x: np.ndarray) -> dict:
+    """
+    Run `profile_memory` in an isolated child process (see `run_isolated`), so allocator state
+    and peaks of earlier calls cannot bleed into the numbers.
+    """
+    return run_isolated(partial(profile_memory, func), x)
+
+
+def test_memory(func: callable, test_cases: Iterable[np.ndarray], name: str = None, verbose: bool = False, isolate: bool = True, skip: set[int] = None):
+    """
+    Record peak RSS delta, tracemalloc peak and allocation count for each test case.
+
+    Each (func, size) runs in its own isolated process when `isolate` is True (`func` must then be picklable).
+    `bytes_per_point` is the tracemalloc peak divided by the input size.
+    Test numbers in `skip` (e.g. sizes the speed test skipped) get a row without measurements.
+    """
+    is_quiet = not verbose
+    results = []
+
+    if name is None:
+        name = get_func_name(func)
+
+    qprint(f"🧠 Memory Testing: {name}...", is_quiet)
+
+    profile = profile_memory_isolated if isolate else profile_memory
+    for i, test in enumerate(test_cases):
+        res = {
+            "func": name,
+            "test_no": i + 1,
+            "input_size": len(test),
+            "peak_rss_delta_bytes": None,
+            "tracemalloc_peak_bytes": None,
+            "alloc_count": None,
+            "bytes_per_point": None,
+            "is_error": False,
+        }
+        if skip and i + 1 in skip:
+            results.append(res)
+            del test
+            continue
+        try:
+            res.update(profile(func, test))
+            res["bytes_per_point"] = res["tracemalloc_peak_bytes"] / len(test)
+
+            rss_delta = res["peak_rss_delta_bytes"]
+            rss_str = f"{rss_delta / 1024:>10.1f} KiB" if rss_delta is not None else "       n/a"
+            colored_print(
+                f"  ✅ Memory (size: {len(test):>8}): peak RSS +{rss_str}, heap peak {res['tracemalloc_peak_bytes'] / 1024:>10.1f} KiB "
+                f"({res['bytes_per_point']:.1f} B/point, {res['alloc_count']} blocks)",
+                color="GREEN", quiet=is_quiet
+            )
+        except Exception as e:
+            colored_print(f"  💥 Memory: ERROR ({e})", color="YELLOW", quiet=is_quiet)
+            res["is_error"] = True
+
+        results.append(res)
+        del test
+
+    return results
+
+
+def test_batch_speed(func: callable, test_cases: Iterable[np.ndarray], name: str = None, verbose: bool = False, axis: int = -1, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, max_time: float = DEFAULT_MAX_TIME):
+    """
+    Measure the throughput of a batched FFT, `func(x, axis=axis)`, on N-D blocks.
+
+    Each record reports the time per block and the resulting transforms per second.
+    """
+    is_quiet = not verbose
+    results = []
+
+    if name is None:
+        name = get_func_name(func)
+
+    qprint(f"📦 Batch Testing: {name}...", is_quiet)
+    for i, test in enumerate(test_cases):
+        n = test.shape[axis]
+        batch_size = test.size // n
+        res = {
+            "func": name,
+            "test_no": i + 1,
+            "batch_size": batch_size,
+            "input_size": n,
+            "time_used_us": None,
+            "time_per_transform_us": None,
+            "transforms_per_sec": None,
+            "is_error": False,
+        }
+        try:
+            summary = measure(lambda x: func(x, axis=axis), test, repeat=repeat, min_time=min_time, max_time=max_time)
+
+            res["time_used_us"] = summary["median"]
+            res["time_per_transform_us"] = summary["median"] / batch_size
+            res["transforms_per_sec"] = batch_size / (summary["median"] * 1e-6)
+            colored_print(
+                f"  ✅ Batch (size: {batch_size:>6} x {n:>6}): {res['time_used_us'] / 1000:>9.2f} ms "
+                f"({res['transforms_per_sec']:>12,.0f} transforms/sec)",
+                color="GREEN", quiet=is_quiet
+            )
+        except Exception as e:
+            colored_print(f"  💥 Batch: ERROR ({e})", color="YELLOW", quiet=is_quiet)
+            res["is_error"] = True
+
+        results.append(res)
+        del test
+
+    return results
+
+
+def test_flop_savings(functions: dict, test_cases: Iterable[np.ndarray], baseline: str, verbose: bool = False, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, max_time: float = DEFAULT_MAX_TIME):
+    """
+    Compare the theoretical flop-count savings of each algorithm over a baseline with the time savings measured in practice.
+
+    Parameters:
+        functions (dict): name -> (func, flops), where `flops(n)` is the algorithm's real flop count for size n.
+        baseline (str): Name in `functions` that the savings are relative to (e.g. the Radix-2 engine).
+
+    Each record has `flop_saving_pct` (1 - flops / baseline flops) next to
+    `time_saving_pct` (1 - time / baseline time) for the same size.
+    """
+    is_quiet = not verbose
+    results = []
+
+    for name, (func, flops) in functions.items():
+        for res in test_speed(func, test_cases, name=name, verbose=verbose, repeat=repeat, min_time=min_time, max_time=max_time):
+            res["flops"] = flops(res["input_size"])
+            results.append(res)
+
+    baseline_rows = {res["test_no"]: res for res in results if res["func"] == baseline}
+    qprint(f"🧮 Flop savings over {baseline}:", is_quiet)
+    for res in results:
+        base = baseline_rows.get(res["test_no"])
+        res["flop_saving_pct"] = None
+        res["time_saving_pct"] = None
+        if base is None or res["is_error"] or base["is_error"] or not base["flops"]:
+            continue
+        res["flop_saving_pct"] = (1 - res["flops"] / base["flops"]) * 100
+        res["time_saving_pct"] = (1 - res["time_used_us"] / base["time_used_us"]) * 100
+        if res["func"] != baseline:
+            colored_print(
+                f"  📉 {res['func']:<20} (size: {res['input_size']:>8}): flops saved {res['flop_saving_pct']:>6.1f}%, "
+                f"time saved {res['time_saving_pct']:>6.1f}%",
+                color="GREEN", quiet=is_quiet
+            )
+
+    return results
+
+
+def test_speedup(functions: dict, test_cases: Iterable[np.ndarray], baselines: dict, verbose: bool = False, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, max_time: float = DEFAULT_MAX_TIME, budget: TimeBudget = None):
+    """
+    Time every function on the same test cases and compare it with one or more baselines.
+
+    Parameters:
+        functions (dict): name -> func.
+        baselines (dict): column -> name in `functions`; every record gets `column` set to
+            baseline time / time for the same size (above 1: faster than the baseline).
+        budget (TimeBudget | None): Time limits of each function, e.g. to stop a slow baseline early
+            (sizes it skips have no speedup over it).
+    """
+    is_quiet = not verbose
+    results = []
+
+    for name, func in functions.items():
+        results.extend(test_speed(func, test_cases, name=name, verbose=verbose, repeat=repeat, min_time=min_time, max_time=max_time, budget=budget))
+
+    baseline_rows = {
+        column: {res["test_no"]: res for res in results if res["func"] == baseline and res["time_used_us"] is not None}
+        for column, baseline in baselines.items()
+    }
+    qprint(f"🏎️ Speedup over {', '.join(baselines.values())}:", is_quiet)
+    for res in results:
+        for column in baselines:
+            base = baseline_rows[column].get(res["test_no"])
+            res[column] = None
+            if base is None or res["is_error"] or base["is_error"] or res["time_used_us"] is None:
+                continue
+            res[column] = base["time_used_us"] / res["time_used_us"]
+        speedups = ", ".join(f"{column} {res[column]:>8.2f}x" for column, baseline in baselines.items() if res[column] is not None and baseline != res["func"])
+        if speedups:
+            colored_print(f"  🚀 {res['func']:<20} (size: {res['input_size']:>8}): {speedups}", color="GREEN", quiet=is_quiet)
+
+    return results
+
+
+def test_round_trip(fft_func: callable, ifft_func: callable, test_cases: Iterable[np.ndarray], name: str = None, verbose: bool = False, reference_fft: callable = scipy_fft, reference_ifft: callable = scipy_ifft, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, max_time: float = DEFAULT_MAX_TIME):
+    """
+    Measure the latency of `ifft_func(fft_func(x))` and how well it reconstructs x.
+
+    Each record has the round-trip time, the reconstruction error (max and RMS of |x - ifft(fft(x))|)
+    next to that of `reference_ifft(reference_fft(x))` in the same precision, and the error of
+    `ifft_func` alone against `reference_ifft` (double precision) on the same spectrum,
+    which decides `is_pass` with the tolerances of `test_metrics`.
+    """
+    is_quiet = not verbose
+    results = []
+
+    if name is None:
+        name = get_func_name(ifft_func)
+
+    qprint(f"🔁 Round-trip Testing: {name}...", is_quiet)
+
+    # Warmup
+    warmup_input = np.random.rand(256) + 1j * np.random.rand(256)
+    try:
+        ifft_func(fft_func(warmup_input))
+    except Exception as e:
+        print(f"  ⚠️ Warmup failed: {e}")
+
+    for i, test in enumerate(test_cases):
+        res = {
+            "func": name,
+            "test_no": i + 1,
+            "input_size": len(test),
+            "time_used_us": None,
+            "time_per_bin_us": None,
+            "recon_max_err": None,
+            "recon_rms_err": None,
+            "ref_recon_max_err": None,
+            "ifft_max_err": None,
+            "is_pass": False,
+            "is_error": False,
+        }
+        spectrum = recon = expected = None
+        try:
+            spectrum = fft_func(test)
+            recon = ifft_func(spectrum)
+            err = np.abs(recon - test)
+            res["recon_max_err"] = float(np.max(err, initial=0.0))
+            res["recon_rms_err"] = float(np.sqrt(np.mean(err ** 2)))
+            res["ref_recon_max_err"] = float(np.max(np.abs(reference_ifft(reference_fft(test)) - test), initial=0.0))
+
+            expected = reference_ifft(spectrum.astype(np.promote_types(spectrum.dtype, np.complex128), copy=False))
+            res["ifft_max_err"] = float(np.max(np.abs(recon - expected), initial=0.0))
+            rtol, atol = get_tolerances(test, expected)
+            res["is_pass"] = bool(np.allclose(recon, expected, rtol=rtol, atol=atol))
+
+            summary = measure(lambda x: ifft_func(fft_func(x)), test, repeat=repeat, min_time=min_time, max_time=max_time)
+            res["time_used_us"] = summary["median"]
+            res["time_per_bin_us"] = summary["median"] / len(test)
+
+            colored_print(
+                f"  {'✅' if res['is_pass'] else '❌'} Round trip (size: {len(test):>8}): {summary['median']:>10.2f} µs, "
+                f"reconstruction max err: {res['recon_max_err']:<8.2g} (reference: {res['ref_recon_max_err']:<8.2g}), "
+                f"ifft max err: {res['ifft_max_err']:.2g}",
+                color="GREEN" if res["is_pass"] else "RED", quiet=is_quiet
+            )
+        except Exception as e:
+            colored_print(f"  💥 Round trip (size: {len(test):>8}): ERROR ({e})", color="YELLOW", quiet=is_quiet)
+            res["is_error"] = True
+
+        results.append(res)
+
+        # Free the arrays before the next case is built
+        del test, spectrum, recon, expected
+
+    return results
+
+
+def test_convolution(functions: dict, signal_path: str | Path, filter_lengths: list[int], output_path: str | Path, verbose: bool = False, memory: bool = True, seed: int = 0, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, max_time: float = DEFAULT_MAX_TIME):
+    """
+    Benchmark FIR filtering of a signal stored on disk, for several filter lengths.
+
+    Parameters:
+        functions (dict): name -> func(signal_path, h, output_path), which writes the full
+            convolution of the signal with h to `output_path` as raw samples.
+        signal_path (str | Path): 1-D `.npy` signal.
+        filter_lengths (list[int]): Filter lengths to sweep; the taps are seeded random values.
+        memory (bool): Also record peak RSS delta and heap peak of one call (in an isolated process;
+            the functions must then be picklable).
+
+    Each record has the throughput (`samples_per_sec`, input samples per second) and the maximum
+    error of the written output against `scipy.signal.oaconvolve`.
+    """
+    # scipy.signal is slow to import, only pay for it in this mode
+    from scipy.signal import oaconvolve
+
+    is_quiet = not verbose
+    results = []
+    n = np.load(signal_path, mmap_mode="r").shape[0]
+
+    for filter_len in filter_lengths:
+        h = np.random.default_rng([seed, filter_len]).standard_normal(filter_len)
+        expected = oaconvolve(np.load(signal_path), h)
+        qprint(f"🎛️  Convolution Testing (filter length: {filter_len})...", is_quiet)
+
+        for name, func in functions.items():
+            res = {
+                "func": name,
+                "filter_len": filter_len,
+                "input_size": n,
+                "time_used_us": None,
+                "samples_per_sec": None,
+                "peak_rss_delta_bytes": None,
+                "tracemalloc_peak_bytes": None,
+                "max_err": None,
+                "is_error": False,
+            }
+            try:
+                run = partial(func, h=h, output_path=output_path)
+                summary = measure(run, signal_path, repeat=repeat, min_time=min_time, max_time=max_time)
+                res["time_used_us"] = summary["median"]
+                res["samples_per_sec"] = n / (summary["median"] * 1e-6)
+
+                output = np.fromfile(output_path, dtype=expected.dtype)
+                res["max_err"] = float(np.max(np.abs(output - expected))) if output.shape == expected.shape else float("inf")
+                del output
+
+                if memory:
+                    mem = profile_memory_isolated(run, signal_path)
+                    res["peak_rss_delta_bytes"] = mem["peak_rss_delta_bytes"]
+                    res["tracemalloc_peak_bytes"] = mem["tracemalloc_peak_bytes"]
+
+                memory_str = f", heap peak {res['tracemalloc_peak_bytes'] / 1024**2:.1f} MiB" if memory else ""
+                colored_print(
+                    f"  ✅ {name:<28}: {res['samples_per_sec'] / 1e6:>8.2f} Msamples/s{memory_str} (max err: {res['max_err']:.2g})",
+                    color="GREEN", quiet=is_quiet
+                )
+            except Exception as e:
+                colored_print(f"  💥 {name:<28}: ERROR ({e})", color="YELLOW", quiet=is_quiet)
+                res["is_error"] = True
+
+            results.append(res)
+
+        del expected
+
+    return results
+
+
+def get_thread_counts(max_threads: int) -> list[int]:
+    """
+    Thread counts of a scaling sweep: powers of 2 up to `max_threads`, plus `max_threads` itself.
+    """
+    counts = []
+    t = 1
+    while t < max_threads:
+        counts.append(t)
+        t *= 2
+    counts.append(max_threads)
+    return counts
+
+
+def test_thread_scaling(func: callable, test_cases: Iterable[np.ndarray], thread_counts: list[int], name: str = None, verbose: bool = False, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, max_time: float = DEFAULT_MAX_TIME):
+    """
+    Measure how a multi-threaded FFT, `func(x, threads)`, scales with the number of threads.
+
+    Each size is timed once per thread count. `speedup` is the single-thread time over the
+    time with `threads` threads, and `efficiency` is the speedup per added thread (1.0 = linear scaling).
+    The first entry of `thread_counts` is the reference (normally 1).
+    """
+    is_quiet = not verbose
+    results = []
+
+    if name is None:
+        name = get_func_name(func)
+
+    qprint(f"🧵 Thread Scaling: {name}...", is_quiet)
+
+    # Warmup (compiles the parallel kernel and starts the thread pool)
+    warmup_input = np.random.rand(256) + 1j * np.random.rand(256)
+    try:
+        func(warmup_input, thread_counts[-1])
+    except Exception as e:
+        print(f"  ⚠️ Warmup failed: {e}")
+
+    for i, test in enumerate(test_cases):
+        base_time = None
+        for threads in thread_counts:
+            res = {
+                "func": name,
+                "test_no": i + 1,
+                "input_size": len(test),
+                "threads": threads,
+                "time_used_us": None,
+                "speedup": None,
+                "efficiency": None,
+                "is_error": False,
+            }
+            try:
+                summary = measure(lambda x: func(x, threads), test, repeat=repeat, min_time=min_time, max_time=max_time)
+                res["time_used_us"] = summary["median"]
+                if base_time is None:
+                    base_time = summary["median"]
+                res["speedup"] = base_time / summary["median"]
+                res["efficiency"] = res["speedup"] * thread_counts[0] / threads
+                colored_print(
+                    f"  ✅ Time (size: {len(test):>9}, threads: {threads:>3}): {summary['median'] / 1000:>9.2f} ms "
+                    f"(speedup: {res['speedup']:>5.2f}x, efficiency: {res['efficiency'] * 100:>5.1f}%)",
+                    color="GREEN", quiet=is_quiet
+                )
+            except Exception as e:
+                colored_print(f"  💥 Time (size: {len(test)}, threads: {threads}): ERROR ({e})", color="YELLOW", quiet=is_quiet)
+                res["is_error"] = True
+
+            results.append(res)
+
+        del test
+
+    return results
+
+
+def test_plan_cost(build: callable, execute: callable, test_cases: Iterable[np.ndarray], name: str = "plan", verbose: bool = False, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, max_time: float = DEFAULT_MAX_TIME):
+    """
+    Measure plan-build cost separately from execute cost.
+
+    Parameters:
+        build (callable): `build(n)` returns a fresh (uncached) plan for size n.
+        execute (callable): `execute(x, plan)` runs the transform with a prebuilt plan.
+
+    The `break_even_calls` column is how many executions one plan build costs.
+    """
+    is_quiet = not verbose
+    results = []
+
+    qprint(f"🧩 Plan Testing: {name}...", is_quiet)
+    for i, test in enumerate(test_cases):
+        n = len(test)
+        res = {
+            "func": name,
+            "test_no": i + 1,
+            "input_size": n,
+            "plan_build_us": None,
+            "execute_us": None,
+            "break_even_calls": None,
+            "is_error": False,
+        }
+        plan = None
+        try:
+            build_summary = measure(lambda _: build(n), test, repeat=repeat, min_time=min_time, max_time=max_time)
+            plan = build(n)
+            execute_summary = measure(lambda x: execute(x, plan), test, repeat=repeat, min_time=min_time, max_time=max_time)
+
+            res["plan_build_us"] = build_summary["median"]
+            res["execute_us"] = execute_summary["median"]
+            res["break_even_calls"] = res["plan_build_us"] / res["execute_us"]
+            colored_print(
+                f"  ✅ Plan (size: {n:>8}): build {res['plan_build_us']:>10.2f} µs, execute {res['execute_us']:>10.2f} µs "
+                f"(build = {res['break_even_calls']:.2f} executions)",
+                color="GREEN", quiet=is_quiet
+            )
+        except Exception as e:
+            colored_print(f"  💥 Plan: ERROR ({e})", color="YELLOW", quiet=is_quiet)
+            res["is_error"] = True
+
+        results.append(res)
+        del test, plan
+
+    return results
+
+
+def test_steady_state(func: callable, test_cases: Iterable[np.ndarray], name: str = None, verbose: bool = False, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME, max_time: float = DEFAULT_MAX_TIME):
+    """
+    Compare a regular call `func(x)` with an allocation-free steady-state call `func(x, out=buffer)`
+    of an implementation that accepts `out` (see `fft_core.selection.supports_out`).
+
+    `saving_pct` is the share of the regular call time saved by reusing the output buffer;
+    `heap_alloc_bytes` / `heap_out_bytes` are the tracemalloc peaks of one call of each kind.
+    """
+    is_quiet = not verbose
+    results = []
+
+    if name is None:
+        name = get_func_name(func)
+
+    qprint(f"♻️  Steady-State Testing: {name}...", is_quiet)
+    for i, test in enumerate(test_cases):
+        n = len(test)
+        res = {
+            "func": name,
+            "test_no": i + 1,
+            "input_size": n,
+            "time_alloc_us": None,
+            "time_out_us": None,
+            "saving_pct": None,
+            "heap_alloc_bytes": None,
+            "heap_out_bytes": None,
+            "is_error": False,
+        }
+        out = None
+        try:
+            out = np.empty(n, dtype=np.result_type(test.dtype, np.complex64))
+            out_call = partial(func, out=out)
+
+            alloc_summary = measure(func, test, repeat=repeat, min_time=min_time, max_time=max_time)
+            out_summary = measure(out_call, test, repeat=repeat, min_time=min_time, max_time=max_time)
+            res["time_alloc_us"] = alloc_summary["median"]
+            res["time_out_us"] = out_summary["median"]
+            res["saving_pct"] = (1 - res["time_out_us"] / res["time_alloc_us"]) * 100
+            res["heap_alloc_bytes"] = profile_memory(func, test)["tracemalloc_peak_bytes"]
+            res["heap_out_bytes"] = profile_memory(out_call, test)["tracemalloc_peak_bytes"]
+            colored_print(
+                f"  ✅ Steady state (size: {n:>8}): {res['time_alloc_us']:>10.2f} µs -> {res['time_out_us']:>10.2f} µs with out= "
+                f"({res['saving_pct']:>+6.1f}%), heap {res['heap_alloc_bytes'] / 1024:>10.1f} -> {res['heap_out_bytes'] / 1024:.1f} KiB",
+                color="GREEN", quiet=is_quiet
+            )
+        except Exception as e:
+            colored_print(f"  💥 Steady state (size: {n:>8}): ERROR ({e})", color="YELLOW", quiet=is_quiet)
+            res["is_error"] = True
+
+        results.append(res)
+        del test, out
+
+    return results
+
+
+def test_stages(profiler: callable, test_cases: Iterable[np.ndarray], name: str = None, verbose: bool = False, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME):
+    """
+    Time every stage of a compiled FFT separately (see `fft_core.selection.register_stage_profiler`).
+
+    Each trial runs all stages in order, timing each call, so every stage sees the data and cache
+    state it has in a real transform. Trials repeat until `repeat` trials and `min_time` seconds are
+    both reached; the fastest time of each stage is kept. A stage call includes ~1 µs of Python dispatch,
+    so the breakdown is meaningful for sizes well above that.
+
+    One record per (size, stage): its time, share of the summed stage time, and effective bandwidth
+    assuming the stage reads and writes the whole complex array once (2 * N * itemsize bytes).
+    """
+    is_quiet = not verbose
+    results = []
+
+    if name is None:
+        name = get_func_name(profiler)
+
+    qprint(f"🔬 Stage Timing: {name}...", is_quiet)
+    for i, test in enumerate(test_cases):
+        n = len(test)
+        try:
+            stages = profiler(test)
+            # Warm up (compiles on the first call)
+            for _, _, run in stages:
+                run()
+
+            best = [np.inf] * len(stages)
+            trials = 0
+            start_time = perf_counter()
+            while trials < repeat or perf_counter() - start_time < min_time:
+                for k, (_, _, run) in enumerate(stages):
+                    start = perf_counter()
+                    run()
+                    best[k] = min(best[k], perf_counter() - start)
+                trials += 1
+
+            total = sum(best)
+            stage_bytes = 2 * n * np.result_type(test.dtype, np.complex64).itemsize
+            for k, (label, span, _) in enumerate(stages):
+                results.append({
+                    "func": name,
+                    "test_no": i + 1,
+                    "input_size": n,
+                    "stage_no": k,
+                    "stage": label,
+                    "span": span,
+                    "time_us": best[k] * 1e6,
+                    "share_pct": best[k] / total * 100,
+                    "bandwidth_gbs": stage_bytes / best[k] / 1e9,
+                    "trials": trials,
+                    "is_error": False,
+                })
+
+            slowest = max(range(len(stages)), key=lambda k: best[k])
+            colored_print(
+                f"  ✅ Stages (size: {n:>9}): {total * 1e6:>10.1f} µs total, {stages[0][0]} {best[0] / total * 100:>4.1f}%, "
+                f"slowest {stages[slowest][0]} {best[slowest] * 1e6:.1f} µs ({stage_bytes / best[slowest] / 1e9:.2f} GB/s)",
+                color="GREEN", quiet=is_quiet
+            )
+        except Exception as e:
+            colored_print(f"  💥 Stages (size: {n:>9}): ERROR ({e})", color="YELLOW", quiet=is_quiet)
+            results.append({
+                "func": name, "test_no": i + 1, "input_size": n, "stage_no": None, "stage": None, "span": None,
+                "time_us": None, "share_pct": None, "bandwidth_gbs": None, "trials": 0, "is_error": True,
+            })
+
+        # Free the input (and the stage buffers) before the next case is built
+        stages = None
+        del test
+
+    return results
+
+
+def test_startup(commands: dict, repeat: int = DEFAULT_REPEAT, verbose: bool = False, cwd: str | Path | None = None):
+    """
+    Measure the wall time of short Python commands, each run in a fresh interpreter.
+
+    Parameters:
+        commands (dict): name -> (argv, env), where argv follows the interpreter
+            (e.g. ["-c", "import fft_core"]) and env holds extra environment variables.
+        repeat (int): Timed runs per command, after one untimed run that fills the
+            OS page cache, the registry manifest and the Numba cache.
+    """
+    is_quiet = not verbose
+    results = []
+
+    qprint("🚀 Startup Testing...", is_quiet)
+    for name, (argv, env) in commands.items():
+        res = {
+            "func": name,
+            "time_min_ms": None,
+            "time_median_ms": None,
+            "time_max_ms": None,
+            "repeats": 0,
+            "is_error": False,
+        }
+        try:
+            run_env = {**os.environ, **env}
+            times = []
+            for i in range(repeat + 1):
+                start = perf_counter()
+                subprocess.run([sys.executable, *argv], env=run_env, cwd=cwd, check=True, capture_output=True)
+                if i > 0:
+                    times.append((perf_counter() - start) * 1e3)
+            res["time_min_ms"] = float(np.min(times))
+            res["time_median_ms"] = float(np.median(times))
+            res["time_max_ms"] = float(np.max(times))
+            res["repeats"] = len(times)
+            colored_print(
+                f"  ✅ {name:<32}: {res['time_median_ms']:>9.1f} ms (min {res['time_min_ms']:.1f} ms)",
+                color="GREEN", quiet=is_quiet
+            )
+        except (subprocess.CalledProcessError, OSError) as e:
+            colored_print(f"  💥 {name:<32}: ERROR ({e})", color="YELLOW", quiet=is_quiet)
+            res["is_error"] = True
+
+        results.append(res)
+
+    return results
+
+
+# Runs in a fresh interpreter: times `import fft_core`, the import of the implementation's module,
+# its first call and its steady-state call, and prints them as JSON
+_COLD_START_CHILD = """
+import json, sys
+from time import perf_counter
+import numpy as np
+
+name, n = sys.argv[1], int(sys.argv[2])
+start = perf_counter()
+import fft_core
+from fft_core.selection import load_implementation
+fft_core_ms = (perf_counter() - start) * 1e3
+
+start = perf_counter()
+func = load_implementation(fft_core.fft_functions[name])
+import_ms = (perf_counter() - start) * 1e3
+
+rng = np.random.default_rng(n)
+x = rng.random(n) + 1j * rng.random(n)
+start = perf_counter()
+func(x)
+first_call_ms = (perf_counter() - start) * 1e3
+
+steady = []
+for _ in range(5):
+    start = perf_counter()
+    func(x)
+    steady.append((perf_counter() - start) * 1e3)
+
+print(json.dumps({"fft_core_ms": fft_core_ms, "import_ms": import_ms, "first_call_ms": first_call_ms, "steady_call_ms": min(steady)}))
+"""
+
+
+def _run_cold_start_child(name: str, n: int, env: dict, cwd: str | Path | None) -> dict:
+    proc = subprocess.run([sys.executable, "-c", _COLD_START_CHILD, name, str(n)], env=env, cwd=cwd, check=True, capture_output=True, text=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def test_cold_start(implementations: dict, n: int = 1024, repeat: int = DEFAULT_REPEAT, verbose: bool = False, cwd: str | Path | None = None):
+    """
+    Measure what a short-lived process pays before an implementation runs at full speed.
+
+    Every trial runs twice in fresh interpreters sharing a new, empty Numba cache directory
+    (NUMBA_CACHE_DIR): the first run compiles, the second loads the compiled code from the cache.
+
+    Parameters:
+        implementations (dict): label -> (name in `fft_functions`, extra environment variables).
+        n (int): Size of the complex128 input of the first call.
+
+    Each record has (medians over the trials, in milliseconds):
+    - import_ms: importing the implementation's module after `import fft_core` (Numba included), cache filled
+    - cold_import_ms: the same with an empty cache (differs from import_ms when the module compiles on import)
+    - compile_ms: first call minus steady-state call, with an empty cache
+    - cache_load_ms: first call minus steady-state call, with the cache filled by the previous run
+    - steady_call_ms: fastest of 5 later calls
+    """
+    is_quiet = not verbose
+    results = []
+
+    qprint(f"🧊 Cold-start Testing (size: {n})...", is_quiet)
+    for label, (name, env) in implementations.items():
+        res = {
+            "func": label,
+            "input_size": n,
+            "fft_core_ms": None,
+            "import_ms": None,
+            "cold_import_ms": None,
+            "compile_ms": None,
+            "cache_load_ms": None,
+            "steady_call_ms": None,
+            "repeats": 0,
+            "is_error": False,
+        }
+        try:
+            trials = []
+            for _ in range(repeat):
+                with tempfile.TemporaryDirectory() as cache_dir:
+                    run_env = {**os.environ, **env, "NUMBA_CACHE_DIR": cache_dir}
+                    cold = _run_cold_start_child(name, n, run_env, cwd)
+                    cached = _run_cold_start_child(name, n, run_env, cwd)
+                trials.append({
+                    "fft_core_ms": cached["fft_core_ms"],
+                    "import_ms": cached["import_ms"],
+                    "cold_import_ms": cold["import_ms"],
+                    "compile_ms": cold["first_call_ms"] - cold["steady_call_ms"],
+                    "cache_load_ms": cached["first_call_ms"] - cached["steady_call_ms"],
+                    "steady_call_ms": min(cold["steady_call_ms"], cached["steady_call_ms"]),
+                })
+            for col in ["fft_core_ms", "import_ms", "cold_import_ms", "compile_ms", "cache_load_ms", "steady_call_ms"]:
+                res[col] = float(np.median([trial[col] for trial in trials]))
+            res["repeats"] = len(trials)
+            colored_print(
+                f"  ✅ {label:<28}: import {res['import_ms']:>7.1f} ms ({res['cold_import_ms']:.1f} ms cold), compile {res['compile_ms']:>8.1f} ms, cache load {res['cache_load_ms']:>7.1f} ms",
+                color="GREEN", quiet=is_quiet
+            )
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
+            colored_print(f"  💥 {label:<28}: ERROR ({e})", color="YELLOW", quiet=is_quiet)
+            res["is_error"] = True
+
+        results.append(res)
+
+    return results
+
+
 if __name__ == "__main__":
-    import os
-    import sys
     sys.path.insert(0, os.path.dirname(__file__))
     
     import test_case
@@ -132,4 +1307,3 @@ if __name__ == "__main__":
     a = test_metrics(np.fft.fft, test_case.get_simple_test_cases(), verbose=True)
     b = test_speed(np.fft.fft, test_case.get_large_test_cases(), verbose=True)
     c = test_speed(scipy_fft, test_case.get_large_test_cases(), verbose=True)
-    
\ No newline at end of file
@@ -1,7 +1,120 @@
 """Functions for generating test cases for FFT implementations."""
 
+import zlib
+from functools import partial
+
 import numpy as np
 
+DEFAULT_SEED = 0
+_seed = DEFAULT_SEED
+
+
+def set_seed(seed: int):
+    """
+    Set the base seed of all generated test cases (same seed -> same signals across runs).
+    """
+    global _seed
+    _seed = seed
+
+
+def get_case_rng(name: str, index: int, seed: int | None = None) -> np.random.Generator:
+    """
+    Return the random generator of one test case, derived from (seed, suite name, case index).
+    """
+    seed = _seed if seed is None else seed
+    return np.random.default_rng([seed, zlib.crc32(name.encode()), index])
+
+
+class LazyTestCases:
+    """
+    Re-iterable collection of test signals that are built only when iteration reaches them.
+
+    Nothing is cached: each signal is built on demand by `builder(spec, rng)` and can be freed
+    by the consumer as soon as it moves on, so peak memory is bounded by the largest single case.
+    Iterating twice yields the same signals (they are seeded per case, see `set_seed`).
+    """
+
+    def __init__(self, name: str, builder: callable, specs: list):
+        self._cases = [(name, builder, spec) for spec in specs]
+
+    def __iter__(self):
+        for i, (name, builder, spec) in enumerate(self._cases):
+            yield builder(spec, get_case_rng(name, i))
+
+    def __len__(self):
+        return len(self._cases)
+
+    def __add__(self, other: "LazyTestCases") -> "LazyTestCases":
+        combined = LazyTestCases.__new__(LazyTestCases)
+        combined._cases = self._cases + other._cases
+        return combined
+
+    @property
+    def specs(self) -> list:
+        return [spec for _, _, spec in self._cases]
+
+    def astype(self, dtype) -> "LazyTestCases":
+        """
+        The same cases cast to the precision of the complex `dtype` (complex64 -> complex64 / float32 signals).
+        """
+        cast = LazyTestCases.__new__(LazyTestCases)
+        cast._cases = [(name, partial(_build_as, builder, np.dtype(dtype)), spec) for name, builder, spec in self._cases]
+        return cast
+
+
+def to_precision(x: np.ndarray, dtype) -> np.ndarray:
+    """
+    Cast x to the precision of the complex `dtype`, keeping real signals real.
+    """
+    dtype = np.dtype(dtype)
+    if not np.iscomplexobj(x):
+        dtype = np.finfo(dtype).dtype
+    return x.astype(dtype, copy=False)
+
+
+def _build_as(builder: callable, dtype: np.dtype, spec, rng: np.random.Generator) -> np.ndarray:
+    return to_precision(builder(spec, rng), dtype)
+
+
+def _real_signal(shape, rng: np.random.Generator) -> np.ndarray:
+    return rng.random(shape)
+
+
+def _complex_signal(shape, rng: np.random.Generator) -> np.ndarray:
+    return rng.random(shape) + 1j * rng.random(shape)
+
+
+def _ones_signal(shape, rng: np.random.Generator) -> np.ndarray:
+    return np.ones(shape, dtype=complex)
+
+
+def _impulse_signal(n: int, rng: np.random.Generator) -> np.ndarray:
+    x = np.zeros(n, dtype=complex)
+    x[rng.integers(n)] = 1
+    return x
+
+
+def _chirp_signal(n: int, rng: np.random.Generator) -> np.ndarray:
+    # Linear chirp sweeping every frequency bin once, with a random start phase
+    t = np.arange(n)
+    return np.exp(1j * (np.pi * t * t / n + rng.uniform(0, 2 * np.pi)))
+
+
+def _noise_signal(shape, rng: np.random.Generator) -> np.ndarray:
+    # Complex white Gaussian noise
+    return rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+
+
+# Signal kinds available to the on-disk corpus (see utils.corpus)
+signal_builders = {
+    "real": _real_signal,
+    "complex": _complex_signal,
+    "impulse": _impulse_signal,
+    "chirp": _chirp_signal,
+    "noise": _noise_signal,
+}
+
+
 _simple_test_cases = [
     np.array([1], dtype=complex),
     np.array([1, 2, 3, 4], dtype=complex),
@@ -13,92 +126,63 @@ def get_simple_test_cases():
     return _simple_test_cases
 
 
-_real_test_cases = None
 def get_real_test_cases():
-    global _real_test_cases
-    if _real_test_cases is None:
-        _real_test_cases = [
-            np.random.rand(2**x) for x in range(0, 20)
-        ]
-    return _real_test_cases
+    return LazyTestCases("real", _real_signal, [2**x for x in range(0, 20)])
 
 
-_complex_test_cases = None
 def get_complex_test_cases():
-    global _complex_test_cases
-    if _complex_test_cases is None:
-        _complex_test_cases = [
-            np.random.rand(2**x) + 1j * np.random.rand(2**x) for x in range(0, 20)
-        ]
-    return _complex_test_cases
+    return LazyTestCases("complex", _complex_signal, [2**x for x in range(0, 20)])
+
+
+def get_non_power_of_two_test_cases():
+    # Typical frame sizes (1000 samples, 3600 = 1 h of seconds, 44100 = 1 s of CD audio, ...)
+    return LazyTestCases("non_power_of_two", _complex_signal, [3, 6, 12, 100, 360, 1000, 3600, 44100, 48000])
+
+
+def get_prime_size_test_cases():
+    return LazyTestCases("prime_size", _complex_signal, [17, 97, 1009, 7919, 65537])
 
 
-_combined_test_cases = None
 def get_combined_test_cases():
-    global _combined_test_cases
-    if _combined_test_cases is None:
-        _combined_test_cases = get_real_test_cases() + get_complex_test_cases()
-    return _combined_test_cases
+    return get_real_test_cases() + get_complex_test_cases() + get_non_power_of_two_test_cases() + get_prime_size_test_cases()
 
 
-_mid_size_test_cases = None
 def get_mid_size_test_cases():
-    global _mid_size_test_cases
-    if _mid_size_test_cases is None:
-        _mid_size_test_cases = [
-            np.random.rand(2**x) + 1j * np.random.rand(2**x) for x in range(7, 12)
-        ]
-    return _mid_size_test_cases
+    return LazyTestCases("mid_size", _complex_signal, [2**x for x in range(7, 12)])
 
 
-_large_test_cases = None
 def get_large_test_cases():
-    global _large_test_cases
-    if _large_test_cases is None:
-        _large_test_cases = [
-            np.random.rand(2**x) + 1j * np.random.rand(2**x) for x in range(10, 20)
-        ]
-    return _large_test_cases
+    return LazyTestCases("large", _complex_signal, [2**x for x in range(10, 20)])
 
 
-_large_test_cases_extended = None
 def get_large_test_cases_extended():
-    global _large_test_cases_extended
-    if _large_test_cases_extended is None:
-        _large_test_cases_extended = [
-            np.random.rand(2**x) + 1j * np.random.rand(2**x) for x in range(1, 20)
-        ]
-    return _large_test_cases_extended
+    return LazyTestCases("large_extended", _complex_signal, [2**x for x in range(1, 20)])
 
 
-_large_test_cases_extended_base4 = None
 def get_large_power_of_four_test_cases():
-    global _large_test_cases_extended_base4
-    if _large_test_cases_extended_base4 is None:
-        _large_test_cases_extended_base4 = [
-            np.random.rand(4**x) + 1j * np.random.rand(4**x) for x in range(1, 10)
-        ]
-    return _large_test_cases_extended_base4
+    return LazyTestCases("large_base4", _complex_signal, [4**x for x in range(1, 10)])
 
 
-_massive_test_cases = None
 def get_massive_test_cases():
-    global _massive_test_cases
-    if _massive_test_cases is None:
-        _massive_test_cases = [
-            np.random.rand(2**x) + 1j * np.random.rand(2**x) for x in range(1, 28)
-        ]
-    return _massive_test_cases
+    return LazyTestCases("massive", _complex_signal, [2**x for x in range(1, 28)])
+
+
+def get_parallel_test_cases():
+    return LazyTestCases("parallel", _complex_signal, [2**x for x in range(18, 28)])
+
+
+def get_arbitrary_size_test_cases():
+    # Non-power-of-two and prime sizes next to their power-of-two neighbours, to expose the speed cliff
+    sizes = [1000, 1009, 1024, 3600, 4096, 4099, 44100, 48000, 65536, 65537, 1000000, 1048576, 1048573]
+    return LazyTestCases("arbitrary_size", _complex_signal, sizes)
 
 
-_large_npy_one_case = None
 def get_large_npy_one_case():
-    global _large_npy_one_case
-    if _large_npy_one_case is None:
-        _large_npy_one_case = [
-            np.array([1]*(2**x), dtype=complex) for x in range(25, 28)
-        ]
-    return _large_npy_one_case
+    return LazyTestCases("large_ones", _ones_signal, [2**x for x in range(25, 28)])
+
+
+def get_batch_test_cases():
+    return LazyTestCases("batch", _complex_signal, [(2048, 2**x) for x in range(4, 13)])
 
 
 def print_test_case(test_case: list[np.ndarray]):
@@ -108,4 +192,4 @@ def print_test_case(test_case: list[np.ndarray]):
 
 if __name__ == "__main__":
     print_test_case(get_simple_test_cases())
-    print([x.shape for x in get_large_test_cases()])
+    print(get_large_test_cases().specs)